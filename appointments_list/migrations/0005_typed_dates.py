@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments_list', '0004_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='appointment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+    ]
@@ -44,8 +44,56 @@ class Appointment(models.Model):
     live_consult = models.CharField(max_length=5, choices=CONSULT_CHOICES, default="No")
     address = models.TextField(blank=True, null=True)
     message = models.TextField(blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="appointment_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="appointment_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="appointment_doctor_idx",
+            ),
+            models.Index(
+                models.F("payment_mode"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="appointment_paymode_idx",
+            ),
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="appointment_patient_idx",
+            ),
+            models.Index(
+                models.F("appointment_date").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="appointment_appt_date_idx",
+            ),
+            # A doctor's schedule (`?doctor=` with `?appointment_date_*` or `?ordering=appointment_date`)
+            models.Index(
+                models.F("doctor"),
+                models.F("appointment_date").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="appointment_doctor_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
\ No newline at end of file
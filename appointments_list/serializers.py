@@ -1,8 +1,9 @@
 from .models import Appointment 
 from rest_framework import serializers
+from clients.sparse_fields import SparseFieldsetMixin
 
 
-class AppointmentSerializer(serializers.ModelSerializer):
+class AppointmentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Appointment
         fields = "__all__"
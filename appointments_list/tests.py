@@ -1,3 +1,17 @@
-from django.test import TestCase
+from clients.testing import TenantAPITestCase
+from patients.models import Patient
+from staff_management.models import Employee
 
-# Create your tests here.
+from .models import Appointment
+
+ROWS = 12
+
+
+class AppointmentListQueryCountTests(TenantAPITestCase):
+    def test_appointment_list(self):
+        doctor = Employee.objects.create(name="Doctor", user=self.admin)
+        patient = Patient.objects.create(tenant=self.tenant, user=self.admin, doctor=doctor)
+        Appointment.objects.bulk_create(
+            Appointment(tenant=self.tenant, user=self.admin, patient=patient, doctor=doctor) for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/appointments/appointment")
@@ -7,25 +7,30 @@ from .serializers import *
 from .models import Appointment
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class AppointmentListView(APIView):
+class AppointmentListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Appointment
+    list_filters = (
+        DateRangeFilter("created_at"),
+        DateRangeFilter("appointment_date"),
+        ExactFilter("doctor"),
+        ExactFilter("payment_mode"),
+        ExactFilter("patient"),
+    )
+    list_sort_fields = ("created_at", "appointment_date")
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all appointments for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter appointments with the specific patient ID
-            appointments = Appointment.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all appointments if no 'patient' parameter is provided
-            appointments = Appointment.objects.filter(tenant=request.tenant)
+        appointments = Appointment.objects.filter(tenant=request.tenant)
         
-        serializer = AppointmentSerializer(appointments, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, appointments, AppointmentSerializer)
 
     # POST: Add a new appointment
     def post(self, request):
@@ -40,13 +45,13 @@ class AppointmentListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class AppointmentManagementView(APIView):
+class AppointmentManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, appointment_id):
         try:
             appointment = Appointment.objects.get(id=appointment_id, tenant=request.tenant)
-            serializer = AppointmentSerializer(appointment)
+            serializer = AppointmentSerializer(appointment, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except Appointment.DoesNotExist:
             return Response({"msg": "Appointment not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -81,12 +86,17 @@ class AppointmentManagementView(APIView):
 
    
     def get(self, request, appointment_id):
+        # Tenant admin can access all appointments, while users can only access their own appointments
+        appointments = Appointment.objects.filter(id=appointment_id)
+        if not request.user.is_tenant_admin:
+            appointments = appointments.filter(user=request.user)
+
+        not_modified = self.not_modified(request, appointments)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all appointments, while users can only access their own appointments
-            if request.user.is_tenant_admin:
-                appointment = Appointment.objects.get(id=appointment_id)
-            else:
-                appointment = Appointment.objects.get(id=appointment_id, user=request.user)
+            appointment = appointments.get()
         except Appointment.DoesNotExist as e:
             logger.critical(f"Error fetching appointment: {e}")
             return Response(
@@ -94,7 +104,7 @@ class AppointmentManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = AppointmentSerializer(appointment)
+        serializer = AppointmentSerializer(appointment, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific appointment details
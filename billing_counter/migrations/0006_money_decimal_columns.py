@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing_counter', '0005_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='billing',
+            name='amount_decimal',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='billing',
+            name='amount_due_decimal',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True),
+        ),
+    ]
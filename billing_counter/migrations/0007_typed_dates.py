@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing_counter', '0006_money_decimal_columns'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='billing',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='billing',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+    ]
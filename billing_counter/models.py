@@ -2,9 +2,10 @@ from django.db import models
 from users.models import CustomUser, Tenant
 from patients.models import Patient
 from staff_management.models import Employee
+from clients.money import MoneyColumnsMixin
 
 
-class Billing(models.Model):
+class Billing(MoneyColumnsMixin, models.Model):
     
     BILL_CHOICES = [
         ("Consultation", "Consultation"),
@@ -35,8 +36,53 @@ class Billing(models.Model):
     amount_due = models.CharField(max_length=50, blank=True, null=True)
     payment_mode = models.CharField(max_length=50, choices=PAYMENT_CHOICES, default="Cash")
     billing_address = models.TextField(blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    # Numeric shadows of the amounts above (clients.money)
+    amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    amount_due_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="billing_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="billing_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="billing_doctor_idx",
+            ),
+            models.Index(
+                models.F("payment_mode"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="billing_paymode_idx",
+            ),
+            models.Index(
+                models.F("bill_type"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="billing_bill_type_idx",
+            ),
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="billing_patient_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
\ No newline at end of file
@@ -1,8 +1,9 @@
 from .models import Billing 
 from rest_framework import serializers
+from clients.sparse_fields import SparseFieldsetMixin
 
 
-class BillingSerializer(serializers.ModelSerializer):
+class BillingSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Billing
         fields = "__all__"
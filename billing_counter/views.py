@@ -7,25 +7,30 @@ from .serializers import *
 from .models import Billing
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class BillingListView(APIView):
+class BillingListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Billing
+    list_filters = (
+        DateRangeFilter("created_at"),
+        ExactFilter("doctor"),
+        ExactFilter("payment_mode"),
+        ExactFilter("bill_type"),
+        ExactFilter("patient"),
+    )
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all billings for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter billings with the specific patient ID
-            billings = Billing.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all billings if no 'patient' parameter is provided
-            billings = Billing.objects.filter(tenant=request.tenant)
+        billings = Billing.objects.filter(tenant=request.tenant)
         
-        serializer = BillingSerializer(billings, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, billings, BillingSerializer)
 
     # POST: Add a new billing
     def post(self, request):
@@ -40,13 +45,13 @@ class BillingListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class BillingManagementView(APIView):
+class BillingManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, bill_id):
         try:
             billing = Billing.objects.get(id=bill_id, tenant=request.tenant)
-            serializer = BillingSerializer(billing)
+            serializer = BillingSerializer(billing, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except Billing.DoesNotExist:
             return Response({"msg": "Billing not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -81,12 +86,17 @@ class BillingManagementView(APIView):
 
    
     def get(self, request, bill_id):
+        # Tenant admin can access all billings, while users can only access their own billings
+        billings = Billing.objects.filter(id=bill_id)
+        if not request.user.is_tenant_admin:
+            billings = billings.filter(user=request.user)
+
+        not_modified = self.not_modified(request, billings)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all billings, while users can only access their own billings
-            if request.user.is_tenant_admin:
-                billing = Billing.objects.get(id=bill_id)
-            else:
-                billing = Billing.objects.get(id=bill_id, user=request.user)
+            billing = billings.get()
         except Billing.DoesNotExist as e:
             logger.critical(f"Error fetching billing: {e}")
             return Response(
@@ -94,7 +104,7 @@ class BillingManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = BillingSerializer(billing)
+        serializer = BillingSerializer(billing, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific billing details
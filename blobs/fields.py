@@ -0,0 +1,108 @@
+"""
+This module defines the serializer field for images kept in the blob store.
+
+Classes:
+1. `BlobField`:
+    - Inherits from `Field` provided by `rest_framework`.
+    - Backs one API field (e.g. `image`) with two model fields: the blob foreign key (e.g. `image_blob`)
+      and the legacy base64 column (e.g. `image`) that `migrate_blobs` empties over time.
+    - Writing accepts base64 or a `data:` URI of an image or PDF (as the API always did). Validation only decodes
+      the upload and checks its type (`blobs.storage.ALLOWED_CONTENT_TYPES`); the content is stored by
+      `BlobUploadMixin` when the serializer saves, so a request that fails validation stores nothing.
+      Saving sets the foreign key and clears the legacy column, so new uploads never land in the table again.
+    - Reading returns the download URL of the blob, or the legacy base64 value for rows not migrated yet.
+    - `columns` lists both model fields, so `clients.sparse_fields` can load or defer them.
+
+2. `BlobUploadMixin`:
+    - Mixin for the model serializers with `BlobField`s: `create` and `update` store the validated uploads in the
+      blob store before saving the instance.
+    - Also makes the blob foreign keys read-only, so they cannot be pointed at another blob (e.g. with
+      `fields = "__all__"`).
+
+    Usage:
+    ```
+    class PatientSerializer(BlobUploadMixin, serializers.ModelSerializer):
+        image = BlobField(legacy_field="image", blob_field="image_blob", required=False, allow_null=True)
+    ```
+
+Dependencies:
+- `serializers` from `rest_framework` for the field base class.
+- `decode_base64` and `store_blob` from `blobs.storage` to store uploads.
+- `reverse` from `django.urls` for the download URLs.
+"""
+
+from django.urls import reverse
+from rest_framework import serializers
+
+from .storage import UnsupportedContentType, decode_base64, store_blob
+
+
+class BlobUpload:
+    # A validated upload, stored by `BlobUploadMixin` when the serializer saves.
+    __slots__ = ("content",)
+
+    def __init__(self, content):
+        self.content = content
+
+
+class BlobField(serializers.Field):
+    default_error_messages = {
+        "invalid": "Expected base64 encoded content: {error}",
+        "unsupported": "Unsupported file type {content_type}, upload an image (PNG, JPEG, GIF, WebP) or a PDF.",
+    }
+
+    def __init__(self, legacy_field, blob_field, **kwargs):
+        self.legacy_field = legacy_field
+        self.blob_field = blob_field
+        self.columns = (legacy_field, blob_field)
+        kwargs["source"] = "*"
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        sha256 = getattr(instance, f"{self.blob_field}_id")
+        if sha256 is None:
+            return getattr(instance, self.legacy_field)
+
+        url = reverse("blob-download", args=[sha256])
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
+
+    def to_internal_value(self, data):
+        if data in ("", None):
+            return {self.blob_field: None, self.legacy_field: None}
+        if not isinstance(data, str):
+            self.fail("invalid", error="not a string")
+        try:
+            content, _ = decode_base64(data)
+        except UnsupportedContentType as exc:
+            self.fail("unsupported", content_type=exc.content_type)
+        except ValueError as exc:
+            self.fail("invalid", error=exc)
+        return {self.blob_field: BlobUpload(content), self.legacy_field: None}
+
+    def validate_empty_values(self, data):
+        # `None` clears the image; it still has to reach `to_internal_value` to empty both columns.
+        if data is None and self.allow_null and not self.read_only:
+            return False, data
+        return super().validate_empty_values(data)
+
+
+class BlobUploadMixin:
+    def get_fields(self):
+        fields = super().get_fields()
+        for field in list(fields.values()):
+            if isinstance(field, BlobField) and field.blob_field in fields:
+                fields[field.blob_field] = serializers.PrimaryKeyRelatedField(read_only=True)
+        return fields
+
+    def store_uploads(self, validated_data):
+        for name, value in validated_data.items():
+            if isinstance(value, BlobUpload):
+                validated_data[name] = store_blob(value.content)
+        return validated_data
+
+    def create(self, validated_data):
+        return super().create(self.store_uploads(validated_data))
+
+    def update(self, instance, validated_data):
+        return super().update(instance, self.store_uploads(validated_data))
@@ -0,0 +1,89 @@
+"""
+Management command to move the legacy base64 image columns into the blob store, without downtime.
+
+Usage:
+    python manage.py migrate_blobs [--schema <schema_name>] [--batch-size 100] [--sleep 0.1] [--dry-run]
+
+For every tenant schema (or `--schema`) and every model field pointing at `blobs.Blob` (e.g. `Patient.image_blob`),
+the rows whose legacy column (e.g. `Patient.image`) still holds base64 are read in primary key batches. Each image is
+stored in the blob store and the row is switched over with a single-row `UPDATE ... WHERE <legacy> = <value>`,
+so rows changed by the API in the meantime are skipped instead of overwritten, and no lock is held for long
+(see `clients.management.base.TenantBatchCommand`).
+The API keeps working throughout: `blobs.fields.BlobField` serves the legacy value until a row is migrated, and
+new uploads go to the blob store directly. The command can be stopped and re-run at any time.
+Values that are not valid base64, or not an image or PDF (`blobs.storage.ALLOWED_CONTENT_TYPES`), are reported and
+left in place.
+"""
+
+import logging
+
+from django.apps import apps
+from django.db.models import Q
+
+from blobs.models import Blob
+from blobs.storage import decode_base64, store_blob
+from clients.management.base import TenantBatchCommand
+
+logger = logging.getLogger(__name__)
+
+
+def blob_columns():
+    # `(model, legacy_field, blob_field)` for every `<legacy>_blob` foreign key to `Blob` of the tenant apps.
+    columns = []
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if field.is_relation and field.related_model is Blob and field.name.endswith("_blob"):
+                columns.append((model, field.name[: -len("_blob")], field.name))
+    return columns
+
+
+class Command(TenantBatchCommand):
+    help = "Move base64 images from the model columns into the blob store, batch by batch."
+    batch_size = 100
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--dry-run", action="store_true", help="Only count the rows left to migrate.")
+
+    def handle_schema(self, schema_name, options):
+        for model, legacy_field, blob_field in blob_columns():
+            self.migrate_column(schema_name, model, legacy_field, blob_field, options)
+
+    def pending(self, model, legacy_field, blob_field):
+        return (
+            model._base_manager.filter(**{f"{blob_field}__isnull": True})
+            .exclude(Q(**{f"{legacy_field}__isnull": True}) | Q(**{legacy_field: ""}))
+        )
+
+    def migrate_column(self, schema_name, model, legacy_field, blob_field, options):
+        label = f"{schema_name}: {model._meta.label}.{legacy_field}"
+        pending = self.pending(model, legacy_field, blob_field)
+        if options["dry_run"]:
+            self.stdout.write(f"{label}: {pending.count()} rows to migrate")
+            return
+
+        counts = {"migrated": 0, "skipped": 0, "invalid": 0}
+
+        def process(rows):
+            migrated = counts["migrated"]
+            for pk, value in rows:
+                try:
+                    content, _ = decode_base64(value)
+                except ValueError as exc:
+                    logger.warning(f"{label}: row {pk} is not a valid image: {exc}")
+                    counts["invalid"] += 1
+                    continue
+
+                blob = store_blob(content)
+                updated = model._base_manager.filter(
+                    pk=pk, **{legacy_field: value, f"{blob_field}__isnull": True}
+                ).update(**{blob_field: blob, legacy_field: None})
+                counts["migrated" if updated else "skipped"] += 1
+            return counts["migrated"] > migrated
+
+        # No lock: each row is switched over with its own conditional update.
+        self.run_batches(pending, [legacy_field], process, options)
+        self.stdout.write(
+            f"{label}: {counts['migrated']} migrated, {counts['skipped']} changed concurrently, "
+            f"{counts['invalid']} invalid"
+        )
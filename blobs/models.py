@@ -0,0 +1,31 @@
+"""
+This module defines the model of the content-addressed blob store.
+
+Models:
+1. `Blob`:
+    - One stored file (patient photos, identity document scans, medicine images), keyed by the SHA-256 of its content,
+      so uploading the same image twice stores it once.
+    - Fields:
+        - `sha256`: Hex digest of the content, the primary key. The file is stored under `blobs.storage.blob_name(sha256)`.
+        - `size`: Size of the content in bytes.
+        - `content_type`: MIME type served by the download endpoint.
+        - `created_at`: When the blob was first stored.
+
+    - Usage: Models reference blobs with a `ForeignKey(Blob, ...)` next to their legacy base64 column, and serializers
+      expose both through `blobs.fields.BlobField`.
+
+Dependencies:
+- `models` from `django.db` for defining the database model.
+"""
+
+from django.db import models
+
+
+class Blob(models.Model):
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    size = models.PositiveBigIntegerField()
+    content_type = models.CharField(max_length=100, default="application/octet-stream")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256
@@ -0,0 +1,124 @@
+"""
+This module stores and reads the content of `Blob`s.
+
+The files live in the `blobs` storage of the `STORAGES` setting (a `FileSystemStorage` under `BLOB_ROOT` by default),
+so the backend can be swapped for any Django storage (e.g. S3 through `django-storages`) without code changes.
+Files are named after the SHA-256 of their content and shared by all tenants; each tenant schema keeps its own
+`Blob` rows, which is what the download endpoint checks.
+
+Functions:
+- `blob_storage()`:
+    - Returns the configured storage backend.
+
+- `blob_name(sha256)`:
+    - Returns the storage name of a blob, `<2 hex>/<2 hex>/<sha256>`, so no directory grows too large.
+
+- `decode_base64(value)`:
+    - Decodes a base64 string or `data:<type>;base64,...` URI into `(content, content_type)`.
+    - The content type is sniffed from the leading bytes of the content; the type declared in a data URI is ignored,
+      so a client cannot label an HTML page as an image.
+    - Raises `ValueError` when the value is not valid base64, and `UnsupportedContentType` (a `ValueError`) when the
+      content is not one of `ALLOWED_CONTENT_TYPES`.
+
+- `store_blob(content)`:
+    - Stores the content unless a blob with the same hash exists, and returns its `Blob`.
+    - Raises `UnsupportedContentType` for content outside `ALLOWED_CONTENT_TYPES`: the download endpoint serves
+      blobs from the API's origin, so only images and PDFs are stored.
+
+Dependencies:
+- `storages` and `ContentFile` from `django.core.files` for the pluggable storage backend.
+- `Blob` from `blobs.models` for the blob metadata.
+"""
+
+import base64
+import binascii
+import hashlib
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+
+from .models import Blob
+
+
+BLOB_STORAGE_ALIAS = "blobs"
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# The images browsers render inline (no SVG, which can carry scripts), and PDFs.
+IMAGE_CONTENT_TYPES = ("image/png", "image/jpeg", "image/gif", "image/webp")
+ALLOWED_CONTENT_TYPES = (*IMAGE_CONTENT_TYPES, "application/pdf")
+
+# Leading bytes of the allowed formats.
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+)
+
+
+class UnsupportedContentType(ValueError):
+    def __init__(self, content_type):
+        self.content_type = content_type
+        allowed = ", ".join(ALLOWED_CONTENT_TYPES)
+        super().__init__(f"Unsupported content type {content_type}, expected one of {allowed}")
+
+
+def blob_storage():
+    return storages[BLOB_STORAGE_ALIAS]
+
+
+def blob_name(sha256):
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def _sniff_content_type(content):
+    if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, content_type in _SIGNATURES:
+        if content.startswith(signature):
+            return content_type
+    return DEFAULT_CONTENT_TYPE
+
+
+def _checked_content_type(content):
+    content_type = _sniff_content_type(content)
+    if content_type not in ALLOWED_CONTENT_TYPES:
+        raise UnsupportedContentType(content_type)
+    return content_type
+
+
+def decode_base64(value):
+    if value.startswith("data:"):
+        header, _, value = value.partition(",")
+        _, _, encoding = header[len("data:"):].partition(";")
+        if encoding != "base64":
+            raise ValueError("Only base64 data URIs are supported")
+
+    try:
+        content = base64.b64decode("".join(value.split()), validate=True)
+    except binascii.Error as exc:
+        raise ValueError(f"Invalid base64 data: {exc}")
+    return content, _checked_content_type(content)
+
+
+def store_blob(content):
+    content_type = _checked_content_type(content)
+    sha256 = hashlib.sha256(content).hexdigest()
+    blob = Blob.objects.filter(pk=sha256).first()
+    if blob is not None:
+        return blob
+
+    storage = blob_storage()
+    name = blob_name(sha256)
+    if not storage.exists(name):
+        saved_name = storage.save(name, ContentFile(content))
+        if saved_name != name:
+            # Another request stored the same content meanwhile; keep the first copy.
+            storage.delete(saved_name)
+
+    blob, _ = Blob.objects.get_or_create(
+        pk=sha256,
+        defaults={"size": len(content), "content_type": content_type},
+    )
+    return blob
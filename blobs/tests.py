@@ -0,0 +1,68 @@
+import base64
+import hashlib
+
+from django.core.files.base import ContentFile
+
+from django.conf import settings
+from django.test import override_settings
+
+from clients.testing import TenantAPITestCase
+from patients.models import Patient
+
+from .models import Blob
+from .storage import blob_name, blob_storage, store_blob
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+PDF = b"%PDF-1.7\n" + b"\x00" * 32
+HTML = b"<html><script>alert(document.cookie)</script></html>"
+
+
+def data_uri(content, content_type="image/png"):
+    return f"data:{content_type};base64,{base64.b64encode(content).decode()}"
+
+
+@override_settings(
+    STORAGES={**settings.STORAGES, "blobs": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+)
+class BlobUploadTests(TenantAPITestCase):
+    def test_upload_outside_the_allowlist_is_rejected(self):
+        response = self.client.post(
+            "/api/patients/patient", {"name": "Patient", "image": data_uri(HTML)},
+            content_type="application/json", **self.auth_headers(self.admin),
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Blob.objects.exists())
+
+    def test_nothing_is_stored_when_another_field_is_invalid(self):
+        response = self.client.post(
+            "/api/patients/patient", {"name": "Patient", "email": "not an email", "image": data_uri(PNG)},
+            content_type="application/json", **self.auth_headers(self.admin),
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Blob.objects.exists())
+
+    def test_upload_is_stored_on_save(self):
+        response = self.client.post(
+            "/api/patients/patient", {"name": "Patient", "image": data_uri(PNG)},
+            content_type="application/json", **self.auth_headers(self.admin),
+        )
+        self.assertEqual(response.status_code, 201)
+        blob = Patient.objects.get().image_blob
+        self.assertEqual(blob.content_type, "image/png")
+
+    def test_images_are_served_inline(self):
+        blob = store_blob(PNG)
+        response = self.client.get(f"/api/blobs/{blob.sha256}", **self.auth_headers(self.member))
+        self.assertEqual(response["X-Content-Type-Options"], "nosniff")
+        self.assertTrue(response["Content-Disposition"].startswith("inline"))
+
+    def test_other_types_are_downloaded_as_attachments(self):
+        pdf = store_blob(PDF)
+        # Stored before uploads were restricted.
+        legacy = Blob.objects.create(sha256=hashlib.sha256(HTML).hexdigest(), size=len(HTML), content_type="text/html")
+        blob_storage().save(blob_name(legacy.sha256), ContentFile(HTML))
+        for blob in (pdf, legacy):
+            with self.subTest(content_type=blob.content_type):
+                response = self.client.get(f"/api/blobs/{blob.sha256}", **self.auth_headers(self.member))
+                self.assertEqual(response["X-Content-Type-Options"], "nosniff")
+                self.assertTrue(response["Content-Disposition"].startswith("attachment"))
@@ -0,0 +1,7 @@
+from django.urls import re_path
+from .views import BlobDownloadView
+
+
+urlpatterns = [
+    re_path(r"^(?P<sha256>[0-9a-f]{64})$", BlobDownloadView.as_view(), name="blob-download"),
+]
@@ -0,0 +1,134 @@
+"""
+This module defines the download endpoint of the blob store.
+
+Views:
+1. `BlobDownloadView(APIView)`:
+    - Method: `GET` (and `HEAD`):
+        - Serves the content of a `Blob` of the current tenant, identified by its SHA-256.
+        - Supports single `Range: bytes=...` requests (`206 Partial Content`, `416` when unsatisfiable) and `If-Range`.
+        - The content never changes for a given hash, so responses carry a strong `ETag` and are cacheable for a year;
+          `If-None-Match` returns `304 Not Modified`.
+        - Returns `404` when the tenant has no such blob.
+        - Sends `X-Content-Type-Options: nosniff`, and only the images of `blobs.storage.IMAGE_CONTENT_TYPES` are
+          served `inline`; everything else (PDFs, blobs stored before uploads were restricted) is an `attachment`,
+          so the browser never renders it as a page of the API's origin.
+
+Dependencies:
+- `FileResponse` and `StreamingHttpResponse` from `django.http` for the file responses.
+- `parse_etags` from `django.utils.http` for the conditional request headers.
+- `Blob` and `blobs.storage` for the blob metadata and content.
+"""
+
+import re
+
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.http import content_disposition_header, parse_etags
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.mixins import ReadOnlyFastPathMixin
+from .models import Blob
+from .storage import IMAGE_CONTENT_TYPES, blob_name, blob_storage
+
+
+CHUNK_SIZE = 64 * 1024
+CACHE_CONTROL = "private, max-age=31536000, immutable"
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    # Returns the inclusive `(start, end)` of a single byte range, or `None` to serve the whole content.
+    match = _RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise RangeNotSatisfiable
+    return start, end
+
+
+def _read_range(file, start, length):
+    try:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+class BlobDownloadView(ReadOnlyFastPathMixin, APIView):
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+
+    def get(self, request, sha256):
+        try:
+            blob = Blob.objects.get(pk=sha256)
+        except Blob.DoesNotExist:
+            return Response({"msg": "Blob not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        etag = f'"{blob.sha256}"'
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+            return self._with_cache_headers(response, etag)
+
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if "Range" in request.headers and (if_range is None or if_range == etag):
+            try:
+                byte_range = parse_range(request.headers["Range"], blob.size)
+            except RangeNotSatisfiable:
+                response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+                response["Content-Range"] = f"bytes */{blob.size}"
+                return response
+
+        try:
+            file = blob_storage().open(blob_name(blob.sha256), "rb")
+        except FileNotFoundError:
+            return Response({"msg": "Blob not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        if byte_range is None:
+            response = FileResponse(file, content_type=blob.content_type)
+            response["Content-Length"] = blob.size
+        else:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                _read_range(file, start, end - start + 1),
+                status=status.HTTP_206_PARTIAL_CONTENT,
+                content_type=blob.content_type,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{blob.size}"
+            response["Content-Length"] = end - start + 1
+
+        response["Accept-Ranges"] = "bytes"
+        response["X-Content-Type-Options"] = "nosniff"
+        response["Content-Disposition"] = content_disposition_header(
+            blob.content_type not in IMAGE_CONTENT_TYPES, blob.sha256
+        )
+        return self._with_cache_headers(response, etag)
+
+    def _with_cache_headers(self, response, etag):
+        response["ETag"] = etag
+        response["Cache-Control"] = CACHE_CONTROL
+        return response
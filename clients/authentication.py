@@ -0,0 +1,140 @@
+"""
+This module defines the JWT authentication used by the tenant APIs.
+
+Classes:
+1. `TenantJWTAuthentication`:
+    - Inherits from `JWTAuthentication` provided by `rest_framework_simplejwt`.
+    - Tokens issued by `clients.helpers.get_tokens_for_user` for a tenant carry the tenant schema,
+      the user's profile and the user's membership in that tenant as signed claims.
+    - For such tokens:
+        - Rejects the token if it was issued for a different tenant than `request.tenant`.
+        - Builds the user from the claims with `get_token_user`, without querying `users_customuser`.
+        - Pre-fills the request's tenant membership, so `clients.custom_permissions` needs no query either.
+    - Tokens without a tenant claim (e.g. global superadmin tokens) fall back to the database lookup of the parent class.
+    - Every token is checked against the revocation list first.
+
+Functions:
+- `get_token_user(validated_token)`:
+    - Returns a `CustomUser` instance populated from the token claims.
+    - The instance behaves like a user loaded from the database: it can be assigned to foreign keys and used in filters.
+      Fields that are not carried in the token are deferred and loaded on first access.
+
+- `revoke_user_tokens(user_id)`:
+    - Adds the user to the revocation list. Tokens issued before this call are rejected until they expire.
+    - Called from `clients.signals` when a user is deactivated, deleted, loses their profile or changes admin status.
+
+- `is_token_revoked(validated_token)`:
+    - Returns `True` when the token was issued before the user's last revocation. Both times have sub-second
+      precision, so a token issued right after a revocation (e.g. a login after a password change) is accepted.
+    - The revocation list lives in the default cache, which must be shared by all workers (e.g. Redis,
+      `REDIS_HOST`); the `clients.E003` system check fails otherwise.
+
+- `ais_token_revoked(validated_token)`:
+    - The same for async code (websocket middleware), reading the cache with `cache.aget`.
+
+Dependencies:
+- `JWTAuthentication`, `AuthenticationFailed` and `api_settings` from `rest_framework_simplejwt`.
+- `cache` from `django.core.cache` for the revocation list.
+- `TenantMembership` from `clients.membership` for the pre-filled membership.
+- `CustomUser` model for building the stateless user.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from clients.membership import TenantMembership
+from users.models import CustomUser
+
+
+REVOCATION_TTL = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+
+# CustomUser attribute -> token claim
+TOKEN_USER_CLAIMS = {
+    "email": "email",
+    "username": "username",
+    "is_tenant_admin": "is_tenant_admin",
+    "is_staff": "is_staff",
+    "is_superuser": "is_superuser",
+    "tenant_id": "user_tenant_id",
+}
+
+
+def _revocation_key(user_id):
+    return f"jwt-revoked:{user_id}"
+
+
+def revoke_user_tokens(user_id):
+    cache.set(_revocation_key(user_id), time.time(), REVOCATION_TTL)
+
+
+def _issued_before(validated_token, revoked_at):
+    if revoked_at is None:
+        return False
+
+    # `auth_time` (sub-second) survives token refreshes, `iat` does not. A token without `auth_time` only has
+    # the second it was issued in, so one issued in the second of the revocation stays revoked.
+    auth_time = validated_token.get("auth_time")
+    if auth_time is not None:
+        return auth_time < revoked_at
+    issued_at = validated_token.get("iat")
+    return issued_at is None or issued_at <= revoked_at
+
+
+def is_token_revoked(validated_token):
+    revoked_at = cache.get(_revocation_key(validated_token.get(api_settings.USER_ID_CLAIM)))
+    return _issued_before(validated_token, revoked_at)
+
+
+async def ais_token_revoked(validated_token):
+    revoked_at = await cache.aget(_revocation_key(validated_token.get(api_settings.USER_ID_CLAIM)))
+    return _issued_before(validated_token, revoked_at)
+
+
+def get_token_user(validated_token):
+    field_names = ["id", "is_active"]
+    values = [validated_token[api_settings.USER_ID_CLAIM], True]
+    for attname, claim in TOKEN_USER_CLAIMS.items():
+        field_names.append(attname)
+        values.append(validated_token.get(claim))
+
+    return CustomUser.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+
+class TenantJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if is_token_revoked(validated_token):
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+        tenant = getattr(request, "tenant", None)
+        schema_name = validated_token.get("tenant")
+        if schema_name is None or tenant is None:
+            return self.get_user(validated_token), validated_token
+
+        if schema_name != tenant.schema_name:
+            raise AuthenticationFailed(
+                _("Token is not valid for this tenant"), code="wrong_tenant"
+            )
+
+        request._tenant_membership = TenantMembership(
+            member=bool(validated_token.get("tenant_member")),
+            admin=bool(validated_token.get("tenant_admin")),
+        )
+        return get_token_user(validated_token), validated_token
@@ -0,0 +1,272 @@
+"""
+This module defines the bulk write endpoints of the tenant apps: many rows created, updated or deleted in one
+request, one transaction and a handful of queries, instead of one request per row.
+
+Endpoints (on the view using `BulkWriteMixin`, e.g. `pharmacy-bill/bulk`):
+- `POST`: A JSON list of objects, each validated like the single-row `POST`. Inserted with one `bulk_create`,
+  with the `user` and `tenant` of the request.
+    - `201`: `{"msg": ..., "data": [{"index": 0, "id": 17}, ...]}`.
+- `PATCH`: A JSON list of partial objects, each with the `id` of a row the user may change (see below). Saved with one `bulk_update`
+  of the fields that were sent (plus the `auto_now` fields).
+    - `200`: `{"msg": ..., "data": [{"index": 0, "id": 17}, ...]}`.
+- `DELETE`: `{"ids": [17, 18, ...]}`.
+    - `200`: `{"msg": ..., "data": [{"id": 17, "deleted": true}, {"id": 99, "deleted": false}, ...]}`, ids of rows
+      the user may not delete are reported as not deleted.
+Like the single-row endpoints, tenant admins may change every row of the tenant and other members only their own
+(`user` is the requesting user); a `PATCH` naming another member's row fails as `Not found.`.
+`POST` and `PATCH` are all or nothing: when any item is invalid (or, for `PATCH`, unknown or repeated), nothing
+is written and the response is `400` with `{"error": [{"index": 3, "errors": {...}}, ...]}` for the invalid
+items. A request holds at most `BULK_MAX_ITEMS` items (settings).
+
+Foreign keys of the payload are looked up with one `in_bulk()` query per field, not one query per item.
+`bulk_create` and `bulk_update` do not send `pre_save`/`post_save`, so `pre_bulk_write`/`post_bulk_write` are sent
+instead, once per request.
+They do not call `Model.save()` either; the numeric money columns (`clients.money`) and the typed date columns
+(`clients.dates`) are written here.
+
+Classes:
+1. `BulkWriteMixin`:
+    - Provides `post`, `patch` and `delete` for `bulk_serializer_class` (a `ModelSerializer` without
+      many-to-many fields, usually the `...CreateUpdateSerializer` of the resource).
+    - `get_bulk_queryset(request)`: The rows `PATCH` and `DELETE` may touch: the tenant's rows, and only the
+      user's own ones for members who are not tenant admins.
+
+    Usage:
+    ```
+    class PharmacyBillBulkView(ReadOnlyFastPathMixin, BulkWriteMixin, APIView):
+        permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+        bulk_serializer_class = PharmacyBillCreateUpdateSerializer
+    ```
+
+Signals:
+- `pre_bulk_write`: Sent with the model as `sender`, `instances` (the rows about to be created, or the rows about
+  to be updated, still holding their stored values), `created` and `using`.
+- `post_bulk_write`: Sent with the same arguments once the rows are written.
+
+Dependencies:
+- `transaction` and `router` from `django.db` for the single transaction of a request.
+- `serializers` from `rest_framework` for the validation of the items.
+- `sync_money_columns` from `clients.money` and `sync_date_columns` from `clients.dates` for the dual-written
+  shadow columns.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import router, transaction
+from django.dispatch import Signal
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.response import Response
+
+from .dates import sync_date_columns
+from .money import sync_money_columns
+
+
+pre_bulk_write = Signal()
+post_bulk_write = Signal()
+
+BULK_BATCH_SIZE = 500
+
+
+def _pk(model, value):
+    # The primary key `value` of `model` as stored, `None` when it is missing or not a valid key.
+    if value is None or isinstance(value, (bool, dict, list)):
+        return None
+    try:
+        return model._meta.pk.to_python(value)
+    except DjangoValidationError:
+        return None
+
+
+class _InBulkQuerySet:
+    # Stands in for the queryset of a `PrimaryKeyRelatedField`, answering its `get(pk=...)` calls from
+    # one `in_bulk()` query for all the items.
+    def __init__(self, queryset, values):
+        self.model = queryset.model
+        keys = {_pk(self.model, value) for value in values} - {None}
+        self._objects = queryset.in_bulk(keys) if keys else {}
+
+    def get(self, pk):
+        key = _pk(self.model, pk)
+        if key is None:
+            raise TypeError(pk)
+        try:
+            return self._objects[key]
+        except KeyError:
+            raise self.model.DoesNotExist
+
+
+def _prefetch_relations(child, items):
+    for name, field in child.fields.items():
+        if isinstance(field, PrimaryKeyRelatedField) and not field.read_only and field.pk_field is None:
+            values = [item.get(name) for item in items if isinstance(item, dict)]
+            field.queryset = _InBulkQuerySet(field.get_queryset(), values)
+
+
+class _BulkListSerializer(serializers.ListSerializer):
+    # `instance` maps primary keys to the rows being updated; each item is validated against its row.
+    def to_internal_value(self, data):
+        self.item_instances = []
+        self._seen = set()
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        key = _pk(self.child.Meta.model, data.get("id") if isinstance(data, dict) else None)
+        if key is None:
+            raise ValidationError({"id": ["A valid id is required."]})
+        if key in self._seen:
+            raise ValidationError({"id": ["Duplicate id."]})
+        if key not in self.instance:
+            raise ValidationError({"id": ["Not found."]})
+
+        self._seen.add(key)
+        self.child.instance = self.instance[key]
+        self.child.initial_data = data
+        validated = super().run_child_validation(data)
+        self.item_instances.append(self.instance[key])
+        return validated
+
+
+def _count(model, count):
+    name = model._meta.verbose_name if count == 1 else model._meta.verbose_name_plural
+    return f"{count} {name}"
+
+
+def _error_response(errors):
+    if isinstance(errors, dict):
+        return Response({"error": errors}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(
+        {"error": [{"index": index, "errors": item} for index, item in enumerate(errors) if item]},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+class BulkWriteMixin:
+    bulk_serializer_class = None
+
+    def get_bulk_queryset(self, request):
+        queryset = self.bulk_serializer_class.Meta.model.objects.filter(tenant=request.tenant)
+        if not request.user.is_tenant_admin:
+            queryset = queryset.filter(user=request.user)
+        return queryset
+
+    def get_bulk_serializer(self, request, items, instances=None):
+        partial = instances is not None
+        child = self.bulk_serializer_class(partial=partial, context={"request": request})
+        serializer = _BulkListSerializer(
+            instances,
+            child=child,
+            data=items,
+            partial=partial,
+            allow_empty=False,
+            max_length=getattr(settings, "BULK_MAX_ITEMS", 1000),
+            context={"request": request},
+        )
+        if isinstance(items, list) and len(items) <= serializer.max_length:
+            _prefetch_relations(child, items)
+        return serializer
+
+    def post(self, request):
+        serializer = self.get_bulk_serializer(request, request.data)
+        if not serializer.is_valid():
+            return _error_response(serializer.errors)
+
+        model = self.bulk_serializer_class.Meta.model
+        using = router.db_for_write(model)
+        instances = [
+            model(**{**attrs, "user": request.user, "tenant": request.tenant})
+            for attrs in serializer.validated_data
+        ]
+        sync_money_columns(instances)
+        sync_date_columns(instances)
+        with transaction.atomic(using=using):
+            pre_bulk_write.send(sender=model, instances=instances, created=True, using=using)
+            model.objects.using(using).bulk_create(instances, batch_size=BULK_BATCH_SIZE)
+            post_bulk_write.send(sender=model, instances=instances, created=True, using=using)
+
+        return Response(
+            {
+                "msg": f"{_count(model, len(instances))} added successfully!",
+                "data": [{"index": index, "id": instance.pk} for index, instance in enumerate(instances)],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    def patch(self, request):
+        model = self.bulk_serializer_class.Meta.model
+        using = router.db_for_write(model)
+        items = request.data
+        ids = [item.get("id") for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+        keys = {_pk(model, pk) for pk in ids} - {None}
+
+        with transaction.atomic(using=using):
+            instances = self.get_bulk_queryset(request).using(using).select_for_update().in_bulk(keys)
+            serializer = self.get_bulk_serializer(request, items, instances)
+            if not serializer.is_valid():
+                return _error_response(serializer.errors)
+
+            pre_bulk_write.send(
+                sender=model, instances=serializer.item_instances, created=False, using=using
+            )
+            fields = set()
+            for instance, attrs in zip(serializer.item_instances, serializer.validated_data):
+                for name, value in attrs.items():
+                    setattr(instance, name, value)
+                    fields.add(name)
+            for field in model._meta.concrete_fields:
+                if getattr(field, "auto_now", False):
+                    for instance in serializer.item_instances:
+                        field.pre_save(instance, add=False)
+                    fields.add(field.name)
+            fields.update(sync_money_columns(serializer.item_instances, fields))
+            fields.update(sync_date_columns(serializer.item_instances, fields))
+
+            model.objects.using(using).bulk_update(
+                serializer.item_instances, sorted(fields), batch_size=BULK_BATCH_SIZE
+            )
+            post_bulk_write.send(
+                sender=model, instances=serializer.item_instances, created=False, using=using
+            )
+
+        return Response(
+            {
+                "msg": f"{_count(model, len(serializer.item_instances))} updated successfully!",
+                "data": [
+                    {"index": index, "id": instance.pk}
+                    for index, instance in enumerate(serializer.item_instances)
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def delete(self, request):
+        ids_field = serializers.ListField(
+            child=serializers.IntegerField(),
+            allow_empty=False,
+            max_length=getattr(settings, "BULK_MAX_ITEMS", 1000),
+        )
+        try:
+            data = request.data if isinstance(request.data, dict) else {}
+            ids = ids_field.run_validation(data.get("ids", serializers.empty))
+        except ValidationError as exc:
+            return Response({"error": {"ids": exc.detail}}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = self.bulk_serializer_class.Meta.model
+        using = router.db_for_write(model)
+        with transaction.atomic(using=using):
+            rows = self.get_bulk_queryset(request).using(using).filter(pk__in=ids)
+            found = set(rows.values_list("pk", flat=True))
+            if found:
+                rows.delete()
+
+        return Response(
+            {
+                "msg": f"{_count(model, len(found))} deleted successfully!",
+                "data": [{"id": pk, "deleted": pk in found} for pk in dict.fromkeys(ids)],
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,153 @@
+"""
+This module defines the system checks of the tenant apps, run by `manage.py check` and before `runserver`
+and `migrate`.
+
+Checks:
+- `clients.E001`: A list view (`clients.mixins.TenantListMixin`) filters on a column (`list_filters`) that is not
+  the leading column of any index of its `list_model`, so every filtered request would scan the table.
+- `clients.E002`: The same for the columns clients may sort on (`list_sort_fields`) and the default ordering
+  (`list_ordering`), which keyset pagination reads in index order.
+- `clients.W001`: A list view with filters or sort fields does not declare its `list_model`, so its columns
+  cannot be checked.
+- `clients.E003`: The default cache is local to the process (`LocMemCache`, `DummyCache`). The JWT revocation list
+  (`clients.authentication`) and the version tokens of the conditional GET validators (`clients.conditional`) live
+  in it, so a revocation or a write would only reach the worker that made it, and the others would keep accepting
+  revoked tokens and answering `304` with stale data. Set `REDIS_HOST` to use the shared Redis cache. With `DEBUG`
+  (one development process) it is only a warning.
+
+A column counts as indexed when it is the primary key, `unique`, `db_index` (foreign keys by default), or the first
+column of one of the model's `Meta.indexes`, unique constraints or `unique_together`. Only the list views routed
+in `ROOT_URLCONF` and `PUBLIC_SCHEMA_URLCONF` are checked.
+
+Functions:
+- `check_list_view_indexes(app_configs, **kwargs)`: The index checks.
+- `check_shared_cache(app_configs, **kwargs)`: The cache check.
+Both are registered when `clients.apps.TenantsConfig.ready` imports this module.
+
+Dependencies:
+- `checks` from `django.core` for the messages and the registration.
+- `get_resolver` from `django.urls` to find the routed list views.
+"""
+
+from django.conf import settings
+from django.core import checks
+from django.db import models
+from django.urls import URLResolver, get_resolver
+
+from .mixins import TenantListMixin
+
+
+def _routed_views(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _routed_views(pattern.url_patterns)
+            continue
+        view_class = getattr(pattern.callback, "view_class", None)
+        if isinstance(view_class, type) and issubclass(view_class, TenantListMixin):
+            yield view_class
+
+
+def list_views():
+    urlconfs = {settings.ROOT_URLCONF, getattr(settings, "PUBLIC_SCHEMA_URLCONF", settings.ROOT_URLCONF)}
+    views = []
+    for urlconf in sorted(urlconfs):
+        for view_class in _routed_views(get_resolver(urlconf).url_patterns):
+            if view_class not in views:
+                views.append(view_class)
+    return views
+
+
+def _leading_column(index):
+    # The first column of an index or unique constraint, `None` when it starts with another expression.
+    if getattr(index, "fields", None):
+        return index.fields[0].lstrip("-")
+    expression = index.expressions[0] if getattr(index, "expressions", None) else None
+    while isinstance(expression, models.OrderBy):
+        expression = expression.expression
+    return expression.name if isinstance(expression, models.F) else None
+
+
+def indexed_columns(model):
+    opts = model._meta
+    columns = {field.name for field in opts.concrete_fields if field.primary_key or field.unique or field.db_index}
+    leading = [_leading_column(index) for index in opts.indexes]
+    leading += [
+        _leading_column(constraint)
+        for constraint in opts.constraints
+        if isinstance(constraint, models.UniqueConstraint) and constraint.condition is None
+    ]
+    leading += [fields[0] for fields in opts.unique_together]
+    columns.update(opts.get_field(name).name for name in leading if name is not None)
+    return columns
+
+
+def _view_columns(view_class):
+    # [(check id, kind, field name)] of the columns the view filters or sorts on.
+    columns = [("clients.E001", "filters", list_filter.field) for list_filter in view_class.list_filters]
+    columns += [("clients.E002", "sorts", field) for field in view_class.list_sort_fields]
+    if view_class.list_ordering:
+        columns.append(("clients.E002", "sorts", view_class.list_ordering[0]))
+    return columns
+
+
+@checks.register(checks.Tags.models)
+def check_list_view_indexes(app_configs, **kwargs):
+    errors = []
+    for view_class in list_views():
+        view = f"{view_class.__module__}.{view_class.__qualname__}"
+        model = getattr(view_class, "list_model", None)
+        if model is None:
+            if view_class.list_filters or view_class.list_sort_fields:
+                errors.append(
+                    checks.Warning(
+                        f"{view} declares list filters or sort fields but no list_model.",
+                        hint="Set list_model to the model the view lists, so its indexes can be checked.",
+                        obj=view_class,
+                        id="clients.W001",
+                    )
+                )
+            continue
+        if app_configs is not None and model._meta.app_config not in app_configs:
+            continue
+
+        indexed = indexed_columns(model)
+        reported = set()
+        for check_id, kind, name in _view_columns(view_class):
+            column = model._meta.get_field(name).name
+            if column in indexed or (check_id, column) in reported:
+                continue
+            reported.add((check_id, column))
+            errors.append(
+                checks.Error(
+                    f"{view} {kind} on {model._meta.label}.{column}, which is not the leading column of any index.",
+                    hint=(
+                        f"Add an index on ({column}, created_at DESC NULLS LAST, id DESC) to {model.__name__}.Meta."
+                        "indexes, in a migration using AddIndexConcurrently."
+                    ),
+                    obj=view_class,
+                    id=check_id,
+                )
+            )
+    return errors
+
+
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@checks.register(checks.Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in LOCAL_CACHE_BACKENDS:
+        return []
+    message = checks.Warning if settings.DEBUG else checks.Error
+    return [
+        message(
+            f"The default cache ({backend}) is not shared between workers, so revoked JWTs stay valid and "
+            "conditional GETs keep answering 304 with stale data on the other workers.",
+            hint="Set REDIS_HOST to use the shared Redis cache.",
+            id="clients.E003",
+        )
+    ]
@@ -0,0 +1,214 @@
+"""
+This module compresses API responses with the best content coding the client accepts.
+
+Middleware:
+1. `CompressionMiddleware`:
+    - Inherits from `GZipMiddleware` provided by `django.middleware.gzip`, and adds `br` (when the `Brotli` package
+      is installed), negotiated with `gzip` from the `Accept-Encoding` header, honouring `q` values.
+    - `gzip` bodies are compressed by `GZipMiddleware` itself, with its BREACH mitigation: a random-length file name
+      in the gzip header (up to `max_random_bytes`), so the compressed length does not reveal how well attacker
+      input matched a secret of the page. Streams get the same padding.
+    - Responses carrying credentials (a JWT pair of the login or token refresh endpoints, see `CREDENTIAL_KEYS`)
+      are never compressed, whatever the coding: `br` has no such padding, and they are the secrets BREACH targets.
+    - Compresses JSON, NDJSON and text responses of at least `COMPRESSION_MIN_SIZE` bytes (settings), where the
+      saved bytes outweigh the compression time. Smaller bodies, other content types (e.g. the already compressed
+      images of `blobs`), partial (`206`) and already encoded responses are sent as they are.
+    - Streamed responses (`clients.streaming`) are compressed chunk by chunk and flushed after every chunk, so the
+      client still receives the rows as they are produced.
+    - Strong `ETag`s are made weak, since the compressed bytes differ from the identity representation.
+
+Functions:
+- `negotiate_encoding(accept_encoding)`:
+    - Returns `"br"`, `"gzip"` or `None` for an `Accept-Encoding` header value.
+
+- `get_compressor(encoding, max_random_bytes=0)`:
+    - Returns an object with `compress(chunk)` (returns the compressed bytes available so far, flushed) and
+      `finish()` (returns the remaining bytes).
+
+- `compress(content, encoding)`:
+    - Compresses a whole body as the middleware does.
+
+Dependencies:
+- `GZipMiddleware` from `django.middleware.gzip` and `compress_string` from `django.utils.text` for `gzip`.
+- `zlib` for streamed `gzip`, `brotli` (optional) for `br`.
+- `patch_vary_headers` from `django.utils.cache` for the `Vary` header.
+"""
+
+import secrets
+import string
+import struct
+import zlib
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # `br` is only offered when Brotli is installed
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+GZIP_LEVEL = 6
+# Quality 4-5 is the usual choice for dynamic content: smaller than gzip -6 at a similar speed.
+BROTLI_QUALITY = 4
+# Keys of the response bodies that hand out tokens (`clients.views.UserLoginView`, simplejwt's token views).
+CREDENTIAL_KEYS = frozenset({"access", "refresh", "access_token", "refresh_token"})
+
+
+def _supported_encodings():
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding):
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in _supported_encodings():
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class _GzipCompressor:
+    # Writes the gzip header itself, so it can carry a random file name like `django.utils.text.compress_sequence`.
+    def __init__(self, max_random_bytes=0):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self._crc = 0
+        self._size = 0
+        if max_random_bytes:
+            length = secrets.randbelow(max_random_bytes) + 1
+            filename = "".join(secrets.choice(string.ascii_letters) for _ in range(length))
+            # Magic, deflate, FNAME flag, mtime 0, no extra flags, unknown OS, then the NUL-terminated name.
+            self._header = b"\x1f\x8b\x08\x08\x00\x00\x00\x00\x00\xff" + filename.encode("latin-1") + b"\x00"
+        else:
+            self._header = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+    def _take_header(self):
+        header, self._header = self._header, b""
+        return header
+
+    def compress(self, chunk):
+        self._crc = zlib.crc32(chunk, self._crc)
+        self._size += len(chunk)
+        return self._take_header() + self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        trailer = struct.pack("<II", self._crc, self._size & 0xFFFFFFFF)
+        return self._take_header() + self._compressor.flush() + trailer
+
+
+class _BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, chunk):
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+def get_compressor(encoding, max_random_bytes=0):
+    if encoding == "br":
+        return _BrotliCompressor()
+    return _GzipCompressor(max_random_bytes)
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    return compress_string(content, max_random_bytes=GZipMiddleware.max_random_bytes)
+
+
+def _compress_sequence(sequence, compressor):
+    for chunk in sequence:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _acompress_sequence(sequence, compressor):
+    async for chunk in sequence:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def _is_compressible(response):
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _carries_credentials(response):
+    # DRF responses keep their data; the token endpoints return the pair at the top level or one level down.
+    data = getattr(response, "data", None)
+    if not isinstance(data, dict):
+        return False
+    values = [data, *(value for value in data.values() if isinstance(value, dict))]
+    return any(CREDENTIAL_KEYS.intersection(value) for value in values)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_size = getattr(settings, "COMPRESSION_MIN_SIZE", 1024)
+
+    def process_response(self, request, response):
+        if (
+            response.has_header("Content-Encoding")
+            or response.has_header("Content-Range")
+            or response.status_code == 206
+            or not _is_compressible(response)
+            or _carries_credentials(response)
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        encoding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+        if encoding == "gzip" and not response.streaming:
+            return super().process_response(request, response)
+
+        if response.streaming:
+            compressor = get_compressor(encoding, self.max_random_bytes)
+            if response.is_async:
+                response.streaming_content = _acompress_sequence(response.streaming_content, compressor)
+            else:
+                response.streaming_content = _compress_sequence(response.streaming_content, compressor)
+            del response.headers["Content-Length"]
+        else:
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
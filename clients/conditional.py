@@ -0,0 +1,205 @@
+"""
+This module adds conditional GET support (`ETag`/`Last-Modified`) to the detail and list views of the tenant apps,
+so polling clients get a `304 Not Modified` after one aggregate query, without the rows being loaded or serialized.
+
+Validators:
+- Detail views: the row's primary key and `updated_at`.
+- List views: `count(*)`, `max(updated_at)` and `max(id)` of the filtered queryset.
+- Both also include the model's change version (see below), the request path with its query string and the
+  `Accept` header, so every representation (page, `?fields=`, format) has its own `ETag`.
+- When the view passes its `serializer_class`, the change versions of the models its nested serializers render
+  (e.g. the `Role` of `EmployeeSerializer`, see `clients.eager_loading.get_rendered_models`) are included too, so
+  renaming a role also changes the validators of the employee list.
+
+`updated_at` misses the rows of models without one and writes that bypass `auto_now` (e.g. `QuerySet.update()`).
+Every save or delete of a model in `CONDITIONAL_MODELS` therefore also replaces a per-tenant, per-model version
+token in the cache (`bump_version`, called from `clients.signals`); the time of the last bump is part of
+`Last-Modified`. Bulk `QuerySet.update()` calls do not send signals and must call `bump_version(model)` themselves.
+When the cache is cleared the tokens change, which only costs clients one full response.
+
+The tokens must live in a cache shared by all workers (`REDIS_HOST`): with a per-process cache a write served by
+one worker would leave the tokens of the others unchanged, and they would keep answering `304` with stale data.
+The `clients.E003` system check fails in that case.
+
+A view can only use the mixin for models listed in `CONDITIONAL_MODELS`, the only ones whose saves bump the
+version token; `not_modified` raises `ImproperlyConfigured` for any other model, listed or rendered.
+
+Mixins:
+1. `ConditionalGetMixin`:
+    - Methods:
+        - `not_modified(request, queryset, many=False, serializer_class=None)`:
+            - Computes the validators of the object (`many=False`) or list (`many=True`) selected by `queryset`,
+              as rendered by `serializer_class`.
+            - Returns a `304` response when `If-None-Match`/`If-Modified-Since` match, `None` otherwise.
+              Also returns `None` when the object does not exist, so the view answers its usual `404`.
+        - `finalize_response(...)`:
+            - Adds `ETag`, `Last-Modified` and `Cache-Control: private, no-cache` to successful `GET` responses.
+
+    Usage:
+    ```
+    def get(self, request, patient_id):
+        patients = Patient.objects.filter(id=patient_id)
+        not_modified = self.not_modified(request, patients)
+        if not_modified is not None:
+            return not_modified
+        ...
+    ```
+
+Functions:
+- `bump_version(model)`:
+    - Replaces the version token of the model in the current tenant schema.
+
+- `conditional_models()`:
+    - Returns the model classes of `CONDITIONAL_MODELS`.
+
+Dependencies:
+- `cache` from `django.core.cache` for the version tokens.
+- `get_conditional_response` from `django.utils.cache` for the `If-None-Match`/`If-Modified-Since` evaluation.
+- `get_rendered_models` from `clients.eager_loading` for the models of the nested serializers.
+"""
+
+import datetime
+import hashlib
+import time
+import uuid
+from functools import lru_cache
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .eager_loading import get_rendered_models
+
+
+CACHE_CONTROL = "private, no-cache"
+
+# The models read by the views with conditional GET (list views and detail views).
+CONDITIONAL_MODELS = (
+    "appointments_list.Appointment",
+    "billing_counter.Billing",
+    "clients.Blog",
+    "dashboard.DashboardStats",
+    "ipd_module.IPD",
+    "ipd_module.IPDBill",
+    "opd_module.OPD",
+    "pathology_module.Pathology",
+    "pathology_module.PathologyBill",
+    "patients.Patient",
+    "pharmacy_module.MedicineList",
+    "pharmacy_module.PharmacyBill",
+    "pharmacy_module.PurchaseMedicine",
+    "radiology_module.Radiology",
+    "radiology_module.RadiologyBill",
+    "staff_management.Employee",
+    "staff_management.Role",
+)
+
+
+@lru_cache(maxsize=None)
+def conditional_models():
+    return frozenset(apps.get_model(label) for label in CONDITIONAL_MODELS)
+
+
+def _version_key(model):
+    schema_name = getattr(connection, "schema_name", "public")
+    return f"conditional-version:{schema_name}:{model._meta.label_lower}"
+
+
+def bump_version(model):
+    cache.set(_version_key(model), f"{uuid.uuid4().hex}:{int(time.time())}", None)
+
+
+def _version(model):
+    key = _version_key(model)
+    version = cache.get(key)
+    if version is None:
+        version = f"{uuid.uuid4().hex}:{int(time.time())}"
+        cache.add(key, version, None)
+        version = cache.get(key, version)
+    token, _, changed_at = version.partition(":")
+    return token, int(changed_at)
+
+
+def _timestamp(value):
+    if value is None:
+        return 0
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time.min)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return int(value.timestamp())
+
+
+def _has_field(model, name):
+    return any(field.name == name for field in model._meta.concrete_fields)
+
+
+def get_validators(request, queryset, many=False, serializer_class=None):
+    model = queryset.model
+    models = [model]
+    if serializer_class is not None:
+        models.extend(rendered for rendered in get_rendered_models(serializer_class) if rendered is not model)
+    for rendered in models:
+        if rendered not in conditional_models():
+            raise ImproperlyConfigured(
+                f"{rendered._meta.label} is not in clients.conditional.CONDITIONAL_MODELS, so its saves would not "
+                "invalidate the validators of its conditional views."
+            )
+    versions = [_version(rendered) for rendered in models]
+    token = "|".join(version_token for version_token, _ in versions)
+    changed_at = max(version_changed_at for _, version_changed_at in versions)
+    has_updated_at = _has_field(model, "updated_at")
+
+    if many:
+        aggregates = {"count": Count("pk"), "max_pk": Max("pk")}
+        if has_updated_at:
+            aggregates["updated_at"] = Max("updated_at")
+        state = queryset.order_by().aggregate(**aggregates)
+        updated_at = state.get("updated_at")
+    else:
+        fields = ("pk", "updated_at") if has_updated_at else ("pk",)
+        state = queryset.order_by().values(*fields).first()
+        if state is None:
+            return None
+        updated_at = state.get("updated_at")
+
+    variant = f"{request.get_full_path()}|{request.headers.get('Accept', '')}"
+    digest = hashlib.sha1(
+        f"{model._meta.label_lower}|{sorted(state.items())}|{token}|{variant}".encode()
+    ).hexdigest()
+    return f"W/{quote_etag(digest)}", max(_timestamp(updated_at), changed_at)
+
+
+class ConditionalGetMixin:
+    def not_modified(self, request, queryset, many=False, serializer_class=None):
+        validators = get_validators(request, queryset, many, serializer_class)
+        if validators is None:
+            return None
+
+        self._validators = validators
+        etag, last_modified = validators
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            self._set_validator_headers(response)
+        return response
+
+    def _set_validator_headers(self, response):
+        etag, last_modified = self._validators
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        response["Cache-Control"] = CACHE_CONTROL
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            getattr(self, "_validators", None) is not None
+            and request.method in ("GET", "HEAD")
+            and response.status_code == 200
+        ):
+            self._set_validator_headers(response)
+        return response
@@ -16,15 +16,24 @@ Classes:
     - This permission class is used in views to restrict access so that only users who are designated as tenant admins can access the view.
     - It is typically applied in the `permission_classes` attribute of a view or viewset.
 
+- `IsUserPartOfTenant`:
+    - Grants access only to users with a `UserProfile` in the current tenant.
+
+- `IsTenantAdminOrIsUserPartOfTenant`:
+    - Grants access to tenant admins and to users that are part of the tenant.
+
+Membership is resolved by `clients.membership.resolve_membership`, which caches the result
+per request and across requests, so these checks usually run without touching the database.
+
 Dependencies:
 - `BasePermission` from `rest_framework.permissions` for creating custom permissions.
+- `resolve_membership` from `clients.membership` for the cached membership lookup.
 
 This file provides a custom permission class that ensures only tenant admins can access specific views in the application.
 """
 
 from rest_framework.permissions import BasePermission
-from clients.models import UserProfile
-from users.models import CustomUser
+from clients.membership import resolve_membership
 
 
 class IsTenantAdmin(BasePermission):
@@ -33,14 +42,7 @@ class IsTenantAdmin(BasePermission):
     """
 
     def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and request.user.is_tenant_admin
-            and CustomUser.objects.filter(
-                username=request.user.username, tenant=request.tenant
-            ).exists()
-        )
+        return resolve_membership(request).admin
 
 
 class IsUserPartOfTenant(BasePermission):
@@ -49,10 +51,7 @@ class IsUserPartOfTenant(BasePermission):
     """
 
     def has_permission(self, request, view):
-
-        return UserProfile.objects.filter(
-            user=request.user, tenant=request.tenant
-        ).exists()
+        return resolve_membership(request).member
 
 
 class IsTenantAdminOrIsUserPartOfTenant(BasePermission):
@@ -61,9 +60,5 @@ class IsTenantAdminOrIsUserPartOfTenant(BasePermission):
     """
 
     def has_permission(self, request, view):
-        if IsTenantAdmin().has_permission(request, view):
-            return True
-
-        return UserProfile.objects.filter(
-            user=request.user, tenant=request.tenant
-        ).exists()
+        membership = resolve_membership(request)
+        return membership.admin or membership.member
@@ -0,0 +1,156 @@
+"""
+This module moves the dates and times stored as text (e.g. `PurchaseMedicine.expiry_date`, `Employee.last_login`)
+to real date and timestamp columns, without downtime, the same way `clients.money` does for the amounts.
+
+Each such field gets a typed shadow column, declared in the model's `date_columns` (legacy field -> shadow field):
+a `DateField` for calendar dates, a `DateTimeField` for moments. They are filled in two steps:
+1. Dual-write: every save through the model (`DateColumnsMixin.save`) or the bulk endpoints (`clients.bulk`) also
+   writes the parsed value to the shadow column. `QuerySet.update()` calls on the legacy columns must set the shadow
+   columns themselves.
+2. Backfill: `python manage.py backfill_dates` fills the shadow columns of the existing rows, batch by batch, and
+   `--verify` reports the rows whose shadow column does not match the legacy value.
+The legacy columns stay the API representation; the shadow columns are exposed read-only next to them, and queries
+(e.g. medicines about to expire) should filter on the shadow columns, which are indexed where it matters.
+
+Legacy values are parsed leniently: ISO dates and timestamps, day-first dates (`31-12-2025`, `31/12/2025`,
+`31.12.2025`, `31 Dec 2025`), and for dates only month-and-year expiries (`12/2025`, `12/25`, `Dec 2025`), which
+mean the last day of that month. Timestamps also accept Unix epochs in seconds or milliseconds; values without a
+time zone are taken in the current one. Values that still cannot be parsed, or fall outside years 1900 to 2200,
+are stored as `NULL` and the legacy value is kept as is.
+
+Classes:
+1. `DateColumnsMixin`:
+    - Inherits from `ShadowColumnsMixin` provided by `clients.shadow_columns`: `save()` writes the shadow columns,
+      also when only the legacy columns are in `update_fields`.
+
+    Usage:
+    ```
+    class PurchaseMedicine(DateColumnsMixin, models.Model):
+        date_columns = {"expiry_date": "expires_on"}
+
+        expiry_date = models.CharField(max_length=255, blank=True, null=True)
+        expires_on = models.DateField(null=True, blank=True, editable=False)
+    ```
+
+Functions:
+- `parse_date(value)`: Returns the `date` of a legacy value, or `None`.
+- `parse_timestamp(value)`: Returns the aware `datetime` of a legacy value, or `None`.
+- `date_columns(model)`: Returns the `(legacy_field, shadow_field, parser)` triples of the model.
+- `sync_date_columns(instances, fields=None)`:
+    - Writes the shadow columns of the instances from their legacy values (only for the legacy `fields` when given)
+      and returns the names of the shadow columns written. Used by the bulk writes.
+
+Dependencies:
+- `datetime` and `calendar` for the parsing.
+- `timezone` from `django.utils` for the time zone of naive timestamps.
+- `ShadowColumnsMixin` and `sync_shadow_columns` from `clients.shadow_columns` for the dual-write.
+"""
+
+import calendar
+import datetime
+import re
+from functools import lru_cache
+
+from django.db import models
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .shadow_columns import ShadowColumnsMixin, sync_shadow_columns
+
+
+MIN_YEAR = 1900
+MAX_YEAR = 2200
+
+DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d", "%d.%m.%Y", "%d %b %Y", "%d-%b-%Y", "%d %B %Y")
+MONTH_FORMATS = ("%m/%Y", "%m-%Y", "%m/%y", "%m-%y", "%b %Y", "%b-%Y", "%B %Y", "%b-%y")
+TIMESTAMP_FORMATS = ("%d-%m-%Y %H:%M:%S", "%d-%m-%Y %H:%M", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M")
+
+_EPOCH_RE = re.compile(r"\d{10}(\d{3})?")
+
+
+def _in_range(value):
+    return value if value is not None and MIN_YEAR <= value.year <= MAX_YEAR else None
+
+
+def _strptime(text, formats):
+    for date_format in formats:
+        try:
+            return datetime.datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _text(value):
+    text = str(value).strip() if value is not None else ""
+    return text or None
+
+
+def parse_date(value):
+    if isinstance(value, datetime.datetime):
+        return _in_range(value.date())
+    if isinstance(value, datetime.date):
+        return _in_range(value)
+    text = _text(value)
+    if text is None:
+        return None
+
+    parsed = _strptime(text, DATE_FORMATS)
+    if parsed is not None:
+        return _in_range(parsed.date())
+    parsed = _strptime(text, MONTH_FORMATS)
+    if parsed is not None:
+        # Month-and-year expiries are valid until the end of the month.
+        last_day = calendar.monthrange(parsed.year, parsed.month)[1]
+        return _in_range(parsed.date().replace(day=last_day))
+    timestamp = parse_timestamp(text)
+    return timezone.localdate(timestamp) if timestamp is not None else None
+
+
+def parse_timestamp(value):
+    if isinstance(value, datetime.datetime):
+        parsed = value
+    elif isinstance(value, datetime.date):
+        parsed = datetime.datetime.combine(value, datetime.time.min)
+    else:
+        text = _text(value)
+        if text is None:
+            return None
+        if _EPOCH_RE.fullmatch(text):
+            seconds = int(text) / (1000 if len(text) == 13 else 1)
+            return _in_range(datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc))
+        try:
+            parsed = parse_datetime(text)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            parsed = _strptime(text, TIMESTAMP_FORMATS)
+        if parsed is None:
+            parsed = _strptime(text, DATE_FORMATS)
+        if parsed is None:
+            return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return _in_range(parsed)
+
+
+@lru_cache(maxsize=None)
+def date_columns(model):
+    columns = []
+    for legacy_field, shadow_field in getattr(model, "date_columns", {}).items():
+        field = model._meta.get_field(shadow_field)
+        parser = parse_timestamp if isinstance(field, models.DateTimeField) else parse_date
+        columns.append((legacy_field, shadow_field, parser))
+    return tuple(columns)
+
+
+def sync_date_columns(instances, fields=None):
+    return sync_shadow_columns(instances, date_columns, fields)
+
+
+class DateColumnsMixin(ShadowColumnsMixin):
+    date_columns = {}
+
+    @classmethod
+    def shadow_columns(cls):
+        return (*super().shadow_columns(), *date_columns(cls))
@@ -0,0 +1,84 @@
+"""
+This module derives the `select_related`/`prefetch_related` calls a serializer needs, so list views do not
+issue one query per row for every related object the serializer renders.
+
+The relations are read from the nested serializer fields: `role = RoleSerializer(read_only=True)` joins `role`,
+`bed_details = BedSerializer(read_only=True, source="bed")` joins `bed` plus whatever `BedSerializer` needs
+(e.g. `bed__bed_type`), and `many=True` nested serializers are prefetched. Plain foreign key fields are rendered
+from the `<field>_id` column and need nothing.
+
+Functions:
+- `get_eager_loading(serializer_class)`:
+    - Returns the `(select_related, prefetch_related)` lookups of the serializer, including those of its nested serializers.
+
+- `get_rendered_models(serializer_class)`:
+    - Returns the models rendered by the nested serializers of the serializer, at any depth, so a view can tell
+      which writes change its output (see `clients.conditional`).
+
+- `setup_eager_loading(queryset, serializer_class, sources=None)`:
+    - Applies those lookups to the queryset. Used by `clients.mixins.TenantListMixin.list_response`.
+    - When `sources` is given (see `clients.sparse_fields`), only the relations starting at one of them are loaded.
+
+Dependencies:
+- `serializers` from `rest_framework` to walk the nested serializer fields.
+"""
+
+from functools import lru_cache
+
+from rest_framework import serializers
+
+
+def _nested_source(name, field):
+    source = field.source or name
+    return source.replace(".", "__")
+
+
+def _nested_serializers(serializer_class):
+    # `(source, nested serializer class, many)` of the nested serializer fields.
+    for name, field in getattr(serializer_class, "_declared_fields", {}).items():
+        if isinstance(field, serializers.ListSerializer):
+            yield _nested_source(name, field), type(field.child), True
+        elif isinstance(field, serializers.BaseSerializer):
+            yield _nested_source(name, field), type(field), False
+
+
+@lru_cache(maxsize=None)
+def get_eager_loading(serializer_class):
+    select_related, prefetch_related = [], []
+
+    for source, nested_class, many in _nested_serializers(serializer_class):
+        nested_select, nested_prefetch = get_eager_loading(nested_class)
+        if many:
+            prefetch_related.append(source)
+            prefetch_related.extend(
+                f"{source}__{lookup}" for lookup in (*nested_select, *nested_prefetch)
+            )
+        else:
+            select_related.append(source)
+            select_related.extend(f"{source}__{lookup}" for lookup in nested_select)
+            prefetch_related.extend(f"{source}__{lookup}" for lookup in nested_prefetch)
+
+    return tuple(dict.fromkeys(select_related)), tuple(dict.fromkeys(prefetch_related))
+
+
+@lru_cache(maxsize=None)
+def get_rendered_models(serializer_class):
+    models = []
+    for _, nested_class, _ in _nested_serializers(serializer_class):
+        nested_model = getattr(getattr(nested_class, "Meta", None), "model", None)
+        for model in (nested_model, *get_rendered_models(nested_class)):
+            if model is not None and model not in models:
+                models.append(model)
+    return tuple(models)
+
+
+def setup_eager_loading(queryset, serializer_class, sources=None):
+    select_related, prefetch_related = get_eager_loading(serializer_class)
+    if sources is not None:
+        select_related = [lookup for lookup in select_related if lookup.split("__")[0] in sources]
+        prefetch_related = [lookup for lookup in prefetch_related if lookup.split("__")[0] in sources]
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
@@ -0,0 +1,134 @@
+"""
+This module compiles read-only row converters for the serializers of the tenant list views, so large list
+responses skip building model instances and DRF's per-field dispatch.
+
+A converter reads the rows of `.values_list(..., named=True)` and turns each tuple into the dict the serializer
+would have produced, through one generated function per serializer and field selection:
+- `CharField`/`EmailField`, `IntegerField`, `FloatField`, ISO-8601 `DateField`, `ReadOnlyField` and plain
+  `PrimaryKeyRelatedField` (rendered from the `<field>_id` column) are inlined.
+- Any other model-backed field calls its own `to_representation`, so the output stays identical.
+- Serializers with nested serializers, method fields, multi-column fields (e.g. `blobs.fields.BlobField`),
+  dotted sources or custom `to_representation` are not compiled; the list view falls back to the serializer.
+A serializer opts out with `fast_path = False`.
+
+Classes:
+1. `RowConverter`:
+    - `columns`: The `values_list()` columns to select, the ones of the fields followed by `keep`.
+    - `to_representation(row)`: Converts one row, like `Serializer.to_representation(instance)`.
+    - `convert_many(rows)`: Converts a list of rows, like `Serializer(instances, many=True).data`.
+
+Functions:
+- `compile_serializer(serializer_class, names=None, keep=())`:
+    - Returns the `RowConverter` of the serializer restricted to the field `names` (all readable fields when `None`),
+      also selecting the `keep` columns (e.g. the keyset ordering), or `None` when the serializer cannot be compiled.
+    - `names` comes from the client's `?fields=`/`?exclude=`, so the converters are kept in an LRU cache of
+      `COMPILED_CONVERTERS` entries: enough for the default selection of every list serializer and the common
+      sparse ones, while a client cycling through field combinations only costs recompiles, not memory.
+
+    Usage:
+    ```
+    converter = compile_serializer(PatientSerializer)
+    rows = queryset.values_list(*converter.columns, named=True)
+    data = converter.convert_many(rows)
+    ```
+
+Dependencies:
+- `fields`, `relations` and `serializers` from `rest_framework` to inspect the serializer fields.
+- `api_settings` from `rest_framework.settings` for the default date format.
+"""
+
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields, relations, serializers
+from rest_framework.settings import api_settings
+
+from .sparse_fields import _serializer_fields
+
+
+_STR_FIELDS = (fields.CharField, fields.EmailField, fields.SlugField, fields.URLField)
+
+COMPILED_CONVERTERS = 256
+
+
+class RowConverter:
+    def __init__(self, columns, convert):
+        self.columns = columns
+        self.to_representation = convert
+
+    def convert_many(self, rows):
+        convert = self.to_representation
+        return [convert(row) for row in rows]
+
+
+def _column(model, field):
+    source = field.source
+    if not source or source == "*" or "." in source or hasattr(field, "columns"):
+        return None
+    try:
+        model_field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+    return model_field.name
+
+
+def _expression(field, value, namespace, index):
+    # Python expression converting `value` (a non-null column value) like `field.to_representation`.
+    field_class = type(field)
+    if field_class in _STR_FIELDS:
+        return f"str({value})"
+    if field_class is fields.IntegerField:
+        return f"int({value})"
+    if field_class is fields.FloatField:
+        return f"float({value})"
+    if field_class is fields.ReadOnlyField:
+        return value
+    if field_class is fields.DateField:
+        output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+        if output_format is not None and output_format.lower() == fields.ISO_8601:
+            return f"{value}.isoformat()"
+    if field_class is relations.PrimaryKeyRelatedField and field.pk_field is None:
+        return value
+
+    namespace[f"convert_{index}"] = field.to_representation
+    return f"convert_{index}({value})"
+
+
+@lru_cache(maxsize=COMPILED_CONVERTERS)
+def compile_serializer(serializer_class, names=None, keep=()):
+    if not getattr(serializer_class, "fast_path", True):
+        return None
+    if serializer_class.to_representation is not serializers.Serializer.to_representation:
+        return None
+
+    model = serializer_class.Meta.model
+    selected = [
+        (name, field)
+        for name, field in _serializer_fields(serializer_class).items()
+        if not field.write_only and (names is None or name in names)
+    ]
+    if any(isinstance(field, (serializers.BaseSerializer, relations.ManyRelatedField)) for _, field in selected):
+        return None
+
+    columns = []
+    for _, field in selected:
+        column = _column(model, field)
+        if column is None:
+            return None
+        columns.append(column)
+    columns = tuple(dict.fromkeys([*columns, *keep]))
+
+    namespace = {}
+    items = []
+    for index, (name, field) in enumerate(selected):
+        value = f"row[{columns.index(_column(model, field))}]"
+        expression = _expression(field, value, namespace, index)
+        if expression != value:
+            expression = f"None if {value} is None else {expression}"
+        items.append(f"{name!r}: {expression}")
+
+    source = "def convert(row):\n    return {" + ", ".join(items) + "}\n"
+    exec(compile(source, f"<row converter {serializer_class.__qualname__}>", "exec"), namespace)
+    return RowConverter(columns, namespace["convert"])
@@ -0,0 +1,119 @@
+"""
+This module defines the server-side filters of the tenant list endpoints.
+
+List views declare their filters in the `list_filters` attribute of `clients.mixins.TenantListMixin`, and the
+fields clients may sort on in `list_sort_fields`. Every filtered column has a matching index that ends with the
+keyset ordering columns (`<column>, created_at DESC NULLS LAST, id DESC`), so a filtered page is read with one
+index scan in the order it is returned. The `clients.E001`/`E002` system checks (`clients.checks`) enforce it.
+
+Query parameters:
+- `ExactFilter("doctor")`: `?doctor=<id>`. Foreign keys take the primary key of the related row,
+  fields with choices must use one of the choices.
+- `DateRangeFilter("appointment_date")`: `?appointment_date_after=2024-01-01&appointment_date_before=2024-01-31`,
+  both bounds inclusive and optional. On a `DateTimeField` the bounds are whole days in the current time zone.
+- `?ordering=<field>` or `?ordering=-<field>` sorts ascending or descending on one of `list_sort_fields`
+  (ties broken on `id`). The default is `list_ordering`, newest first.
+Invalid values are rejected with a `400` response naming the parameter.
+
+Classes:
+1. `ExactFilter(field, param=None)`:
+    - Keeps the rows whose `field` equals the parameter (named `param`, default the field name).
+
+2. `DateRangeFilter(field, param=None)`:
+    - Keeps the rows whose `field` lies between the `<param>_after` and `<param>_before` dates.
+
+Functions:
+- `apply_filters(queryset, filters, request)`:
+    - Applies the filters to the queryset.
+
+- `get_ordering(request, sort_fields, default)`:
+    - Returns `(ordering, descending)` for `clients.pagination.KeysetPagination`.
+
+    Usage:
+    ```
+    class AppointmentListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+        list_filters = (DateRangeFilter("created_at"), ExactFilter("doctor"), ExactFilter("payment_mode"))
+        list_sort_fields = ("created_at", "appointment_date")
+    ```
+
+Dependencies:
+- `fields` from `rest_framework` to parse and validate the parameter values.
+- `ValidationError` from `rest_framework.exceptions` for invalid values.
+"""
+
+import datetime
+
+from django.db import models
+from django.utils import timezone
+from rest_framework import fields
+from rest_framework.exceptions import ValidationError
+
+
+ORDERING_PARAM = "ordering"
+
+
+class ExactFilter:
+    def __init__(self, field, param=None):
+        self.field = field
+        self.param = param or field
+
+    def parser(self, model):
+        model_field = model._meta.get_field(self.field)
+        if model_field.is_relation:
+            return fields.IntegerField()
+        if model_field.choices:
+            return fields.ChoiceField(choices=model_field.choices)
+        return fields.CharField()
+
+    def parse(self, parser, param, value):
+        try:
+            return parser.run_validation(value)
+        except ValidationError as exc:
+            raise ValidationError({param: exc.detail})
+
+    def filter(self, queryset, query_params):
+        value = query_params.get(self.param)
+        if value is None:
+            return queryset
+        value = self.parse(self.parser(queryset.model), self.param, value)
+        column = queryset.model._meta.get_field(self.field).attname
+        return queryset.filter(**{column: value})
+
+
+class DateRangeFilter(ExactFilter):
+    def parser(self, model):
+        return fields.DateField()
+
+    def filter(self, queryset, query_params):
+        timestamp = isinstance(queryset.model._meta.get_field(self.field), models.DateTimeField)
+        for suffix, lookup in (("after", "gte"), ("before", "lte")):
+            param = f"{self.param}_{suffix}"
+            value = query_params.get(param)
+            if value is None:
+                continue
+            value = self.parse(self.parser(queryset.model), param, value)
+            if timestamp:
+                # Whole days in the current time zone, as bounds on the column itself so its index is used.
+                if suffix == "before":
+                    value, lookup = value + datetime.timedelta(days=1), "lt"
+                value = datetime.datetime.combine(value, datetime.time.min, tzinfo=timezone.get_current_timezone())
+            queryset = queryset.filter(**{f"{self.field}__{lookup}": value})
+        return queryset
+
+
+def apply_filters(queryset, filters, request):
+    for list_filter in filters:
+        queryset = list_filter.filter(queryset, request.query_params)
+    return queryset
+
+
+def get_ordering(request, sort_fields, default):
+    value = request.query_params.get(ORDERING_PARAM)
+    if not value:
+        return tuple(default), True
+
+    descending = value.startswith("-")
+    field = value.lstrip("-")
+    if field not in sort_fields:
+        raise ValidationError({ORDERING_PARAM: [f"Ordering must be one of: {', '.join(sort_fields)}"]})
+    return (field, "id"), descending
@@ -2,15 +2,23 @@
 This module provides functionality for generating JSON Web Tokens (JWT) for user authorization.
 
 Function:
-- `get_tokens_for_user(user)`:
+- `get_tokens_for_user(user, tenant=None, membership=None)`:
     - Generates JWT tokens for the given user.
     - Uses the `RefreshToken` class from `rest_framework_simplejwt.tokens` to create a refresh token and an access token.
+    - Adds the user's profile (`email`, `username`, `is_tenant_admin`, `is_staff`, `is_superuser`, `user_tenant_id`)
+      and the login time (`auth_time`) to the signed claims.
+    - When a `tenant` is given, also adds its schema name (`tenant`) and the user's membership in it
+      (`tenant_member`, `tenant_admin`), so `clients.authentication.TenantJWTAuthentication` can authorize
+      requests to that tenant without loading the user from the database.
     - Returns a dictionary containing:
         - `refresh`: The refresh token as a string.
         - `access`: The access token as a string.
 
     Parameters:
     - `user`: An instance of the `CustomUser` model for which the tokens are generated.
+    - `tenant`: Optional `Tenant` the tokens are scoped to, usually `request.tenant`.
+    - `membership`: Optional `TenantMembership` already known to the caller (e.g. from `clients.login`),
+      which saves the membership lookup.
 
     Returns:
     - A dictionary with two keys:
@@ -22,15 +30,34 @@ Function:
 
 Dependencies:
 - `RefreshToken` from `rest_framework_simplejwt.tokens` for creating JWT tokens.
+- `get_membership` from `clients.membership` for the tenant membership claims.
 
 This file provides a utility function for generating JWT tokens, which are used for user authentication and authorization in the application.
 """
 
+import time
+
 from rest_framework_simplejwt.tokens import RefreshToken
+from clients.membership import get_membership
 
 
-def get_tokens_for_user(user):
+def get_tokens_for_user(user, tenant=None, membership=None):
     refresh = RefreshToken.for_user(user)
+    refresh["email"] = user.email
+    refresh["username"] = user.username
+    refresh["is_tenant_admin"] = user.is_tenant_admin
+    refresh["is_staff"] = user.is_staff
+    refresh["is_superuser"] = user.is_superuser
+    refresh["user_tenant_id"] = user.tenant_id
+    refresh["auth_time"] = time.time()
+
+    if tenant is not None:
+        if membership is None:
+            membership = get_membership(user, tenant)
+        refresh["tenant"] = tenant.schema_name
+        refresh["tenant_member"] = membership.member
+        refresh["tenant_admin"] = membership.admin
+
     return {
         "refresh": str(refresh),
         "access": str(refresh.access_token),
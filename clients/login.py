@@ -0,0 +1,98 @@
+"""
+This module implements the login pipeline used by `clients.views.UserLoginView`.
+
+Functions:
+- `authenticate_login(request, email, password)`:
+    - Resolves the user, whether it has a `UserProfile` and its membership in the current tenant with one joined query.
+    - Verifies the password in a bounded thread pool (`LOGIN_HASH_WORKERS` threads), so a burst of logins
+      can only occupy that many cores with PBKDF2 work while the remaining worker threads keep serving requests.
+    - Runs a dummy hash when the email is unknown, so every attempt costs one hash and the response
+      time does not reveal which emails are registered.
+    - Rehashes the password when the stored hash does not match the configured hasher cost
+      (see `users.hashers.TenantPBKDF2PasswordHasher`); the new hash is computed in the pool and saved here.
+    - Returns a `LoginResult(user, has_profile, membership)` or `None` when authentication fails.
+
+Dependencies:
+- `ThreadPoolExecutor` from `concurrent.futures` for the bounded hashing pool.
+- `identify_hasher`, `get_hasher`, `make_password` and `is_password_usable` from `django.contrib.auth.hashers`.
+- `Exists` and `OuterRef` from `django.db.models` for the joined lookup.
+- `CustomUser` and `UserProfile` models.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    get_hasher,
+    identify_hasher,
+    is_password_usable,
+    make_password,
+)
+from django.db.models import Exists, OuterRef
+
+from clients.membership import TenantMembership
+from clients.models import UserProfile
+from users.models import CustomUser
+
+
+LoginResult = namedtuple("LoginResult", ["user", "has_profile", "membership"])
+
+_hash_pool = ThreadPoolExecutor(
+    max_workers=getattr(settings, "LOGIN_HASH_WORKERS", 4),
+    thread_name_prefix="login-hash",
+)
+
+
+def _verify_password(password, encoded):
+    # Runs in the hashing pool: CPU work only, no database access.
+    if encoded is None or not is_password_usable(encoded):
+        make_password(password)
+        return False, None
+
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False, None
+
+    if not hasher.verify(password, encoded):
+        return False, None
+
+    preferred = get_hasher("default")
+    if hasher.algorithm != preferred.algorithm or preferred.must_update(encoded):
+        return True, make_password(password)
+    return True, None
+
+
+def authenticate_login(request, email, password):
+    tenant = request.tenant
+    user = (
+        CustomUser.objects.select_related("tenant")
+        .filter(email=email, tenant=tenant)
+        .annotate(
+            has_profile=Exists(UserProfile.objects.filter(user=OuterRef("pk"))),
+            tenant_member=Exists(
+                UserProfile.objects.filter(user=OuterRef("pk"), tenant=tenant)
+            ),
+        )
+        .first()
+    )
+
+    if user is None:
+        _hash_pool.submit(_verify_password, password, None).result()
+        return None
+
+    is_correct, new_encoded = _hash_pool.submit(
+        _verify_password, password, user.password
+    ).result()
+    if not is_correct or not user.is_active:
+        return None
+
+    if new_encoded is not None:
+        user.password = new_encoded
+        user.save(update_fields=["password"])
+
+    membership = TenantMembership(
+        member=user.tenant_member, admin=user.is_tenant_admin
+    )
+    return LoginResult(user=user, has_profile=user.has_profile, membership=membership)
@@ -0,0 +1,168 @@
+"""
+This module defines the base classes of the management commands that work through every tenant schema, most of
+them rewriting rows batch by batch without downtime (`backfill_money`, `backfill_dates`, `blobs`' `migrate_blobs`,
+`rebuild_patient_ledger`).
+
+Classes:
+1. `TenantCommand`:
+    - Inherits from `BaseCommand` provided by `django.core.management.base`.
+    - Adds the `--schema` argument, and calls `handle_schema(schema_name, options)` inside every tenant schema
+      (or only `--schema`), in schema name order.
+
+2. `TenantBatchCommand`:
+    - Inherits from `TenantCommand` and adds the `--batch-size` (default `batch_size`) and `--sleep` arguments.
+    - `run_batches(queryset, fields, process, options, lock=False)` reads the `pk` and `fields` of the queryset in
+      primary key batches (the model instances when `fields` is `None`) and passes each list of rows to
+      `process(rows)`, which returns whether it wrote anything. With `lock`, every batch is locked
+      (`SELECT ... FOR UPDATE`) and processed in a short transaction of its own. Row updates bypass the model
+      signals, so the conditional GET validators (`clients.conditional`) of the model are invalidated after every
+      batch that wrote. `--sleep` pauses between batches.
+
+3. `ShadowBackfillCommand`:
+    - Inherits from `TenantBatchCommand` and fills the shadow columns (`clients.shadow_columns`) of the existing
+      rows, for every model that has some. Subclasses set `shadow_columns` (e.g. `clients.money.money_columns`)
+      and `noun` (what the legacy values are, for the output).
+    - Each batch is parsed with the parsers of the columns and the shadow columns that differ are written with one
+      `bulk_update`. Parsing is cheap, so concurrent API writes wait for at most one batch; the ones made after the
+      batch dual-write the shadow columns themselves. The command can be stopped and re-run at any time.
+    - `--verify` only reads: it counts, per model, the rows whose shadow columns do not match their legacy values
+      and the rows with values that cannot be parsed (those stay `NULL`, the legacy value is kept).
+
+Dependencies:
+- `schema_context` from `django_tenants.utils` and the `Tenant` model for the tenant schemas.
+- `bump_version` from `clients.conditional` for the conditional GET validators.
+"""
+
+import contextlib
+import logging
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from clients.conditional import bump_version
+from users.models import Tenant
+
+logger = logging.getLogger(__name__)
+
+
+class TenantCommand(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument("--schema", help="Only process this tenant schema.")
+
+    def handle(self, *args, **options):
+        schemas = Tenant.objects.exclude(schema_name=get_public_schema_name()).order_by("schema_name")
+        if options["schema"]:
+            schemas = schemas.filter(schema_name=options["schema"])
+
+        for schema_name in schemas.values_list("schema_name", flat=True):
+            with schema_context(schema_name):
+                self.handle_schema(schema_name, options)
+
+    def handle_schema(self, schema_name, options):
+        raise NotImplementedError("subclasses of TenantCommand must provide a handle_schema() method")
+
+
+class TenantBatchCommand(TenantCommand):
+    batch_size = 1000
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--batch-size", type=int, default=self.batch_size)
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches.")
+
+    def run_batches(self, queryset, fields, process, options, lock=False):
+        last_pk = None
+        while True:
+            with transaction.atomic() if lock else contextlib.nullcontext():
+                batch = queryset.order_by("pk")
+                if lock:
+                    batch = batch.select_for_update()
+                if last_pk is not None:
+                    batch = batch.filter(pk__gt=last_pk)
+                if fields is not None:
+                    batch = batch.values_list("pk", *fields)
+                rows = list(batch[: options["batch_size"]])
+                if not rows:
+                    break
+                written = process(rows)
+
+            if written:
+                bump_version(queryset.model)
+            last_pk = rows[-1][0] if fields is not None else rows[-1].pk
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+
+class ShadowBackfillCommand(TenantBatchCommand):
+    shadow_columns = None
+    noun = "values"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--verify", action="store_true", help="Only report the rows that do not match.")
+
+    def handle_schema(self, schema_name, options):
+        for model in apps.get_models():
+            columns = self.shadow_columns(model)
+            if not columns:
+                continue
+            label = f"{schema_name}: {model._meta.label}"
+            if options["verify"]:
+                self.verify(label, model, columns, options)
+            else:
+                self.backfill(label, model, columns, options)
+
+    def fields(self, columns):
+        return [legacy_field for legacy_field, _, _ in columns] + [shadow_field for _, shadow_field, _ in columns]
+
+    def parse_row(self, row, columns):
+        # The parsed values of `row` by shadow field, the shadow fields that differ from them, and whether
+        # a non-empty legacy value could not be parsed.
+        values = row[1:]
+        parsed, changed = {}, []
+        invalid = False
+        for index, (_, shadow_field, parser) in enumerate(columns):
+            legacy, shadow = values[index], values[len(columns) + index]
+            parsed[shadow_field] = parser(legacy)
+            if parsed[shadow_field] is None and legacy is not None and str(legacy).strip():
+                invalid = True
+            if parsed[shadow_field] != shadow:
+                changed.append(shadow_field)
+        return parsed, changed, invalid
+
+    def verify(self, label, model, columns, options):
+        mismatched = invalid = 0
+        rows = model._base_manager.order_by("pk").values_list("pk", *self.fields(columns))
+        for row in rows.iterator(chunk_size=options["batch_size"]):
+            _, changed, row_invalid = self.parse_row(row, columns)
+            mismatched += bool(changed)
+            invalid += row_invalid
+        self.stdout.write(f"{label}: {mismatched} rows to backfill, {invalid} with {self.noun} that cannot be parsed")
+
+    def backfill(self, label, model, columns, options):
+        counts = {"updated": 0, "invalid": 0}
+
+        def process(rows):
+            instances = []
+            fields = set()
+            for row in rows:
+                parsed, changed, row_invalid = self.parse_row(row, columns)
+                if row_invalid:
+                    logger.warning(f"{label}: row {row[0]} has {self.noun} that cannot be parsed")
+                    counts["invalid"] += 1
+                if changed:
+                    # Unchanged shadow columns already hold their parsed value, so writing all of them is safe.
+                    instances.append(model(pk=row[0], **parsed))
+                    fields.update(changed)
+            if instances:
+                model._base_manager.bulk_update(instances, sorted(fields))
+                counts["updated"] += len(instances)
+            return bool(instances)
+
+        self.run_batches(model._base_manager.all(), self.fields(columns), process, options, lock=True)
+        self.stdout.write(
+            f"{label}: {counts['updated']} rows backfilled, {counts['invalid']} with {self.noun} that cannot be parsed"
+        )
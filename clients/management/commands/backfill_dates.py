@@ -0,0 +1,25 @@
+"""
+Management command to fill the typed date columns (`date_columns`, see `clients.dates`) of the existing rows,
+without downtime.
+
+Usage:
+    python manage.py backfill_dates [--schema <schema_name>] [--batch-size 1000] [--sleep 0.1] [--verify]
+
+For every tenant schema (or `--schema`) and every model with date columns, the legacy values are parsed with
+`clients.dates.parse_date` or `parse_timestamp` and the shadow columns that differ are written, one locked primary
+key batch at a time (see `clients.management.base.ShadowBackfillCommand`). The command can be stopped and re-run
+at any time.
+
+`--verify` only reads: it counts, per model, the rows whose shadow columns do not match their legacy values
+and the rows with values that cannot be parsed (those stay `NULL`, the legacy value is kept). Check the latter
+before filtering on the shadow columns.
+"""
+
+from clients.management.base import ShadowBackfillCommand
+from clients.dates import date_columns
+
+
+class Command(ShadowBackfillCommand):
+    help = "Fill the typed date columns from the legacy text dates, batch by batch."
+    shadow_columns = staticmethod(date_columns)
+    noun = "dates"
@@ -0,0 +1,24 @@
+"""
+Management command to fill the numeric money columns (`<field>_decimal`, see `clients.money`) of the existing rows,
+without downtime.
+
+Usage:
+    python manage.py backfill_money [--schema <schema_name>] [--batch-size 1000] [--sleep 0.1] [--verify]
+
+For every tenant schema (or `--schema`) and every model with money columns, the legacy amounts are parsed with
+`clients.money.parse_money` and the shadow columns that differ are written, one locked primary key batch at a time
+(see `clients.management.base.ShadowBackfillCommand`). The command can be stopped and re-run at any time.
+
+`--verify` only reads: it counts, per model, the rows whose shadow columns do not match their legacy values
+and the rows with amounts that cannot be parsed (those stay `NULL`). Once it reports no mismatches for every schema,
+`MONEY_DECIMAL_READS` can be turned on.
+"""
+
+from clients.management.base import ShadowBackfillCommand
+from clients.money import money_columns
+
+
+class Command(ShadowBackfillCommand):
+    help = "Fill the numeric money columns from the legacy text amounts, batch by batch."
+    shadow_columns = staticmethod(money_columns)
+    noun = "amounts"
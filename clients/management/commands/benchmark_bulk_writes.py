@@ -0,0 +1,123 @@
+"""
+Management command to benchmark the bulk write endpoints against one `POST` per row.
+
+Usage:
+    python manage.py benchmark_bulk_writes --schema <schema_name> [--items 50 500] [--rounds 3] [--resource pharmacy-bill ...]
+
+In the tenant schema, as the first tenant admin (or `--user <email>`), sends synthetic rows through the list
+view's `POST` one request per row, then through the bulk view's `POST` in one request, and reports rows per second
+and the number of queries of both. Requests go straight to the views (no HTTP server), with the same
+authentication, permission and transaction handling. Everything runs in a transaction that is rolled back at the
+end, so the schema is left as it was.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django_tenants.utils import schema_context
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from clients.models import Tenant
+from ipd_module.views import IPDBillBulkView, IPDBillListView
+from pathology_module.views import PathologyBulkView, PathologyListView
+from pharmacy_module.views import PharmacyBillBulkView, PharmacyBillListView
+from users.models import CustomUser
+
+from .benchmark_serializers import _sample_value
+
+
+RESOURCES = {
+    "pharmacy-bill": (PharmacyBillListView, PharmacyBillBulkView),
+    "ipd-bill": (IPDBillListView, IPDBillBulkView),
+    "pathology": (PathologyListView, PathologyBulkView),
+}
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _payload(model, count):
+    # Plain column values only; foreign keys are nullable and left out, so the rows need no fixtures.
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if field.editable and not field.primary_key and not field.is_relation
+        and not getattr(field, "auto_now", False) and not getattr(field, "auto_now_add", False)
+    ]
+    return [{field.name: _sample_value(field, index) for field in fields} for index in range(count)]
+
+
+class Command(BaseCommand):
+    help = "Benchmark the bulk write endpoints against one POST per row."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--schema", required=True)
+        parser.add_argument("--user", help="Email of the user sending the requests (default: a tenant admin).")
+        parser.add_argument("--items", type=int, nargs="+", default=[50, 500])
+        parser.add_argument("--rounds", type=int, default=3)
+        parser.add_argument("--resource", action="append", dest="resources", choices=sorted(RESOURCES))
+
+    def handle(self, *args, **options):
+        tenant = Tenant.objects.filter(schema_name=options["schema"]).first()
+        if tenant is None:
+            raise CommandError(f"Unknown schema: {options['schema']}")
+        users = CustomUser.objects.filter(tenant=tenant, is_active=True)
+        user = (
+            users.filter(email=options["user"]).first()
+            if options["user"]
+            else users.filter(is_tenant_admin=True).first()
+        )
+        if user is None:
+            raise CommandError("No user to send the requests as; pass --user.")
+
+        self.factory = APIRequestFactory()
+        with schema_context(tenant.schema_name):
+            for resource in options["resources"] or sorted(RESOURCES):
+                list_view, bulk_view = RESOURCES[resource]
+                model = bulk_view.bulk_serializer_class.Meta.model
+                for count in options["items"]:
+                    items = _payload(model, count)
+                    single = self.measure(options["rounds"], lambda: self.post_each(list_view, items, tenant, user))
+                    bulk = self.measure(options["rounds"], lambda: self.post_bulk(bulk_view, items, tenant, user))
+                    self.stdout.write(
+                        f"{resource} x {count}: "
+                        f"single {count / single[0]:.0f} rows/s ({single[1]} queries), "
+                        f"bulk {count / bulk[0]:.0f} rows/s ({bulk[1]} queries), "
+                        f"{single[0] / bulk[0]:.1f}x faster"
+                    )
+
+    def request(self, view, items, tenant, user):
+        request = self.factory.post("/", items, format="json")
+        request.tenant = tenant
+        force_authenticate(request, user=user)
+        response = view.as_view()(request)
+        if response.status_code != 201:
+            response.render()
+            raise CommandError(f"{view.__name__}: {response.status_code} {response.content[:500]!r}")
+
+    def post_each(self, view, items, tenant, user):
+        for item in items:
+            self.request(view, item, tenant, user)
+
+    def post_bulk(self, view, items, tenant, user):
+        self.request(view, items, tenant, user)
+
+    def measure(self, rounds, func):
+        # Best time and query count over `rounds` runs, each rolled back.
+        timings = []
+        queries = 0
+        for _ in range(rounds):
+            try:
+                with transaction.atomic(), CaptureQueriesContext(connection) as captured:
+                    started = time.perf_counter()
+                    func()
+                    timings.append(time.perf_counter() - started)
+                    queries = len(captured)
+                    raise _Rollback
+            except _Rollback:
+                pass
+        return min(timings), queries
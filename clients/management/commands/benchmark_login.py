@@ -0,0 +1,80 @@
+"""
+Management command to benchmark the tenant login path.
+
+Usage:
+    python manage.py benchmark_login --schema <tenant schema> --email <email> --password <password> [--rounds 20]
+
+Runs the login of an existing tenant user sequentially on one core, once through the previous
+path (`TenantEmailBackend` followed by the `UserProfile`/`CustomUser` lookups) and once through
+`clients.login.authenticate_login`, and reports logins per second and queries per login for both.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django_tenants.utils import schema_context
+
+from clients.login import authenticate_login
+from clients.models import UserProfile
+from users.auth_backends import TenantEmailBackend
+from users.models import CustomUser, Tenant
+
+
+def legacy_login(request, email, password):
+    user = TenantEmailBackend().authenticate(
+        request, email=email, password=password, tenant=request.tenant
+    )
+    if user is None:
+        return None
+    try:
+        UserProfile.objects.get(user=user)
+    except UserProfile.DoesNotExist:
+        CustomUser.objects.get(email=user.email)
+    return user
+
+
+class Command(BaseCommand):
+    help = "Benchmark logins per second per core for the previous and the current login path."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--schema", required=True)
+        parser.add_argument("--email", required=True)
+        parser.add_argument("--password", required=True)
+        parser.add_argument("--rounds", type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            tenant = Tenant.objects.get(schema_name=options["schema"])
+        except Tenant.DoesNotExist:
+            raise CommandError(f"Tenant {options['schema']} does not exist")
+
+        request = RequestFactory().post("/login")
+        request.tenant = tenant
+
+        with schema_context(tenant.schema_name):
+            for name, login in (
+                ("before (TenantEmailBackend)", legacy_login),
+                ("after (authenticate_login)", authenticate_login),
+            ):
+                self.run(name, login, request, options)
+
+    def run(self, name, login, request, options):
+        rounds = options["rounds"]
+        # Warm up connections and the hashing pool.
+        if login(request, options["email"], options["password"]) is None:
+            raise CommandError("Login failed, check --email and --password")
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(rounds):
+                login(request, options["email"], options["password"])
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{name}: {rounds / elapsed:.2f} logins/s per core, "
+            f"{elapsed / rounds * 1000:.1f} ms/login, "
+            f"{len(queries) / rounds:.1f} queries/login"
+        )
@@ -0,0 +1,98 @@
+"""
+Management command to benchmark JSON rendering and response compression on the largest list endpoints.
+
+Usage:
+    python manage.py benchmark_rendering [--rows 500 10000] [--rounds 5] [--serializer clients.serializers.BlogSerializer ...]
+
+Builds synthetic list responses (`{"data": [...], "next": ..., "previous": null}`, rows as returned by
+`FetchAllBlogs`, `FetchAllPatients` and `PharmacyBillListView`, no database needed) and reports:
+- Rendering throughput of DRF's `JSONRenderer` and of `clients.renderers.ORJSONRenderer`, and fails when the two
+  do not produce the same bytes.
+- Bytes on the wire and compression time for identity, `gzip` and `br` (`br` only when Brotli is installed),
+  with the levels used by `clients.compression.CompressionMiddleware`.
+"""
+
+import time
+from collections import namedtuple
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from rest_framework.renderers import JSONRenderer
+
+from clients.compression import _supported_encodings, compress
+from clients.fast_serializers import compile_serializer
+from clients.renderers import ORJSONRenderer
+from clients.sparse_fields import select_fields
+
+from .benchmark_serializers import _ListRequest, _sample_value
+
+
+DEFAULT_SERIALIZERS = [
+    "clients.serializers.BlogSerializer",
+    "patients.serializers.PatientSerializer",
+    "pharmacy_module.serializers.PharmacyBillSerializer",
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmark JSON rendering and gzip/brotli compression of list responses."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[500, 10_000])
+        parser.add_argument("--rounds", type=int, default=5)
+        parser.add_argument("--serializer", action="append", dest="serializers")
+
+    def handle(self, *args, **options):
+        for path in options["serializers"] or DEFAULT_SERIALIZERS:
+            serializer_class = import_string(path)
+            names = select_fields(serializer_class, _ListRequest(), skip_heavy=True)
+            converter = compile_serializer(serializer_class, names, keep=("created_at", "id"))
+            if converter is None:
+                self.stdout.write(f"{serializer_class.__name__}: not compilable, skipped")
+                continue
+
+            model = serializer_class.Meta.model
+            row_class = namedtuple("Row", converter.columns)
+            fields = [model._meta.get_field(column) for column in converter.columns]
+
+            for count in options["rows"]:
+                rows = [row_class(*(_sample_value(field, index) for field in fields)) for index in range(count)]
+                data = {
+                    "data": converter.convert_many(rows),
+                    "next": "https://example.com/api/list?cursor=eyJwIjogWyIyMDI0LTAxLTAxIiwgMV19",
+                    "previous": None,
+                }
+                self.benchmark(f"{serializer_class.__name__} x {count}", data, options["rounds"])
+
+    def benchmark(self, label, data, rounds):
+        drf, fast = JSONRenderer(), ORJSONRenderer()
+        content = fast.render(data)
+        if drf.render(data) != content:
+            raise CommandError(f"{label}: ORJSONRenderer output differs from JSONRenderer")
+
+        drf_time = self.best_of(lambda: drf.render(data), rounds)
+        fast_time = self.best_of(lambda: fast.render(data), rounds)
+        megabytes = len(content) / 1_000_000
+        self.stdout.write(
+            f"{label}: JSONRenderer {drf_time * 1000:.1f} ms ({megabytes / drf_time:.0f} MB/s), "
+            f"ORJSONRenderer {fast_time * 1000:.1f} ms ({megabytes / fast_time:.0f} MB/s), "
+            f"{drf_time / fast_time:.1f}x faster, identical output"
+        )
+
+        self.stdout.write(f"    identity: {len(content):>10,} bytes")
+        for encoding in _supported_encodings():
+            compressed = compress(content, encoding)
+            elapsed = self.best_of(lambda: compress(content, encoding), rounds)
+            self.stdout.write(
+                f"    {encoding + ':':<9} {len(compressed):>10,} bytes "
+                f"({len(compressed) / len(content):.0%}), {elapsed * 1000:.1f} ms"
+            )
+
+    def best_of(self, func, rounds):
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
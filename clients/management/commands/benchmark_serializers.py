@@ -0,0 +1,126 @@
+"""
+Management command to benchmark the compiled row converters against the DRF serializers they replace.
+
+Usage:
+    python manage.py benchmark_serializers [--rows 10000 100000] [--rounds 3] [--serializer patients.serializers.PatientSerializer ...]
+
+Generates synthetic rows for the model of each serializer (no database needed) and times, for the fields a list
+view returns by default, both the previous path (model instances built like the ORM does, then
+`Serializer(instances, many=True).data`) and the compiled path (`values_list(named=True)` tuples, then
+`clients.fast_serializers.RowConverter.convert_many`). Fails when the two do not render to the same JSON bytes.
+"""
+
+import datetime
+import decimal
+import time
+from collections import namedtuple
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.renderers import JSONRenderer
+
+from clients.fast_serializers import compile_serializer
+from clients.sparse_fields import select_fields
+
+
+DEFAULT_SERIALIZERS = [
+    "patients.serializers.PatientSerializer",
+    "pharmacy_module.serializers.MedicineListSerializer",
+    "pharmacy_module.serializers.PharmacyBillSerializer",
+    "ipd_module.serializers.IPDSerializer",
+]
+
+
+class _ListRequest:
+    # Stands in for a list request without query parameters.
+    query_params = {}
+
+
+def _sample_value(field, index):
+    if field.primary_key:
+        return index + 1
+    if field.null and index % 7 == 0:
+        return None
+    if field.is_relation:
+        return index % 50 + 1
+    if field.choices:
+        return field.choices[index % len(field.choices)][0]
+    if isinstance(field, models.DateTimeField):
+        return timezone.now() - datetime.timedelta(minutes=index)
+    if isinstance(field, models.DateField):
+        return datetime.date(2024, 1, 1) + datetime.timedelta(days=index % 365)
+    if isinstance(field, models.BooleanField):
+        return index % 2 == 0
+    if isinstance(field, models.DecimalField):
+        return decimal.Decimal(index % 1000) / 100
+    if isinstance(field, models.FloatField):
+        return index / 3
+    if isinstance(field, models.IntegerField):
+        return index
+    if isinstance(field, models.EmailField):
+        return f"user{index}@example.com"
+    value = f"{field.name} {index}"
+    return value[: field.max_length] if field.max_length else value
+
+
+class Command(BaseCommand):
+    help = "Benchmark list serialization through DRF serializers and through the compiled row converters."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+        parser.add_argument("--rounds", type=int, default=3)
+        parser.add_argument("--serializer", action="append", dest="serializers")
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        for path in options["serializers"] or DEFAULT_SERIALIZERS:
+            serializer_class = import_string(path)
+            names = select_fields(serializer_class, _ListRequest(), skip_heavy=True)
+            converter = compile_serializer(serializer_class, names, keep=("created_at", "id"))
+            if converter is None:
+                self.stdout.write(f"{serializer_class.__name__}: not compilable, skipped")
+                continue
+
+            model = serializer_class.Meta.model
+            concrete = model._meta.concrete_fields
+            row_class = namedtuple("Row", converter.columns)
+            attnames = [field.attname for field in concrete]
+            positions = [
+                attnames.index(model._meta.get_field(column).attname) for column in converter.columns
+            ]
+            context = {"request": None, "sparse_fields": names}
+
+            for count in options["rows"]:
+                rows = [
+                    tuple(_sample_value(field, index) for field in concrete) for index in range(count)
+                ]
+
+                def before():
+                    instances = [model.from_db("default", attnames, row) for row in rows]
+                    return serializer_class(instances, many=True, context=context).data
+
+                def after():
+                    values = [row_class(*(row[position] for position in positions)) for row in rows]
+                    return converter.convert_many(values)
+
+                if renderer.render(before()) != renderer.render(after()):
+                    raise CommandError(f"{serializer_class.__name__}: compiled output differs")
+
+                before_time = self.best_of(before, options["rounds"])
+                after_time = self.best_of(after, options["rounds"])
+                self.stdout.write(
+                    f"{serializer_class.__name__} x {count}: "
+                    f"serializer {before_time * 1000:.0f} ms, compiled {after_time * 1000:.0f} ms, "
+                    f"{before_time / after_time:.1f}x faster, identical output"
+                )
+
+    def best_of(self, func, rounds):
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
@@ -0,0 +1,101 @@
+"""
+This module resolves whether the requesting user is a member and/or an admin of the current tenant.
+
+Functions:
+- `get_membership(user, tenant)`:
+    - Returns a `TenantMembership(member, admin)` tuple for the given user and tenant.
+    - Also used by `clients.helpers.get_tokens_for_user` to embed the membership in the JWT claims.
+
+- `resolve_membership(request)`:
+    - Returns a `TenantMembership(member, admin)` tuple for `(request.user, request.tenant)`.
+    - The result is computed with a single query and cached twice:
+        - on the request itself, so several permission classes on one view share it
+          (`clients.authentication.TenantJWTAuthentication` pre-fills it from the token claims);
+        - in the Django cache for `TENANT_MEMBERSHIP_CACHE_TTL` seconds, so repeat requests skip the query.
+    - `admin` is only `True` when `request.user.is_tenant_admin` is set as well.
+    - Anonymous users and requests without a tenant are neither members nor admins.
+
+- `invalidate_membership(tenant_id)`:
+    - Drops every cached membership of the tenant by bumping its cache version.
+    - Called from `clients.signals` whenever a `UserProfile` or `CustomUser` of the tenant changes.
+
+Dependencies:
+- `cache` from `django.core.cache` for the cross-request cache.
+- `Exists` and `OuterRef` from `django.db.models` for the membership query.
+- `UserProfile` and `CustomUser` models for the membership lookups.
+"""
+
+import uuid
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+
+from clients.models import UserProfile
+from users.models import CustomUser
+
+
+TenantMembership = namedtuple("TenantMembership", ["member", "admin"])
+
+NO_MEMBERSHIP = TenantMembership(member=False, admin=False)
+
+MEMBERSHIP_CACHE_TTL = getattr(settings, "TENANT_MEMBERSHIP_CACHE_TTL", 60)
+
+
+def _version_key(tenant_id):
+    return f"tenant-membership-version:{tenant_id}"
+
+
+def invalidate_membership(tenant_id):
+    if tenant_id is not None:
+        cache.set(_version_key(tenant_id), uuid.uuid4().hex, None)
+
+
+def _query_membership(user, tenant):
+    row = (
+        CustomUser.objects.filter(pk=user.pk)
+        .annotate(
+            in_tenant_profiles=Exists(
+                UserProfile.objects.filter(user=OuterRef("pk"), tenant=tenant)
+            ),
+            in_tenant_users=Exists(
+                CustomUser.objects.filter(username=OuterRef("username"), tenant=tenant)
+            ),
+        )
+        .values_list("in_tenant_profiles", "in_tenant_users")
+        .first()
+    )
+    if row is None:
+        return (False, False)
+    return row
+
+
+def get_membership(user, tenant):
+    version = cache.get(_version_key(tenant.pk), "0")
+    key = f"tenant-membership:{tenant.pk}:{version}:{user.pk}"
+    flags = cache.get(key)
+    if flags is None:
+        flags = _query_membership(user, tenant)
+        cache.set(key, flags, MEMBERSHIP_CACHE_TTL)
+
+    is_member, user_in_tenant = flags
+    return TenantMembership(
+        member=bool(is_member),
+        admin=bool(user.is_tenant_admin and user_in_tenant),
+    )
+
+
+def resolve_membership(request):
+    membership = getattr(request, "_tenant_membership", None)
+    if membership is not None:
+        return membership
+
+    user = getattr(request, "user", None)
+    tenant = getattr(request, "tenant", None)
+    if user is None or tenant is None or not user.is_authenticated:
+        return NO_MEMBERSHIP
+
+    membership = get_membership(user, tenant)
+    request._tenant_membership = membership
+    return membership
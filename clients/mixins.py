@@ -0,0 +1,119 @@
+"""
+This module defines view mixins shared by the tenant apps.
+
+Mixins:
+1. `ReadOnlyFastPathMixin`:
+    - Opts the view out of Django's `ATOMIC_REQUESTS` wrapping and re-applies the same transaction
+      per request, only for unsafe methods (`POST`, `PATCH`, `PUT`, `DELETE`).
+    - Safe methods (`GET`, `HEAD`, `OPTIONS`) run in autocommit mode, so reads no longer pay for
+      `BEGIN`/`COMMIT` or hold a transaction open while the response is serialized.
+    - Writes keep their atomicity; DRF's exception handler still rolls them back on errors.
+
+    Usage:
+    - Put it before `APIView` in the bases of a view: `class PatientView(ReadOnlyFastPathMixin, APIView)`.
+
+2. `TenantListMixin`:
+    - Shared `GET` list handling of the tenant apps, through `list_response(request, queryset, serializer_class)`:
+        - Applies the view's `list_filters` and the `?ordering=` chosen among `list_sort_fields` (see `clients.filters`).
+        - Answers `304 Not Modified` when neither the list nor the related rows the serializer renders changed
+          (see `clients.conditional.ConditionalGetMixin`, which this mixin extends).
+        - Applies the `?fields=`/`?exclude=` selection of the client and leaves out the serializer's `heavy_fields`
+          by default, loading only the matching columns (see `clients.sparse_fields`).
+        - Reads plain rows through the serializer's compiled row converter when it has one
+          (see `clients.fast_serializers`); otherwise joins or prefetches the relations rendered by the
+          serializer (see `clients.eager_loading`).
+        - Streams the whole queryset when the client asks for it (`?format=ndjson` or `?stream=1`, see `clients.streaming`).
+        - Otherwise returns one page of `clients.pagination.KeysetPagination`, ordered on `list_ordering`
+          unless the client chose another ordering.
+    - Adds `NDJSONRenderer` to the view's renderers, so DRF accepts the `ndjson` format.
+    - `list_model` names the listed model, so `clients.checks` can verify that every filtered or sorted column is
+      indexed.
+
+    Usage:
+    - `class IPDListView(ReadOnlyFastPathMixin, TenantListMixin, APIView)` and, in `get`,
+      `return self.list_response(request, ipd, IPDSerializer)`.
+
+Dependencies:
+- `transaction` and `connections` from `django.db` for the per-request transactions.
+- `SAFE_METHODS` from `rest_framework.permissions` to tell reads from writes.
+- `KeysetPagination`, `stream_response`, `compile_serializer`, `setup_eager_loading`, `restrict_columns`
+  and `apply_filters` for the list responses.
+"""
+
+from contextlib import ExitStack
+
+from django.db import connections, transaction
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+
+from .conditional import ConditionalGetMixin
+from .eager_loading import setup_eager_loading
+from .fast_serializers import compile_serializer
+from .filters import apply_filters, get_ordering
+from .pagination import KeysetPagination
+from .sparse_fields import restrict_columns, select_fields
+from .streaming import NDJSONRenderer, stream_response, wants_stream
+
+
+def _atomic_request_aliases():
+    return [
+        alias
+        for alias in connections
+        if connections.settings[alias].get("ATOMIC_REQUESTS")
+    ]
+
+
+class ReadOnlyFastPathMixin:
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        for alias in _atomic_request_aliases():
+            view = transaction.non_atomic_requests(using=alias)(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+
+        with ExitStack() as stack:
+            for alias in _atomic_request_aliases():
+                stack.enter_context(transaction.atomic(using=alias))
+            return super().dispatch(request, *args, **kwargs)
+
+
+class TenantListMixin(ConditionalGetMixin):
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+    list_model = None
+    list_ordering = ("created_at", "id")
+    list_filters = ()
+    list_sort_fields = ()
+
+    def list_response(self, request, queryset, serializer_class):
+        queryset = apply_filters(queryset, self.list_filters, request)
+        ordering, descending = get_ordering(request, self.list_sort_fields, self.list_ordering)
+
+        not_modified = self.not_modified(request, queryset, many=True, serializer_class=serializer_class)
+        if not_modified is not None:
+            return not_modified
+
+        names = select_fields(serializer_class, request, skip_heavy=True)
+        context = {"request": request, "sparse_fields": names}
+        converter = compile_serializer(serializer_class, names, keep=ordering)
+        if converter is not None:
+            queryset = queryset.values_list(*converter.columns, named=True)
+            row_serializer = converter
+        else:
+            queryset, sources = restrict_columns(queryset, serializer_class, names, keep=ordering)
+            queryset = setup_eager_loading(queryset, serializer_class, sources)
+            row_serializer = serializer_class(context=context)
+
+        if wants_stream(request):
+            return stream_response(request, queryset, row_serializer)
+
+        paginator = KeysetPagination(ordering, descending)
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        if converter is not None:
+            data = converter.convert_many(page)
+        else:
+            data = serializer_class(page, many=True, context=context).data
+        return paginator.get_paginated_response(data)
@@ -53,6 +53,16 @@ class Blog(models.Model):
     description = models.TextField(blank=True, null=True)
     created_at = models.DateField(auto_now_add=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="blog_keyset_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.title}-{self.user}"
 
@@ -62,4 +72,4 @@ class Tenant(TenantMixin):
     address = models.CharField(max_length=255, blank=True, null=True)
     registration_number = models.CharField(max_length=255, blank=True, null=True)
     created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    auto_create_schema = True  # Automatically create schema for new tenants
\ No newline at end of file
+    auto_create_schema = True  # Automatically create schema for new tenants
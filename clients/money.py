@@ -0,0 +1,148 @@
+"""
+This module moves the money amounts of the bill models from text columns to numeric ones, without downtime.
+
+The amounts were stored in `CharField`/`TextField` columns (e.g. `PharmacyBill.net_amount`), so totals had to be
+computed in Python after fetching every row. Each of them now has a `DecimalField(max_digits=12, decimal_places=2)`
+shadow column named `<field>_decimal` (e.g. `net_amount_decimal`), filled in three steps:
+1. Dual-write: every save through the model (`MoneyColumnsMixin.save`) or the bulk endpoints (`clients.bulk`)
+   also writes the parsed amount to the shadow column. `QuerySet.update()` calls on the legacy columns must set
+   the shadow columns themselves.
+2. Backfill: `python manage.py backfill_money` fills the shadow columns of the existing rows, batch by batch, and
+   `--verify` reports the rows whose shadow column does not match the legacy value.
+3. Switch: once verified, `MONEY_DECIMAL_READS = True` (settings) moves the reads to the shadow columns. Everything
+   that reads amounts goes through `money_field`/`read_money`/`sum_money`, which read the legacy columns (parsed in
+   Python) until then: `sum_money` totals, the dashboard rollups and their rebuild (`dashboard.rollups`, which then
+   aggregates in SQL) and the patient ledger (`patients.ledger`). Only the KPI views (`dashboard.kpis`) read the
+   shadow columns unconditionally, being SQL.
+The legacy columns stay the API representation; the shadow columns are exposed read-only next to them.
+
+Legacy values are parsed leniently: surrounding spaces, thousands separators and currency markers (`₹`, `Rs.`,
+`INR`, `/-`) are ignored, and a trailing decimal point (`12.`) is accepted. Values that still are not numbers, or
+do not fit the column, are stored as `NULL`.
+
+Classes:
+1. `MoneyColumnsMixin`:
+    - Inherits from `ShadowColumnsMixin` provided by `clients.shadow_columns`: `save()` writes the shadow columns,
+      also when only the legacy columns are in `update_fields`.
+
+    Usage:
+    ```
+    class Billing(MoneyColumnsMixin, models.Model):
+        amount = models.CharField(max_length=50, blank=True, null=True)
+        amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    ```
+
+Functions:
+- `parse_money(value)`:
+    - Returns the `Decimal` amount (two decimal places) of a legacy value, or `None`.
+
+- `money_columns(model)`:
+    - Returns the `(legacy_field, shadow_field, parse_money)` triples of the model.
+
+- `sync_money_columns(instances, fields=None)`:
+    - Writes the shadow columns of the instances from their legacy values (only for the legacy `fields` when given)
+      and returns the names of the shadow columns written. Used by the bulk writes.
+
+- `decimal_reads()`:
+    - Returns whether `MONEY_DECIMAL_READS` is on.
+
+- `money_field(model, field)`:
+    - Returns the column to read the `field` amounts of `model` from: the shadow column once `MONEY_DECIMAL_READS`
+      is on, the legacy column before (and for fields without a shadow column).
+
+- `read_money(instance, field)`:
+    - Returns the `Decimal` amount of `field` of an instance, read from `money_field`, or `None`.
+
+- `sum_money(queryset, field)`:
+    - Returns the total of the `field` amounts of the queryset, as a `Decimal`.
+
+Dependencies:
+- `decimal` for the parsing and rounding.
+- `ShadowColumnsMixin` and `sync_shadow_columns` from `clients.shadow_columns` for the dual-write.
+- `Sum` from `django.db.models` for the SQL totals.
+"""
+
+import re
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Sum
+
+from .shadow_columns import ShadowColumnsMixin, sync_shadow_columns
+
+
+SHADOW_SUFFIX = "_decimal"
+CENTS = Decimal("0.01")
+MAX_AMOUNT = Decimal("9999999999.99")
+
+_CURRENCY_RE = re.compile(r"(₹|rs\.?|inr|/-|,|\s)", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"-?\d+(\.\d*)?|-?\.\d+")
+
+
+def parse_money(value):
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        text = str(value)
+    else:
+        text = _CURRENCY_RE.sub("", str(value))
+    if not _NUMBER_RE.fullmatch(text):
+        return None
+    try:
+        amount = Decimal(text).quantize(CENTS, rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        return None
+    if abs(amount) > MAX_AMOUNT:
+        return None
+    return amount
+
+
+@lru_cache(maxsize=None)
+def money_columns(model):
+    columns = []
+    for field in model._meta.concrete_fields:
+        if isinstance(field, models.DecimalField) and field.name.endswith(SHADOW_SUFFIX):
+            columns.append((field.name[: -len(SHADOW_SUFFIX)], field.name, parse_money))
+    return tuple(columns)
+
+
+def sync_money_columns(instances, fields=None):
+    return sync_shadow_columns(instances, money_columns, fields)
+
+
+class MoneyColumnsMixin(ShadowColumnsMixin):
+    @classmethod
+    def shadow_columns(cls):
+        return (*super().shadow_columns(), *money_columns(cls))
+
+
+def decimal_reads():
+    return getattr(settings, "MONEY_DECIMAL_READS", False)
+
+
+def money_field(model, field):
+    shadow_field = f"{field}{SHADOW_SUFFIX}"
+    if decimal_reads() and (field, shadow_field, parse_money) in money_columns(model):
+        return shadow_field
+    return field
+
+
+def read_money(instance, field):
+    # `parse_money` also normalizes the `Decimal` of a shadow column.
+    return parse_money(getattr(instance, money_field(type(instance), field)))
+
+
+def sum_money(queryset, field):
+    column = money_field(queryset.model, field)
+    if column != field:
+        total = queryset.aggregate(total=Sum(column))["total"]
+        return total if total is not None else Decimal("0.00")
+
+    total = Decimal("0.00")
+    for value in queryset.values_list(field, flat=True).iterator():
+        amount = parse_money(value)
+        if amount is not None:
+            total += amount
+    return total
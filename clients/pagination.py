@@ -0,0 +1,196 @@
+"""
+This module defines the keyset (cursor) pagination shared by the list views of the tenant apps.
+
+Classes:
+1. `KeysetPagination`:
+    - Inherits from `BasePagination` provided by `rest_framework`.
+    - Orders the queryset newest first on `ordering` (default `("created_at", "id")`, descending,
+      rows without `created_at` last), so the order is stable even when many rows share the same date.
+      With `descending=False` the order is reversed (ascending, rows without a value first), so the same
+      index serves both directions.
+    - Pages are selected with a `WHERE (created_at, id) < (last created_at, last id)` condition
+      instead of an `OFFSET`, so with the matching index every page costs the same however deep the client scrolls.
+    - Query parameters:
+        - `cursor`: Opaque cursor taken from the `next` or `previous` link of the previous response.
+          Every position value is converted with its ordering field (`Field.to_python`); a cursor that does not
+          decode, or whose values do not fit the fields, is answered with `404 Invalid cursor`.
+        - `page_size`: Number of rows per page, defaults to `KEYSET_PAGE_SIZE` and is capped at
+          `KEYSET_MAX_PAGE_SIZE` (both in the settings).
+    - Methods:
+        - `paginate_queryset(queryset, request, view=None)`:
+            - Returns the rows of the requested page as a list.
+        - `get_paginated_response(data)`:
+            - Returns `{"data": [...], "next": <url or null>, "previous": <url or null>}`.
+
+    Usage:
+    ```
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = AppointmentSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
+    ```
+
+Dependencies:
+- `BasePagination` from `rest_framework` for the pagination interface.
+- `replace_query_param` and `remove_query_param` from `rest_framework.utils.urls` for the `next`/`previous` links.
+"""
+
+import base64
+import datetime
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering=("created_at", "id"), descending=True):
+        self.ordering = tuple(ordering)
+        self.descending = descending
+        self.page_size = getattr(settings, "KEYSET_PAGE_SIZE", 50)
+        self.max_page_size = getattr(settings, "KEYSET_MAX_PAGE_SIZE", 500)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({"p": position, "r": reverse}, default=str)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            position = payload["p"]
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+            position = [self.to_python(field, value) for field, value in zip(self.ordering, position)]
+            return position, bool(payload["r"])
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def to_python(self, field, value):
+        # The cursor is client input: only scalars of the field's type reach the WHERE clause.
+        if value is None:
+            if not self.nullable[field]:
+                raise ValueError
+            return None
+        if isinstance(value, (list, dict)):
+            raise ValueError
+        return self.fields[field].to_python(value)
+
+    def order_by(self, reverse):
+        descending = self.descending != reverse
+        ordering = []
+        for field in self.ordering:
+            if not self.nullable[field]:
+                ordering.append(F(field).desc() if descending else F(field).asc())
+            elif descending:
+                ordering.append(F(field).desc(nulls_last=True))
+            else:
+                ordering.append(F(field).asc(nulls_first=True))
+        return ordering
+
+    def _past(self, field, value, reverse):
+        # Rows strictly after `value` in the page direction; NULLs sort last in descending order.
+        descending = self.descending != reverse
+        if value is None:
+            return Q(pk__in=[]) if descending else Q(**{f"{field}__isnull": False})
+        if not descending:
+            return Q(**{f"{field}__gt": value})
+        past = Q(**{f"{field}__lt": value})
+        if self.nullable[field]:
+            past |= Q(**{f"{field}__isnull": True})
+        return past
+
+    def _equal(self, field, value):
+        if value is None:
+            return Q(**{f"{field}__isnull": True})
+        return Q(**{field: value})
+
+    def seek(self, position, reverse):
+        condition = Q(pk__in=[])
+        prefix = Q()
+        for field, value in zip(self.ordering, position):
+            condition |= prefix & self._past(field, value, reverse)
+            prefix &= self._equal(field, value)
+        return condition
+
+    def position_of(self, row):
+        position = []
+        for field in self.ordering:
+            value = getattr(row, field)
+            if isinstance(value, (datetime.date, datetime.datetime)):
+                value = value.isoformat()
+            position.append(value)
+        return position
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.fields = {field: queryset.model._meta.get_field(field) for field in self.ordering}
+        self.nullable = {field: model_field.null for field, model_field in self.fields.items()}
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.order_by(reverse))
+        if position is not None:
+            queryset = queryset.filter(self.seek(position, reverse))
+
+        rows = list(queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.first_position = self.position_of(rows[0]) if rows else None
+        self.last_position = self.position_of(rows[-1]) if rows else None
+        return rows
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.last_position is None:
+            return remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.last_position, False)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.first_position is None:
+            return remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.first_position, True)
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "data": data,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+            }
+        )
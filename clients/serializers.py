@@ -20,13 +20,13 @@ Serializers:
 
 3. `BlogSerializer`:
     - Serializer for blog management.
-    - Inherits from `serializers.ModelSerializer`.
+    - Inherits from `SparseFieldsetMixin` and `serializers.ModelSerializer`.
     - Fields: `title`, `description`.
     - Used for creating and updating blog posts.
 
 4. `UserSerializer`:
     - Serializer for user profile details.
-    - Inherits from `serializers.ModelSerializer`.
+    - Inherits from `SparseFieldsetMixin` and `serializers.ModelSerializer`.
     - Fields: `__all__`.
     - Provides full serialization for the `UserProfile` model, including all its fields.
 
@@ -35,11 +35,13 @@ Dependencies:
 - `UserProfile`, `Blog` from the application's models for data representation and validation.
 - `CustomUser` from `users.models` for user-related operations.
 - `ValidationError` from `rest_framework.exceptions` for handling validation errors during serialization.
+- `SparseFieldsetMixin` from `clients.sparse_fields` for the `?fields=`/`?exclude=` query parameters.
 
 This file provides serializers used for handling user registration and login, blog post management, and user profile details in the application.
 """
 
 from rest_framework import serializers
+from .sparse_fields import SparseFieldsetMixin
 from .models import UserProfile, Blog
 from users.models import Tenant, CustomUser
 from rest_framework.exceptions import ValidationError
@@ -95,7 +97,7 @@ class UserLoginSerializer(serializers.ModelSerializer):
         fields = ["email", "password"]
 
 
-class BlogSerializer(serializers.ModelSerializer):
+class BlogSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Blog
         fields = ["id", "title", "description"]
@@ -112,7 +114,7 @@ class CustomUserSerializer(serializers.ModelSerializer):
         ]  # Include fields you want to serialize
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = CustomUserSerializer()
 
     class Meta:
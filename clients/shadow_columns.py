@@ -0,0 +1,55 @@
+"""
+This module holds what the typed shadow columns of `clients.money` and `clients.dates` have in common.
+
+A legacy text column (e.g. `Billing.amount`) is moved to a typed shadow column (e.g. `amount_decimal`) without
+downtime by writing both on every save (dual-write), then filling the existing rows with a backfill command
+(`clients.management.base.ShadowBackfillCommand`). Each kind of shadow column is described by a function returning
+the `(legacy_field, shadow_field, parser)` triples of a model, e.g. `clients.money.money_columns`; `parser` turns a
+legacy value into the shadow value, or `None` when it cannot.
+
+Classes:
+1. `ShadowColumnsMixin`:
+    - Model mixin whose `save()` writes the shadow columns returned by `shadow_columns()`, also when only the
+      legacy columns are in `update_fields`.
+    - `MoneyColumnsMixin` and `DateColumnsMixin` extend `shadow_columns()` with their own triples, calling `super()`,
+      so a model can use both.
+
+Functions:
+- `sync_shadow_columns(instances, columns, fields=None)`:
+    - Writes the shadow columns of the instances from their legacy values, `columns(model)` giving the triples
+      (only for the legacy `fields` when given), and returns the names of the shadow columns written.
+"""
+
+
+def _sync_instance(instance, columns, fields, written):
+    for legacy_field, shadow_field, parser in columns:
+        if fields is not None and legacy_field not in fields:
+            continue
+        if legacy_field not in instance.__dict__:
+            continue  # Deferred and therefore unchanged.
+        setattr(instance, shadow_field, parser(getattr(instance, legacy_field)))
+        if shadow_field not in written:
+            written.append(shadow_field)
+
+
+def sync_shadow_columns(instances, columns, fields=None):
+    written = []
+    for instance in instances:
+        _sync_instance(instance, columns(type(instance)), fields, written)
+    return written
+
+
+class ShadowColumnsMixin:
+    @classmethod
+    def shadow_columns(cls):
+        return ()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        written = []
+        if update_fields is not None:
+            _sync_instance(self, self.shadow_columns(), set(update_fields), written)
+            kwargs["update_fields"] = {*update_fields, *written}
+        else:
+            _sync_instance(self, self.shadow_columns(), None, written)
+        return super().save(*args, **kwargs)
@@ -0,0 +1,110 @@
+"""
+This module contains signal handlers that keep the cached tenant memberships up to date.
+
+Signal Handlers:
+1. `invalidate_membership_for_profile`:
+    - Connected to the `post_save` and `post_delete` signals of the `UserProfile` model.
+    - Invalidates the cached memberships of the profile's tenant.
+
+2. `invalidate_membership_for_user`:
+    - Connected to the `post_save` and `post_delete` signals of the `CustomUser` model.
+    - Invalidates the cached memberships of the user's tenant, which covers changes to `is_tenant_admin`.
+
+3. `track_token_claim_changes`:
+    - Connected to the `pre_save` signal of the `CustomUser` model.
+    - Flags the user for token revocation when it is being deactivated or its `is_tenant_admin` changes.
+    - Compares with the values the instance was loaded with (`CustomUser.from_db`), and skips saves whose
+      `update_fields` leave both fields out, so a save costs no extra query.
+
+4. `revoke_tokens_for_user`, `revoke_tokens_for_deleted_user` and `revoke_tokens_for_profile`:
+    - Connected to `post_save`/`post_delete` of `CustomUser` and `post_delete` of `UserProfile`.
+    - Adds the user to the JWT revocation list, so the claims in previously issued tokens stop being trusted.
+
+5. `bump_conditional_version`:
+    - Connected to `post_save`, `post_delete` and `clients.bulk.post_bulk_write` of the models behind the
+      conditional views (`clients.conditional.CONDITIONAL_MODELS`), so other writes do not touch the cache.
+    - Replaces the model's version token used by `clients.conditional`, right away and again once the
+      transaction commits, so no `ETag` computed while the change was in flight stays valid.
+
+Dependencies:
+- `pre_save`, `post_save` and `post_delete` signals from `django.db.models.signals`.
+- `invalidate_membership` from `clients.membership` to drop the cached memberships.
+- `revoke_user_tokens` from `clients.authentication` to revoke issued tokens.
+- `bump_version` and `conditional_models` from `clients.conditional` for the conditional GET validators.
+- `post_bulk_write` from `clients.bulk`, sent by the bulk write endpoints.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from users.models import CustomUser
+from .models import UserProfile
+from .membership import invalidate_membership
+from .authentication import revoke_user_tokens
+from .conditional import bump_version, conditional_models
+from .bulk import post_bulk_write
+
+
+@receiver([post_save, post_delete], sender=UserProfile)
+def invalidate_membership_for_profile(sender, instance, **kwargs):
+    invalidate_membership(instance.tenant_id)
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def invalidate_membership_for_user(sender, instance, **kwargs):
+    invalidate_membership(instance.tenant_id)
+
+
+TOKEN_CLAIM_FIELDS = ("is_active", "is_tenant_admin")
+
+
+@receiver(pre_save, sender=CustomUser)
+def track_token_claim_changes(sender, instance, update_fields=None, **kwargs):
+    instance._revoke_tokens = False
+    if instance.pk is None or (update_fields is not None and not set(TOKEN_CLAIM_FIELDS) & set(update_fields)):
+        return
+
+    # Deferred fields that were never assigned cannot have changed.
+    current = {name: instance.__dict__[name] for name in TOKEN_CLAIM_FIELDS if name in instance.__dict__}
+    previous = getattr(instance, "_loaded_values", {})
+    if any(name not in previous for name in current):
+        # Not loaded from the database with these fields (e.g. `CustomUser(pk=...)`): compare with the stored row.
+        previous = CustomUser.objects.filter(pk=instance.pk).values(*TOKEN_CLAIM_FIELDS).first()
+        if previous is None:
+            return
+    instance._revoke_tokens = current.get("is_active") is False or (
+        "is_tenant_admin" in current and current["is_tenant_admin"] != previous["is_tenant_admin"]
+    )
+
+
+@receiver(post_save, sender=CustomUser)
+def revoke_tokens_for_user(sender, instance, **kwargs):
+    if getattr(instance, "_revoke_tokens", False):
+        revoke_user_tokens(instance.pk)
+    if hasattr(instance, "_loaded_values"):
+        # The saved values are what the next save compares with.
+        instance._loaded_values.update(
+            (name, instance.__dict__[name]) for name in TOKEN_CLAIM_FIELDS if name in instance.__dict__
+        )
+
+
+@receiver(post_delete, sender=CustomUser)
+def revoke_tokens_for_deleted_user(sender, instance, **kwargs):
+    revoke_user_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=UserProfile)
+def revoke_tokens_for_profile(sender, instance, **kwargs):
+    revoke_user_tokens(instance.user_id)
+
+
+def bump_conditional_version(sender, using, **kwargs):
+    bump_version(sender)
+    transaction.on_commit(partial(bump_version, sender), using=using)
+
+
+for model in conditional_models():
+    for signal in (post_save, post_delete, post_bulk_write):
+        signal.connect(bump_conditional_version, sender=model)
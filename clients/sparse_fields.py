@@ -0,0 +1,149 @@
+"""
+This module lets API clients choose the fields of the serialized rows (sparse fieldsets), and loads only
+the matching columns from the database.
+
+Query parameters:
+- `fields`: Comma separated fields to return, e.g. `?fields=id,name,phone`.
+- `exclude`: Comma separated fields to leave out, e.g. `?exclude=notes,remarks`.
+Unknown field names are rejected with a `400` response.
+
+Heavy fields (base64 images stored in `TextField`s) are listed in the `heavy_fields` attribute of the serializer.
+List responses leave them out unless they are named in `?fields=`; detail responses keep them.
+
+Classes:
+1. `SparseFieldsetMixin`:
+    - Serializer mixin that drops the fields not selected by the request (taken from the serializer context).
+    - Only the top level serializer is filtered; nested serializers keep their fields.
+
+    Usage:
+    ```
+    class EmployeeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+        heavy_fields = ("image", "pan_image")
+    ```
+
+Functions:
+- `select_fields(serializer_class, request, skip_heavy=False)`:
+    - Returns the names of the fields selected by the request, or `None` when every field is selected.
+
+- `restrict_columns(queryset, serializer_class, names, keep=())`:
+    - Loads only the columns behind `names` (every field of the serializer when `None`), plus the primary key
+      and `keep`, with `.only()`, so columns the serializer never renders are not read either. Fields backed by
+      several columns list them in a `columns` attribute (see `blobs.fields.BlobField`). When a selected field is
+      not backed by a model field (e.g. a `SerializerMethodField`), falls back to `.defer()` of the columns of the
+      fields that were left out.
+    - Returns the queryset and the sources of the selected fields, `None` for all of them (used to skip the joins
+      of dropped relations).
+
+Dependencies:
+- `ValidationError` from `rest_framework.exceptions` for unknown field names.
+- `FieldDoesNotExist` from `django.core.exceptions` to map serializer fields to model fields.
+"""
+
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+class SparseFieldsetMixin:
+    heavy_fields = ()
+
+    def _is_sparse_root(self):
+        parent = getattr(self, "parent", None)
+        if parent is None:
+            return True
+        return isinstance(parent, serializers.ListSerializer) and parent.parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_sparse_root():
+            return fields
+
+        if "sparse_fields" in self.context:
+            names = self.context["sparse_fields"]
+        elif self.context.get("request") is not None:
+            names = select_fields(type(self), self.context["request"])
+        else:
+            names = None
+
+        if names is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in names}
+
+
+@lru_cache(maxsize=None)
+def _serializer_fields(serializer_class):
+    # A context-free instance returns every field; only names and sources are read from it.
+    return dict(serializer_class().fields)
+
+
+def _parse(request, param):
+    value = request.query_params.get(param)
+    if value is None:
+        return None
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def select_fields(serializer_class, request, skip_heavy=False):
+    available = list(_serializer_fields(serializer_class))
+    fields = _parse(request, FIELDS_PARAM)
+    exclude = _parse(request, EXCLUDE_PARAM)
+
+    unknown = [name for name in (fields or []) + (exclude or []) if name not in available]
+    if unknown:
+        raise ValidationError({"fields": [f"Unknown field: {name}" for name in unknown]})
+
+    if fields is not None:
+        names = [name for name in available if name in fields]
+    elif skip_heavy:
+        heavy = getattr(serializer_class, "heavy_fields", ())
+        names = [name for name in available if name not in heavy]
+    else:
+        names = list(available)
+
+    if exclude:
+        names = [name for name in names if name not in exclude]
+    if len(names) == len(available):
+        return None
+    return tuple(names)
+
+
+def _columns(model, field):
+    # The concrete model fields behind a serializer field, `None` when they are unknown (e.g. a method field).
+    if hasattr(field, "columns"):
+        return tuple(field.columns)
+    source = field.source
+    if not source or source == "*" or "." in source:
+        return None
+    try:
+        model_field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+    return (model_field.name,) if model_field.concrete else ()
+
+
+def restrict_columns(queryset, serializer_class, names, keep=()):
+    fields = _serializer_fields(serializer_class)
+    selected = tuple(fields) if names is None else names
+    sources = None if names is None else {fields[name].source for name in names}
+
+    model = queryset.model
+    columns = [_columns(model, fields[name]) for name in selected]
+    if None not in columns:
+        only = [model._meta.pk.name, *keep, *(column for group in columns for column in group)]
+        return queryset.only(*dict.fromkeys(only)), sources
+
+    loaded = {model._meta.pk.name, *keep, *(column for group in columns if group for column in group)}
+    deferred = [
+        column
+        for name, field in fields.items()
+        if name not in selected
+        for column in _columns(model, field) or ()
+        if column not in loaded
+    ]
+    return queryset.defer(*dict.fromkeys(deferred)), sources
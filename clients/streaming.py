@@ -0,0 +1,109 @@
+"""
+This module streams whole querysets as JSON or NDJSON, for clients that export complete tables.
+
+Classes:
+1. `NDJSONRenderer`:
+    - Inherits from `BaseRenderer` provided by `rest_framework`.
+    - Registers the `ndjson` format (`?format=ndjson` or `Accept: application/x-ndjson`) with DRF's content negotiation.
+    - Streamed lists never reach it; it renders the other responses of the view (e.g. errors) as a single line.
+
+Functions:
+- `wants_stream(request)`:
+    - Returns `True` when the request selected the `ndjson` format or passed `?stream=1`.
+
+- `stream_response(request, queryset, serializer)`:
+    - Iterates the queryset with a server-side cursor (`.iterator(chunk_size=STREAM_CHUNK_SIZE)`), converts
+      it row by row with `serializer.to_representation` (a serializer instance or a
+      `clients.fast_serializers.RowConverter`) and returns a `StreamingHttpResponse`, so memory stays flat
+      however many rows are exported.
+    - `ndjson` emits one JSON object per line; `?stream=1` emits the usual `{"data": [...]}` document.
+    - Rows are streamed in primary key order.
+    - Under ASGI the rows are produced in the request's sync thread (the one holding its database connection),
+      chunk by chunk, instead of letting Django buffer a synchronous iterator in memory.
+
+Dependencies:
+- `StreamingHttpResponse` from `django.http` for the streamed body.
+- `sync_to_async` from `asgiref.sync` for streaming under ASGI.
+- `JSONEncoder` from `rest_framework.utils.encoders` to encode dates and decimals like DRF does.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = NDJSON_MEDIA_TYPE
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return (json.dumps(data, cls=JSONEncoder, ensure_ascii=False) + "\n").encode()
+
+
+def _is_ndjson(request):
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    return accepted_renderer is not None and accepted_renderer.format == NDJSONRenderer.format
+
+
+def wants_stream(request):
+    return _is_ndjson(request) or request.query_params.get("stream") in ("1", "true")
+
+
+def _encode(row):
+    return json.dumps(row, cls=JSONEncoder, ensure_ascii=False)
+
+
+def _stream_rows(queryset, serializer, ndjson, chunk_size):
+    if not ndjson:
+        yield '{"data": ['
+
+    buffer = []
+    separator = ""
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        row = _encode(serializer.to_representation(obj))
+        if ndjson:
+            buffer.append(row + "\n")
+        else:
+            buffer.append(separator + row)
+            separator = ","
+        if len(buffer) >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+
+    if buffer:
+        yield "".join(buffer)
+    if not ndjson:
+        yield "]}"
+
+
+async def _stream_rows_async(rows):
+    # Every chunk is produced in the request's thread, which owns its database connection.
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while True:
+        chunk = await next_chunk(rows, None)
+        if chunk is None:
+            break
+        yield chunk
+
+
+def stream_response(request, queryset, serializer):
+    ndjson = _is_ndjson(request)
+    chunk_size = getattr(settings, "STREAM_CHUNK_SIZE", 500)
+    rows = _stream_rows(queryset.order_by("pk"), serializer, ndjson, chunk_size)
+
+    if isinstance(request._request, ASGIRequest):
+        rows = _stream_rows_async(rows)
+
+    content_type = NDJSON_MEDIA_TYPE if ndjson else "application/json"
+    return StreamingHttpResponse(rows, content_type=content_type)
@@ -0,0 +1,104 @@
+"""
+Helpers for tests of the tenant APIs.
+
+Classes:
+1. `TenantAPITestCase`:
+    - `TenantTestCase` of `django_tenants` (a `test` tenant schema, cloned from the migrated template schema like
+      a real tenant) with a `TenantClient` and two users of the tenant: `self.admin` (tenant admin) and
+      `self.member` (member through a `UserProfile`).
+    - `auth_headers(user)`: The `Authorization` header of a tenant JWT of the user, as `client.get()` kwargs.
+    - `assert_list_query_count_constant(url, user=None, params=None)`: Fetches the list endpoint with several
+      page sizes, checks every response is `200` and that the query count does not change.
+
+    Usage:
+    ```
+    class IPDListTests(TenantAPITestCase):
+        def test_list_query_count(self):
+            IPD.objects.bulk_create([IPD(tenant=self.tenant, patient=patient) for _ in range(12)])
+            self.assert_list_query_count_constant("/api/ipd/ipd")
+    ```
+
+Functions:
+- `assert_constant_query_count(fetch_page, page_sizes=(1, 10, 50), using="default")`:
+    - Calls `fetch_page(page_size)` for every page size and counts the queries it issues.
+    - Raises `AssertionError` when the count changes with the page size, i.e. when the serializer
+      loads related objects row by row instead of through `clients.eager_loading`.
+    - Returns the query count of every page size.
+
+    Usage:
+    ```
+    assert_constant_query_count(
+        lambda size: self.client.get("/ipd/list", {"page_size": size}, **auth_headers)
+    )
+    ```
+
+Dependencies:
+- `CaptureQueriesContext` from `django.test.utils` for counting queries.
+- `TenantTestCase` and `TenantClient` from `django_tenants.test` for the tenant schema and its requests.
+- `ensure_template_schema` from `users.provisioning`, since test tenants are cloned from the template schema.
+- `get_tokens_for_user` from `clients.helpers` for the JWTs.
+"""
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+from django_tenants.test.cases import TenantTestCase
+from django_tenants.test.client import TenantClient
+
+from clients.helpers import get_tokens_for_user
+from clients.models import UserProfile
+from users.models import CustomUser
+from users.provisioning import ensure_template_schema
+
+
+def assert_constant_query_count(fetch_page, page_sizes=(1, 10, 50), using=DEFAULT_DB_ALIAS):
+    counts = {}
+    for page_size in page_sizes:
+        with CaptureQueriesContext(connections[using]) as context:
+            fetch_page(page_size)
+        counts[page_size] = len(context.captured_queries)
+
+    if len(set(counts.values())) > 1:
+        queries = "\n".join(query["sql"] for query in context.captured_queries)
+        raise AssertionError(
+            f"Query count depends on the page size: {counts}\n"
+            f"Queries for page size {page_sizes[-1]}:\n{queries}"
+        )
+    return counts
+
+
+class TenantAPITestCase(TenantTestCase):
+    @classmethod
+    def sync_shared(cls):
+        super().sync_shared()
+        # TENANT_CREATION_FAKES_MIGRATIONS: the test schema is cloned from the template.
+        ensure_template_schema()
+
+    @classmethod
+    def setup_tenant(cls, tenant):
+        tenant.name = "Test hospital"
+
+    def setUp(self):
+        super().setUp()
+        self.client = TenantClient(self.tenant)
+        self.admin = self.create_user("admin@example.com", is_tenant_admin=True)
+        self.member = self.create_user("member@example.com")
+
+    def create_user(self, email, is_tenant_admin=False):
+        user = CustomUser.objects.create_user(
+            email=email, tenant=self.tenant, username=email, is_tenant_admin=is_tenant_admin
+        )
+        UserProfile.objects.create(user=user, tenant=self.tenant)
+        return user
+
+    def auth_headers(self, user):
+        access = get_tokens_for_user(user, self.tenant)["access"]
+        return {"HTTP_AUTHORIZATION": f"Bearer {access}"}
+
+    def assert_list_query_count_constant(self, url, user=None, params=None):
+        headers = self.auth_headers(user or self.admin)
+
+        def fetch_page(page_size):
+            response = self.client.get(url, {**(params or {}), "page_size": page_size}, **headers)
+            self.assertEqual(response.status_code, 200, response.content)
+
+        return assert_constant_query_count(fetch_page)
@@ -1 +1,379 @@
-# Create your tests here.
+import datetime
+import zoneinfo
+from decimal import Decimal
+
+from django.db import models
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from appointments_list.models import Appointment
+from appointments_list.serializers import AppointmentSerializer
+from billing_counter.serializers import BillingSerializer
+from clients.testing import TenantAPITestCase
+from dashboard.serializers import DashboardStatsSerializer
+from ipd_module.serializers import IPDBillSerializer, IPDSerializer
+from opd_module.serializers import OPDSerializer
+from pathology_module.serializers import PathologyBillSerializer, PathologySerializer
+from patients.serializers import PatientSerializer
+from pharmacy_module.serializers import MedicineListSerializer, PharmacyBillSerializer, PurchaseMedicineSerializer
+from radiology_module.serializers import RadiologyBillSerializer, RadiologySerializer
+from staff_management.serializers import EmployeeSerializer, RoleSerializer
+from users.models import CustomUser, Tenant
+
+from .dates import parse_date, parse_timestamp
+from .fast_serializers import compile_serializer
+from .models import Blog
+from .money import MAX_AMOUNT, parse_money
+from .renderers import ORJSONRenderer
+from .serializers import BlogSerializer
+from .shadow_columns import ShadowColumnsMixin
+from .sparse_fields import _serializer_fields, select_fields
+
+ROWS = 12
+
+
+class BlogListQueryCountTests(TenantAPITestCase):
+    def test_blog_list(self):
+        Blog.objects.bulk_create(
+            Blog(user=self.admin, tenant=self.tenant, title=f"Post {index}") for index in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/all-blogs")
+
+
+def _filled_value(field, shadow_parsers, index):
+    # A non-null value of the field's type, parseable by the shadow column parser of legacy text fields.
+    if field.choices:
+        return field.choices[-1][0]
+    parser = shadow_parsers.get(field.name)
+    if parser is parse_money:
+        return "₹1,234.50"
+    if parser is parse_date:
+        return "31/12/2025"
+    if parser is parse_timestamp:
+        return "2025-12-31 10:15:30"
+    if isinstance(field, models.DecimalField):
+        return Decimal("1234.56")
+    if isinstance(field, models.DateTimeField):
+        return timezone.make_aware(datetime.datetime(2025, 3, 1, 9, 30, 15, 123456))
+    if isinstance(field, models.DateField):
+        return datetime.date(2025, 3, 1)
+    if isinstance(field, models.BooleanField):
+        return True
+    if isinstance(field, models.IntegerField):
+        return 7
+    if isinstance(field, models.FloatField):
+        return 2.5
+    if isinstance(field, models.JSONField):
+        return {"key": "value"}
+    text = f"{index} {field.name} ü"
+    return text[: field.max_length] if field.max_length else text
+
+
+class CompiledConverterTests(TenantAPITestCase):
+    # Every serializer of a `TenantListMixin` list view.
+    LIST_SERIALIZERS = (
+        AppointmentSerializer,
+        BillingSerializer,
+        BlogSerializer,
+        DashboardStatsSerializer,
+        EmployeeSerializer,
+        IPDBillSerializer,
+        IPDSerializer,
+        MedicineListSerializer,
+        OPDSerializer,
+        PathologyBillSerializer,
+        PathologySerializer,
+        PatientSerializer,
+        PharmacyBillSerializer,
+        PurchaseMedicineSerializer,
+        RadiologyBillSerializer,
+        RadiologySerializer,
+        RoleSerializer,
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.related = {Tenant: self.tenant, CustomUser: self.admin}
+        self.row_count = 0
+
+    def create_row(self, model, filled):
+        # A row with every editable field set (`filled`), or only the required ones (the others stay NULL).
+        shadow_parsers = {}
+        if issubclass(model, ShadowColumnsMixin):
+            shadow_parsers = {legacy: parser for legacy, _, parser in model.shadow_columns()}
+        self.row_count += 1
+        values = {}
+        for field in model._meta.concrete_fields:
+            if field.primary_key or not field.editable:
+                continue
+            required = not field.null and not field.has_default()
+            if not filled and not required:
+                continue
+            if field.is_relation:
+                values[field.name] = self.related_row(field.related_model)
+            else:
+                values[field.name] = _filled_value(field, shadow_parsers, self.row_count)
+        return model._base_manager.create(**values)
+
+    def related_row(self, model):
+        if model not in self.related:
+            self.related[model] = self.create_row(model, filled=False)
+        return self.related[model]
+
+    def assert_same_output(self, serializer_class, names):
+        converter = compile_serializer(serializer_class, names)
+        if converter is None:
+            return False
+        queryset = serializer_class.Meta.model._base_manager.order_by("pk")
+        compiled = converter.convert_many(queryset.values_list(*converter.columns, named=True))
+        expected = serializer_class(queryset, many=True, context={"sparse_fields": names}).data
+        self.assertEqual(compiled, expected)
+        self.assertEqual(ORJSONRenderer().render(compiled), ORJSONRenderer().render(expected))
+        return True
+
+    def test_compiled_output_matches_the_serializer(self):
+        factory = APIRequestFactory()
+        compiled = []
+        for serializer_class in self.LIST_SERIALIZERS:
+            with self.subTest(serializer=serializer_class.__name__):
+                model = serializer_class.Meta.model
+                self.create_row(model, filled=True)
+                self.create_row(model, filled=False)
+
+                request = Request(factory.get("/"))
+                default = select_fields(serializer_class, request, skip_heavy=True)
+                # Every other field of the default selection, as a client's `?fields=`.
+                available = default or tuple(_serializer_fields(serializer_class))
+                request = Request(factory.get("/", {"fields": ",".join(available[::2])}))
+                sparse = select_fields(serializer_class, request, skip_heavy=True)
+
+                for names in (default, sparse):
+                    if self.assert_same_output(serializer_class, names):
+                        compiled.append((serializer_class, names))
+
+        # The selections the converters cannot compile fall back to the serializer, but most must compile.
+        self.assertGreaterEqual(len(compiled), len(self.LIST_SERIALIZERS))
+
+
+class ParseMoneyTests(SimpleTestCase):
+    CASES = [
+        # (legacy value, parsed amount)
+        ("1200", Decimal("1200.00")),
+        ("₹1,234.50", Decimal("1234.50")),
+        ("₹ 99", Decimal("99.00")),
+        ("Rs. 500", Decimal("500.00")),
+        ("rs 500", Decimal("500.00")),
+        ("INR 75.5", Decimal("75.50")),
+        ("500/-", Decimal("500.00")),
+        ("Rs. 1,500/-", Decimal("1500.00")),
+        ("1,00,000", Decimal("100000.00")),
+        ("  42  ", Decimal("42.00")),
+        ("-40.5", Decimal("-40.50")),
+        ("- 40", Decimal("-40.00")),
+        ("12.", Decimal("12.00")),
+        ("-12.", Decimal("-12.00")),
+        (".5", Decimal("0.50")),
+        ("0.005", Decimal("0.01")),
+        ("2.675", Decimal("2.68")),
+        (str(MAX_AMOUNT), MAX_AMOUNT),
+        (f"-{MAX_AMOUNT}", -MAX_AMOUNT),
+        ("10000000000", None),
+        ("-10000000000", None),
+        (Decimal("3.456"), Decimal("3.46")),
+        (12, Decimal("12.00")),
+        (None, None),
+        ("", None),
+        ("   ", None),
+        (".", None),
+        ("-", None),
+        ("abc", None),
+        ("12abc", None),
+        ("1.2.3", None),
+        ("--5", None),
+        ("5-", None),
+        ("1e5", None),
+        ("NaN", None),
+    ]
+
+    def test_parse_money(self):
+        for value, expected in self.CASES:
+            with self.subTest(value=value):
+                self.assertEqual(parse_money(value), expected)
+
+
+KOLKATA = zoneinfo.ZoneInfo("Asia/Kolkata")
+UTC = datetime.timezone.utc
+
+
+class ParseDateTests(SimpleTestCase):
+    DATE_CASES = [
+        # (legacy value, parsed date)
+        ("2025-12-31", datetime.date(2025, 12, 31)),
+        ("2025/02/01", datetime.date(2025, 2, 1)),
+        # Day first, whatever the separator.
+        ("01-02-2025", datetime.date(2025, 2, 1)),
+        ("01/02/2025", datetime.date(2025, 2, 1)),
+        ("01.02.2025", datetime.date(2025, 2, 1)),
+        ("1 Feb 2025", datetime.date(2025, 2, 1)),
+        ("01-Feb-2025", datetime.date(2025, 2, 1)),
+        ("1 February 2025", datetime.date(2025, 2, 1)),
+        (" 31/12/2025 ", datetime.date(2025, 12, 31)),
+        # Month-and-year expiries mean the last day of the month.
+        ("12/2025", datetime.date(2025, 12, 31)),
+        ("02-2024", datetime.date(2024, 2, 29)),
+        ("02/23", datetime.date(2023, 2, 28)),
+        ("04-25", datetime.date(2025, 4, 30)),
+        ("Dec 2025", datetime.date(2025, 12, 31)),
+        ("Feb-2025", datetime.date(2025, 2, 28)),
+        ("September 2025", datetime.date(2025, 9, 30)),
+        ("Jun-26", datetime.date(2026, 6, 30)),
+        # Timestamps give their day in the current time zone.
+        ("2025-03-01T20:00:00Z", datetime.date(2025, 3, 2)),
+        ("2025-03-01 10:15:30", datetime.date(2025, 3, 1)),
+        ("1735669800", datetime.date(2025, 1, 1)),
+        (datetime.date(2025, 3, 1), datetime.date(2025, 3, 1)),
+        (datetime.datetime(2025, 3, 1, 23, 0), datetime.date(2025, 3, 1)),
+        # Bounds.
+        ("01/01/1900", datetime.date(1900, 1, 1)),
+        ("31/12/2200", datetime.date(2200, 12, 31)),
+        ("31/12/1899", None),
+        ("01/01/2201", None),
+        (datetime.date(1850, 1, 1), None),
+        # Not dates.
+        (None, None),
+        ("", None),
+        ("  ", None),
+        ("soon", None),
+        ("32/01/2025", None),
+        ("13/2025", None),
+        ("31/02/2025", None),
+    ]
+
+    TIMESTAMP_CASES = [
+        # (legacy value, parsed timestamp)
+        ("2025-03-01T10:15:30+00:00", datetime.datetime(2025, 3, 1, 10, 15, 30, tzinfo=UTC)),
+        ("2025-03-01T10:15:30Z", datetime.datetime(2025, 3, 1, 10, 15, 30, tzinfo=UTC)),
+        # Naive values are taken in the current time zone.
+        ("2025-03-01 10:15:30", datetime.datetime(2025, 3, 1, 10, 15, 30, tzinfo=KOLKATA)),
+        ("2025-03-01T10:15", datetime.datetime(2025, 3, 1, 10, 15, tzinfo=KOLKATA)),
+        ("01-03-2025 10:15:30", datetime.datetime(2025, 3, 1, 10, 15, 30, tzinfo=KOLKATA)),
+        ("01/03/2025 10:15", datetime.datetime(2025, 3, 1, 10, 15, tzinfo=KOLKATA)),
+        ("01/03/2025", datetime.datetime(2025, 3, 1, tzinfo=KOLKATA)),
+        ("2025-03-01", datetime.datetime(2025, 3, 1, tzinfo=KOLKATA)),
+        (datetime.datetime(2025, 3, 1, 10, 15), datetime.datetime(2025, 3, 1, 10, 15, tzinfo=KOLKATA)),
+        (datetime.date(2025, 3, 1), datetime.datetime(2025, 3, 1, tzinfo=KOLKATA)),
+        (
+            datetime.datetime(2025, 3, 1, 10, 15, tzinfo=UTC),
+            datetime.datetime(2025, 3, 1, 10, 15, tzinfo=UTC),
+        ),
+        # Unix epochs in seconds (10 digits) or milliseconds (13 digits).
+        ("1735689600", datetime.datetime(2025, 1, 1, tzinfo=UTC)),
+        ("1735689600000", datetime.datetime(2025, 1, 1, tzinfo=UTC)),
+        ("1735689600123", datetime.datetime(2025, 1, 1, 0, 0, 0, 123000, tzinfo=UTC)),
+        ("17356896000", None),
+        ("173568960", None),
+        # Bounds.
+        ("1900-01-01 00:00:00", datetime.datetime(1900, 1, 1, tzinfo=KOLKATA)),
+        ("1899-12-31 23:59:59", None),
+        ("2201-01-01 00:00:00", None),
+        # Not timestamps.
+        (None, None),
+        ("", None),
+        ("later", None),
+        ("2025-13-01 10:00", None),
+        ("01-03-2025 25:00", None),
+    ]
+
+    def test_parse_date(self):
+        with timezone.override(KOLKATA):
+            for value, expected in self.DATE_CASES:
+                with self.subTest(value=value):
+                    self.assertEqual(parse_date(value), expected)
+
+    def test_parse_timestamp(self):
+        with timezone.override(KOLKATA):
+            for value, expected in self.TIMESTAMP_CASES:
+                with self.subTest(value=value):
+                    parsed = parse_timestamp(value)
+                    self.assertEqual(parsed, expected)
+                    if parsed is not None:
+                        self.assertTrue(timezone.is_aware(parsed))
+
+
+class ListFilterTests(TenantAPITestCase):
+    url = "/api/appointments/appointment"
+
+    def get(self, params):
+        return self.client.get(self.url, params, **self.auth_headers(self.admin))
+
+    def create_appointment(self, **values):
+        return Appointment.objects.create(tenant=self.tenant, user=self.admin, **values)
+
+    def fetch_all(self, params):
+        # The ids of every page, following the `next` links.
+        ids = []
+        response = self.get({**params, "page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, 200, response.content)
+            ids += [row["id"] for row in response.json()["data"]]
+            if response.json()["next"] is None:
+                return ids
+            response = self.client.get(response.json()["next"], **self.auth_headers(self.admin))
+
+    def test_invalid_values_name_the_parameter(self):
+        for param, value in (
+            ("appointment_date_after", "31/12/2025"),
+            ("created_at_before", "yesterday"),
+            ("doctor", "abc"),
+            ("payment_mode", "Bitcoin"),
+        ):
+            with self.subTest(param=param):
+                response = self.get({param: value})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(param, response.json())
+
+    def test_unknown_ordering_field(self):
+        for ordering in ("fees", "-name", "id__gt"):
+            with self.subTest(ordering=ordering):
+                response = self.get({"ordering": ordering})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("ordering", response.json())
+
+    @override_settings(TIME_ZONE="Asia/Kolkata")
+    def test_date_range_on_a_timestamp_covers_whole_local_days(self):
+        tz = zoneinfo.ZoneInfo("Asia/Kolkata")
+        moments = {
+            "day_before": datetime.datetime(2025, 3, 9, 23, 59, 59, 999999, tzinfo=tz),
+            "first": datetime.datetime(2025, 3, 10, 0, 0, tzinfo=tz),
+            "last": datetime.datetime(2025, 3, 11, 23, 59, 59, 999999, tzinfo=tz),
+            "day_after": datetime.datetime(2025, 3, 12, 0, 0, tzinfo=tz),
+        }
+        ids = {}
+        for name, moment in moments.items():
+            ids[name] = self.create_appointment().id
+            Appointment.objects.filter(pk=ids[name]).update(created_at=moment)
+
+        response = self.get({"created_at_after": "2025-03-10", "created_at_before": "2025-03-11"})
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual({row["id"] for row in response.json()["data"]}, {ids["first"], ids["last"]})
+
+        response = self.get({"created_at_before": "2025-03-09"})
+        self.assertEqual([row["id"] for row in response.json()["data"]], [ids["day_before"]])
+
+    def test_ordering_pages_across_nulls(self):
+        days = [datetime.date(2025, 3, day) for day in (5, 1, 3, 3, 2)]
+        dated = [self.create_appointment(appointment_date=day) for day in days]
+        undated = [self.create_appointment() for _ in range(3)]
+
+        by_date = sorted(dated, key=lambda row: (row.appointment_date, row.id))
+        undated_ids = sorted(row.id for row in undated)
+
+        # Descending: newest date first, ties on the highest id, rows without a date last.
+        expected = [row.id for row in reversed(by_date)] + undated_ids[::-1]
+        self.assertEqual(self.fetch_all({"ordering": "-appointment_date"}), expected)
+
+        # Ascending: rows without a date first.
+        expected = undated_ids + [row.id for row in by_date]
+        self.assertEqual(self.fetch_all({"ordering": "appointment_date"}), expected)
@@ -14,7 +14,8 @@ Views:
 3. `UserLoginView(APIView)`:
     - Handles user authentication.
     - Method: `POST`
-    - Receives email and password, and uses `TenantEmailBackend` for authentication.
+    - Receives email and password, and uses `clients.login.authenticate_login` for authentication, which
+      resolves the user, its profile and admin status in one query and hashes in a bounded thread pool.
     - Returns an authentication token if successful, or an error message if authentication fails.
     - Differentiates between tenant users and tenant admins.
 
@@ -41,16 +42,18 @@ Views:
 
 6. `FetchAllBlogs(APIView)`:
     - Method: `GET`:
-    - Simply fetches all blogs as per the tenant.
+    - Simply fetches all blogs as per the tenant, one page at a time or streamed (`clients.mixins.TenantListMixin`).
 
 
 Dependencies:
 - `logging` for logging messages and errors.
 - `JsonResponse` from `django.http` for standard JSON responses.
 - `APIView`, `Response`, `status`, and `filters` from `rest_framework` for API views and responses.
-- `TenantEmailBackend` for custom authentication backend.
+- `authenticate_login` for the tenant login pipeline.
 - `get_tokens_for_user` for generating authentication tokens.
 - `IsTenantAdmin` from `custom_permissions` for custom permission handling.
+- `ReadOnlyFastPathMixin` from `mixins`, so `GET` requests skip the per-request transaction.
+- `TenantListMixin` from `mixins` for the paginated or streamed blog lists.
 - `swagger_auto_schema` and `openapi` from `drf_yasg` for API documentation.
 - `IsAuthenticated` for securing views.
 - `UserRegisterSerializer`, `UserLoginSerializer`, `BlogSerializer`, `UserSerializer` from `serializers` for data validation and serialization.
@@ -69,11 +72,12 @@ from .serializers import (
     BlogSerializer,
     UserSerializer,
 )
-from .models import UserProfile, CustomUser, Blog
+from .models import UserProfile, Blog
 
-from users.auth_backends import TenantEmailBackend
+from .login import authenticate_login
 from .helpers import get_tokens_for_user
 from .custom_permissions import IsTenantAdmin, IsTenantAdminOrIsUserPartOfTenant
+from .mixins import ReadOnlyFastPathMixin, TenantListMixin
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework.permissions import IsAuthenticated
@@ -105,7 +109,7 @@ def add_blog_to_index(request, blog):
     )
 
 
-class UserRegister(APIView):
+class UserRegister(ReadOnlyFastPathMixin, APIView):
     def post(self, request):
         serializer = UserRegisterSerializer(
             data=request.data, context={"request": request}
@@ -125,58 +129,37 @@ class UserRegister(APIView):
         )
 
 
-class UserLoginView(APIView):
+class UserLoginView(ReadOnlyFastPathMixin, APIView):
     def post(self, request):
         serializer = UserLoginSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         email = serializer.data.get("email")
         password = serializer.data.get("password")
-        is_user = TenantEmailBackend().authenticate(
-            request, email=email, password=password, tenant=request.tenant
-        )
-        if is_user is not None:
-            try:
-                _ = UserProfile.objects.get(user=is_user)
-                token = get_tokens_for_user(is_user)
+        login = authenticate_login(request, email, password)
+        if login is not None:
+            is_user = login.user
+            if login.has_profile:
+                msg = "User Logged in Successfully!"
                 logger.info("tenant user logged in!")
+            elif is_user.is_tenant_admin:
+                msg = "Tenant admin Logged in Successfully!"
+                logger.info("tenant admin logged in!")
+            else:
                 return Response(
-                    {
-                        "email": str(is_user),
-                        "username": is_user.username,
-                        "msg": "User Logged in Successfully!",
-                        "is_tenant_admin": is_user.is_tenant_admin,
-                        "access_token": token,
-                    },
-                    status=status.HTTP_200_OK,
+                    {"msg": f"User {is_user} doesn't exist in this tenant!"},
+                    status=status.HTTP_404_NOT_FOUND,
                 )
 
-            except UserProfile.DoesNotExist:
-                logger.info("Checking if tenant admin is trying to login!")
-                try:
-                    _ = CustomUser.objects.get(email=is_user.email)
-                    if is_user.is_tenant_admin:
-                        logger.info("tenant admin logged in!")
-                        token = get_tokens_for_user(is_user)
-                        return Response(
-                            {
-                                "email": str(is_user),
-                                "username": is_user.username,
-                                "msg": "Tenant admin Logged in Successfully!",
-                                "is_tenant_admin": is_user.is_tenant_admin,
-                                "access_token": token,
-                            },
-                            status=status.HTTP_200_OK,
-                        )
-                except CustomUser.DoesNotExist as e:
-                    logger.critical(f"User login went wrong {e}")
-                    return Response(
-                        {"msg": f"user {is_user} does not exist in this tenant!"},
-                        status=status.HTTP_401_UNAUTHORIZED,
-                    )
-
+            token = get_tokens_for_user(is_user, request.tenant, login.membership)
             return Response(
-                {"msg": f"User {is_user} doesn't exist in this tenant!"},
-                status=status.HTTP_404_NOT_FOUND,
+                {
+                    "email": str(is_user),
+                    "username": is_user.username,
+                    "msg": msg,
+                    "is_tenant_admin": is_user.is_tenant_admin,
+                    "access_token": token,
+                },
+                status=status.HTTP_200_OK,
             )
 
         logger.critical("Authentication failed!")
@@ -190,7 +173,8 @@ class UserLoginView(APIView):
         )
 
 
-class BlogView(APIView):
+class BlogView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Blog
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     @swagger_auto_schema(
@@ -220,22 +204,21 @@ class BlogView(APIView):
         logger.info("getting blogs with respect to tenant and user!")
         blogs = Blog.objects.filter(user=request.user)
 
-        serializer = BlogSerializer(blogs, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, blogs, BlogSerializer)
 
 
-class FetchAllBlogs(APIView):
+class FetchAllBlogs(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Blog
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
     def get(self, request):
 
         logger.info("getting all blogs respect to their own tenant!")
         blogs = Blog.objects.all()
-        serializer = BlogSerializer(blogs, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, blogs, BlogSerializer)
 
 
 
-class BlogManagementView(APIView):
+class BlogManagementView(ReadOnlyFastPathMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     @swagger_auto_schema(
@@ -268,7 +251,7 @@ class BlogManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = BlogSerializer(blog_instance)
+        serializer = BlogSerializer(blog_instance, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     def patch(self, request, blog_id):
@@ -321,7 +304,7 @@ class BlogManagementView(APIView):
         )
 
 
-class TenantView(APIView):
+class TenantView(ReadOnlyFastPathMixin, APIView):
     permission_classes = [IsTenantAdmin]
 
     def get(self, request):
@@ -332,7 +315,7 @@ class TenantView(APIView):
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
 
-class UserView(APIView):
+class UserView(ReadOnlyFastPathMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -343,11 +326,11 @@ class UserView(APIView):
                 {"msg": f" {request.user} doesn't exists!"}, status=status.HTTP_200_OK
             )
 
-        serializer = UserSerializer(user_obj)
+        serializer = UserSerializer(user_obj, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
 
-class TenantManagementView(APIView):
+class TenantManagementView(ReadOnlyFastPathMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, user_id):
@@ -363,7 +346,7 @@ class TenantManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = UserSerializer(user_instance)
+        serializer = UserSerializer(user_instance, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     def patch(self, request, user_id):
@@ -1,3 +1,7 @@
 from django.contrib import admin
 
-# Register your models here.
+
+from .models import DashboardStats, KPIRefresh
+
+admin.site.register(DashboardStats)
+admin.site.register(KPIRefresh)
@@ -0,0 +1,186 @@
+"""
+This module reads and refreshes the heavier dashboard KPIs, which are PostgreSQL materialized views in every tenant
+schema (created by the `dashboard` migrations, so `migrate_schemas` and the template schema clones set them up):
+
+- `dashboard_ipd_occupancy_mv`: Per ward, the beds known from the IPD admissions (`IPD.bed_no`), the beds admitted
+  to and the admissions of the last 30 days, and the resulting occupancy rate. IPD admissions have no discharge
+  date, so occupancy is measured over that window.
+- `dashboard_opd_visits_mv`: Per day and doctor, the OPD visits (on `appointment_date`, else `created_at`) and
+  their charges.
+- `dashboard_appointment_no_shows_mv`: Per day and doctor, the appointments, the ones attended (an OPD visit of
+  the same patient on the appointment date) and the no-shows (past appointments that were not attended).
+  Appointments have no status, so attendance is taken from the OPD visits.
+- `dashboard_pharmacy_sales_mv`: Per day and `medicine_category`, the pharmacy bills and their net amounts.
+
+Amounts come from the numeric money columns (`clients.money`), so run `backfill_money` before relying on them.
+Windows relative to today (occupancy, no-shows) are evaluated when the view is refreshed.
+
+Refresh (`refresh(names=None)`, scheduled with `python manage.py refresh_dashboard_kpis`):
+- `REFRESH MATERIALIZED VIEW CONCURRENTLY`, so the dashboard keeps reading the previous figures while the new ones
+  are computed. Each view has a unique index on its key columns, which `CONCURRENTLY` requires; it is recreated
+  when missing. A view that was never populated is refreshed once without `CONCURRENTLY`, which is not allowed on it.
+- A transaction-level advisory lock per schema and view makes overlapping refreshes skip instead of queueing.
+- The time and duration of every refresh are recorded in `KPIRefresh`, which the endpoint reports as staleness.
+
+Reads (`read_kpis(start, end)`, used by `dashboard.views.DashboardKPIView`) only query the materialized views,
+`pg_matviews` and `KPIRefresh`, never the source tables. Views not populated yet read as empty and stale.
+
+Functions:
+- `refresh(names=None)`: Refreshes the views (all by default) of the current schema, returns the refreshed names.
+- `read_kpis(start, end)`: Returns the KPIs of the date range, with the refresh times and whether any is stale.
+
+Dependencies:
+- `connection` and `transaction` from `django.db` for the raw SQL on the materialized views.
+- `KPIRefresh` from `dashboard.models` for the refresh times.
+"""
+
+import logging
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import KPIRefresh
+
+logger = logging.getLogger(__name__)
+
+
+# Materialized view name -> columns of its unique index
+VIEWS = {
+    "dashboard_ipd_occupancy_mv": ("ward",),
+    "dashboard_opd_visits_mv": ("date", "doctor_id"),
+    "dashboard_appointment_no_shows_mv": ("date", "doctor_id"),
+    "dashboard_pharmacy_sales_mv": ("date", "medicine_category"),
+}
+
+_OCCUPANCY_SQL = """
+    SELECT ward, beds, beds_used_30d, admissions_30d, occupancy_rate_30d
+    FROM dashboard_ipd_occupancy_mv
+    ORDER BY ward
+"""
+
+# Date-ranged reads, summing the daily rows of the range
+_RANGE_READS = {
+    "opd_visits": """
+        SELECT doctor_id, doctor_name, SUM(visits)::bigint AS visits, SUM(charges) AS charges
+        FROM dashboard_opd_visits_mv
+        WHERE date BETWEEN %s AND %s
+        GROUP BY doctor_id, doctor_name
+        ORDER BY visits DESC, doctor_id
+    """,
+    "no_shows": """
+        SELECT doctor_id, doctor_name, SUM(appointments)::bigint AS appointments, SUM(attended)::bigint AS attended,
+               SUM(past_appointments)::bigint AS past_appointments, SUM(no_shows)::bigint AS no_shows
+        FROM dashboard_appointment_no_shows_mv
+        WHERE date BETWEEN %s AND %s
+        GROUP BY doctor_id, doctor_name
+        ORDER BY no_shows DESC, doctor_id
+    """,
+    "pharmacy_sales": """
+        SELECT medicine_category, SUM(bills)::bigint AS bills, SUM(revenue) AS revenue
+        FROM dashboard_pharmacy_sales_mv
+        WHERE date BETWEEN %s AND %s
+        GROUP BY medicine_category
+        ORDER BY revenue DESC, medicine_category
+    """,
+}
+
+
+_READ_VIEWS = {
+    "occupancy": "dashboard_ipd_occupancy_mv",
+    "opd_visits": "dashboard_opd_visits_mv",
+    "no_shows": "dashboard_appointment_no_shows_mv",
+    "pharmacy_sales": "dashboard_pharmacy_sales_mv",
+}
+
+
+def _quote(name):
+    return connection.ops.quote_name(name)
+
+
+def _ensure_unique_index(cursor, name):
+    columns = ", ".join(_quote(column) for column in VIEWS[name])
+    cursor.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(name + '_key')} ON {_quote(name)} ({columns})")
+
+
+def _refresh_view(name):
+    # Returns False when the view is missing or another process is refreshing it.
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_try_advisory_xact_lock(hashtext(current_schema() || '.' || %s))", [name]
+        )
+        if not cursor.fetchone()[0]:
+            logger.info(f"{connection.schema_name}: {name} is already being refreshed")
+            return False
+        cursor.execute(
+            "SELECT ispopulated FROM pg_matviews WHERE schemaname = current_schema() AND matviewname = %s", [name]
+        )
+        row = cursor.fetchone()
+        if row is None:
+            logger.warning(f"{connection.schema_name}: {name} does not exist; run migrate_schemas")
+            return False
+        _ensure_unique_index(cursor, name)
+        concurrently = "CONCURRENTLY " if row[0] else ""
+        cursor.execute(f"REFRESH MATERIALIZED VIEW {concurrently}{_quote(name)}")
+    return True
+
+
+def refresh(names=None):
+    refreshed = []
+    for name in names or VIEWS:
+        started = time.monotonic()
+        if not _refresh_view(name):
+            continue
+        KPIRefresh.objects.update_or_create(
+            view_name=name,
+            defaults={"refreshed_at": timezone.now(), "duration": time.monotonic() - started},
+        )
+        refreshed.append(name)
+    return refreshed
+
+
+def _money(value):
+    return str((value or Decimal("0")).quantize(Decimal("0.01")))
+
+
+def _rows(cursor, sql, params):
+    cursor.execute(sql, params)
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _populated(cursor):
+    cursor.execute(
+        "SELECT matviewname FROM pg_matviews WHERE schemaname = current_schema() AND ispopulated AND matviewname = ANY(%s)",
+        [list(VIEWS)],
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def read_kpis(start, end):
+    # Views never refreshed yet (e.g. right after the migration) cannot be read; they are reported empty and stale.
+    with connection.cursor() as cursor:
+        populated = _populated(cursor)
+        data = {"occupancy": _rows(cursor, _OCCUPANCY_SQL, []) if _READ_VIEWS["occupancy"] in populated else []}
+        for key, sql in _RANGE_READS.items():
+            data[key] = _rows(cursor, sql, [start, end]) if _READ_VIEWS[key] in populated else []
+
+    for row in data["occupancy"]:
+        row["occupancy_rate_30d"] = float(row["occupancy_rate_30d"] or 0)
+    for row in data["opd_visits"]:
+        row["charges"] = _money(row["charges"])
+    for row in data["no_shows"]:
+        past = row["past_appointments"] or 0
+        row["no_show_rate"] = round(row["no_shows"] / past, 4) if past else 0.0
+    for row in data["pharmacy_sales"]:
+        row["revenue"] = _money(row["revenue"])
+
+    max_age = getattr(settings, "DASHBOARD_KPI_MAX_AGE", 900)
+    refreshes = dict(KPIRefresh.objects.filter(view_name__in=VIEWS).values_list("view_name", "refreshed_at"))
+    data["refreshed_at"] = {name: refreshes.get(name) for name in VIEWS}
+    data["stale"] = len(populated) < len(VIEWS) or len(refreshes) < len(VIEWS) or any(
+        (timezone.now() - refreshed_at).total_seconds() > max_age for refreshed_at in refreshes.values()
+    )
+    return data
@@ -0,0 +1,76 @@
+"""
+Management command to recompute the dashboard revenue figures (`dashboard.models.DashboardStats`) from the bills.
+
+Usage:
+    python manage.py rebuild_dashboard_stats [--from 2024-01-01] [--to 2024-12-31] [--schema <schema_name>]
+                                             [--department pharmacy ...] [--chunk-days 31]
+
+For every tenant schema (or `--schema`), the figures from `--from` (default: the oldest bill) to `--to` (default:
+today) are recomputed with `dashboard.rollups.rebuild`, `--chunk-days` days per transaction, so the table lock
+that keeps concurrent bill saves consistent is held for one short chunk at a time. Run it once after deploying the
+rollups and whenever the figures are in doubt; it can be stopped and re-run at any time. Until `MONEY_DECIMAL_READS`
+is on, the amounts are parsed from the legacy columns in Python, which is slower but does not need `backfill_money`.
+"""
+
+import datetime
+
+from django.core.management.base import CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from clients.management.base import TenantCommand
+from dashboard import rollups
+from dashboard.models import DashboardStats
+
+
+def _date(value):
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Invalid date: {value} (expected YYYY-MM-DD)")
+
+
+class Command(TenantCommand):
+    help = "Recompute the dashboard revenue figures from the bills."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--from", dest="start", type=_date, help="First day to rebuild (default: the oldest bill).")
+        parser.add_argument("--to", dest="end", type=_date, help="Last day to rebuild (default: today).")
+        parser.add_argument(
+            "--department",
+            action="append",
+            dest="departments",
+            choices=[department for department, _ in DashboardStats.DEPARTMENT_CHOICES],
+        )
+        parser.add_argument("--chunk-days", type=int, default=31, help="Days rebuilt per transaction.")
+
+    def handle(self, *args, **options):
+        if options["chunk_days"] < 1:
+            raise CommandError("--chunk-days must be at least 1.")
+        super().handle(*args, **options)
+
+    def handle_schema(self, schema_name, options):
+        start = options["start"] or self.oldest_bill(options["departments"])
+        end = options["end"] or timezone.localdate()
+        if start is None or start > end:
+            self.stdout.write(f"{schema_name}: nothing to rebuild")
+            return
+
+        rows = 0
+        chunk = datetime.timedelta(days=options["chunk_days"])
+        day = start
+        while day <= end:
+            last = min(day + chunk - datetime.timedelta(days=1), end)
+            rows += rollups.rebuild(day, last, options["departments"])
+            day = last + datetime.timedelta(days=1)
+        self.stdout.write(f"{schema_name}: {rows} rows rebuilt from {start} to {end}")
+
+    def oldest_bill(self, departments):
+        days = [
+            rollups.bill_day(model._base_manager.aggregate(oldest=Min("created_at"))["oldest"])
+            for department, model, _ in rollups.source_models()
+            if departments is None or department in departments
+        ]
+        days = [day for day in days if day is not None]
+        return min(days) if days else None
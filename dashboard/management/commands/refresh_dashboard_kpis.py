@@ -0,0 +1,54 @@
+"""
+Management command to refresh the dashboard KPI materialized views (`dashboard.kpis`) of every tenant schema.
+
+Usage:
+    python manage.py refresh_dashboard_kpis [--schema <schema_name>] [--view dashboard_opd_visits_mv ...]
+                                            [--interval 300]
+
+Without `--interval` it refreshes once and exits, for cron (e.g. `*/5 * * * *`). With `--interval` it keeps running
+as the scheduler process, starting a new round of refreshes `--interval` seconds after the previous one started
+(right away when a round took longer). Each view is refreshed `CONCURRENTLY`, so the dashboard keeps answering
+from the previous figures meanwhile; a view another process is already refreshing is skipped. A failure in one
+schema is logged and does not stop the others. Keep the interval below `DASHBOARD_KPI_MAX_AGE` (settings), past
+which the KPI endpoint reports the figures as stale.
+"""
+
+import logging
+import time
+
+from django.core.management.base import CommandError
+from django.db import DatabaseError
+
+from clients.management.base import TenantCommand
+from dashboard import kpis
+
+logger = logging.getLogger(__name__)
+
+
+class Command(TenantCommand):
+    help = "Refresh the dashboard KPI materialized views of every tenant schema."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--view", action="append", dest="views", choices=sorted(kpis.VIEWS))
+        parser.add_argument("--interval", type=float, help="Keep refreshing every this many seconds.")
+
+    def handle(self, *args, **options):
+        if options["interval"] is not None and options["interval"] <= 0:
+            raise CommandError("--interval must be positive.")
+
+        while True:
+            started = time.monotonic()
+            super().handle(*args, **options)
+            if options["interval"] is None:
+                return
+            time.sleep(max(0.0, options["interval"] - (time.monotonic() - started)))
+
+    def handle_schema(self, schema_name, options):
+        started = time.monotonic()
+        try:
+            refreshed = kpis.refresh(options["views"])
+        except DatabaseError:
+            logger.exception(f"{schema_name}: refreshing the dashboard KPIs failed")
+            return
+        self.stdout.write(f"{schema_name}: {len(refreshed)} views refreshed in {time.monotonic() - started:.2f}s")
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('department', models.CharField(choices=[('billing', 'Billing'), ('pharmacy', 'Pharmacy'), ('ipd', 'IPD'), ('pathology', 'Pathology'), ('radiology', 'Radiology')], max_length=20)),
+                ('payment_mode', models.CharField(max_length=50)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('bill_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'dashboard stats',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dashboardstats',
+            constraint=models.UniqueConstraint(fields=('date', 'department', 'payment_mode'), name='dashboardstats_unique_key'),
+        ),
+    ]
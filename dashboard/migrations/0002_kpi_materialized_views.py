@@ -0,0 +1,115 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:09
+
+from django.db import migrations, models
+
+
+# Materialized views of dashboard.kpis, created WITH NO DATA so the migration stays fast on large schemas; the
+# first `refresh_dashboard_kpis` populates them. Each has the unique index REFRESH ... CONCURRENTLY requires.
+KPI_VIEWS = [
+    (
+        "dashboard_ipd_occupancy_mv",
+        """
+        SELECT COALESCE(ward, '') AS ward,
+               COUNT(DISTINCT bed_no) AS beds,
+               COUNT(DISTINCT bed_no) FILTER (WHERE created_at::date >= CURRENT_DATE - 30) AS beds_used_30d,
+               COUNT(*) FILTER (WHERE created_at::date >= CURRENT_DATE - 30) AS admissions_30d,
+               ROUND(
+                   COUNT(DISTINCT bed_no) FILTER (WHERE created_at::date >= CURRENT_DATE - 30)::numeric
+                   / NULLIF(COUNT(DISTINCT bed_no), 0),
+                   4
+               ) AS occupancy_rate_30d
+        FROM ipd_module_ipd
+        WHERE bed_no IS NOT NULL AND bed_no <> ''
+        GROUP BY COALESCE(ward, '')
+        """,
+        ("ward",),
+    ),
+    (
+        "dashboard_opd_visits_mv",
+        """
+        SELECT visits.date, visits.doctor_id, COALESCE(employee.name, '') AS doctor_name,
+               COUNT(*) AS visits, COALESCE(SUM(visits.charge_decimal), 0) AS charges
+        FROM (
+            SELECT COALESCE(appointment_date, created_at::date) AS date, doctor_id, charge_decimal
+            FROM opd_module_opd
+        ) AS visits
+        LEFT JOIN staff_management_employee AS employee ON employee.id = visits.doctor_id
+        WHERE visits.date IS NOT NULL
+        GROUP BY visits.date, visits.doctor_id, employee.name
+        """,
+        ("date", "doctor_id"),
+    ),
+    (
+        "dashboard_appointment_no_shows_mv",
+        """
+        WITH visits AS (
+            SELECT DISTINCT patient_id, COALESCE(appointment_date, created_at::date) AS date
+            FROM opd_module_opd
+            WHERE patient_id IS NOT NULL
+        )
+        SELECT appointment.appointment_date AS date, appointment.doctor_id,
+               COALESCE(employee.name, '') AS doctor_name,
+               COUNT(*) AS appointments,
+               COUNT(visits.patient_id) AS attended,
+               COUNT(*) FILTER (WHERE appointment.appointment_date < CURRENT_DATE) AS past_appointments,
+               COUNT(*) FILTER (
+                   WHERE appointment.appointment_date < CURRENT_DATE AND visits.patient_id IS NULL
+               ) AS no_shows
+        FROM appointments_list_appointment AS appointment
+        LEFT JOIN visits
+            ON visits.patient_id = appointment.patient_id AND visits.date = appointment.appointment_date
+        LEFT JOIN staff_management_employee AS employee ON employee.id = appointment.doctor_id
+        WHERE appointment.appointment_date IS NOT NULL
+        GROUP BY appointment.appointment_date, appointment.doctor_id, employee.name
+        """,
+        ("date", "doctor_id"),
+    ),
+    (
+        "dashboard_pharmacy_sales_mv",
+        """
+        SELECT created_at::date AS date, medicine_category,
+               COUNT(*) AS bills, COALESCE(SUM(net_amount_decimal), 0) AS revenue
+        FROM pharmacy_module_pharmacybill
+        WHERE created_at IS NOT NULL
+        GROUP BY created_at::date, medicine_category
+        """,
+        ("date", "medicine_category"),
+    ),
+]
+
+
+def create_view_sql(name, select, key):
+    return [
+        f"CREATE MATERIALIZED VIEW {name} AS {select} WITH NO DATA",
+        f"CREATE UNIQUE INDEX {name}_key ON {name} ({', '.join(key)})",
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        ('appointments_list', '0004_list_filter_indexes'),
+        ('ipd_module', '0005_money_decimal_columns'),
+        ('opd_module', '0004_money_decimal_columns'),
+        ('pharmacy_module', '0006_money_decimal_columns'),
+        ('staff_management', '0012_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KPIRefresh',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('view_name', models.CharField(max_length=63, unique=True)),
+                ('refreshed_at', models.DateTimeField()),
+                ('duration', models.FloatField(default=0)),
+            ],
+        ),
+    ] + [
+        migrations.RunSQL(
+            create_view_sql(name, select, key),
+            reverse_sql=f"DROP MATERIALIZED VIEW IF EXISTS {name}",
+        )
+        for name, select, key in KPI_VIEWS
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+import importlib
+
+from django.db import migrations
+
+
+# PostgreSQL cannot change the type of a column a view reads, so the KPI views are dropped before `created_at`
+# becomes a timestamp and recreated by 0005_recreate_kpi_views afterwards. Meanwhile they read as empty and stale.
+kpi_views = importlib.import_module("dashboard.migrations.0002_kpi_materialized_views")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_kpi_materialized_views'),
+    ]
+
+    run_before = [
+        ('ipd_module', '0006_typed_dates'),
+        ('opd_module', '0005_typed_dates'),
+        ('pharmacy_module', '0007_typed_dates'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            f"DROP MATERIALIZED VIEW IF EXISTS {name}",
+            reverse_sql=kpi_views.create_view_sql(name, select, key),
+        )
+        for name, select, key in kpi_views.KPI_VIEWS
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0003_drop_kpi_views'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='dashboardstats',
+            index=models.Index(fields=['department', 'date'], name='dashboardstats_dept_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='dashboardstats',
+            index=models.Index(fields=['payment_mode', 'date'], name='dashboardstats_paymode_idx'),
+        ),
+    ]
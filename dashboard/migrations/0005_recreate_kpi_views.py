@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+import importlib
+
+from django.db import migrations
+
+
+# The KPI views dropped by 0003_drop_kpi_views, on the timestamp columns. Like in 0002 they are created WITH NO
+# DATA; the next `refresh_dashboard_kpis` populates them.
+kpi_views = importlib.import_module("dashboard.migrations.0002_kpi_materialized_views")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0004_list_filter_indexes'),
+        ('ipd_module', '0006_typed_dates'),
+        ('opd_module', '0005_typed_dates'),
+        ('pharmacy_module', '0007_typed_dates'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            kpi_views.create_view_sql(name, select, key),
+            reverse_sql=f"DROP MATERIALIZED VIEW IF EXISTS {name}",
+        )
+        for name, select, key in kpi_views.KPI_VIEWS
+    ]
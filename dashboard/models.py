@@ -0,0 +1,71 @@
+"""
+This module defines the pre-aggregated revenue figures read by the dashboard.
+
+Models:
+1. `DashboardStats`:
+    - The revenue and number of bills of one day, department and payment mode, in the tenant's schema (so the
+      figures are per tenant). Maintained incrementally by `dashboard.rollups` as bills are saved and deleted, and
+      recomputed by `python manage.py rebuild_dashboard_stats`.
+    - Fields:
+        - `date`: Day the bills were created.
+        - `department`: The bill model the figures come from (`billing`, `pharmacy`, `ipd`, `pathology`, `radiology`).
+        - `payment_mode`: Payment mode of the bills.
+        - `revenue`: Sum of the bills' net amounts (`Billing.amount`), from their numeric money columns.
+        - `bill_count`: Number of bills.
+        - `updated_at`: Last time the row changed.
+
+2. `KPIRefresh`:
+    - The last refresh of one of the KPI materialized views (`dashboard.kpis`), reported by the KPI endpoint as
+      the staleness of the figures.
+    - Fields:
+        - `view_name`: Name of the materialized view.
+        - `refreshed_at`: When the last refresh finished.
+        - `duration`: How long it took, in seconds.
+
+Dependencies:
+- `models` from `django.db` for defining the database model.
+"""
+
+from django.db import models
+
+
+class DashboardStats(models.Model):
+    DEPARTMENT_CHOICES = [
+        ("billing", "Billing"),
+        ("pharmacy", "Pharmacy"),
+        ("ipd", "IPD"),
+        ("pathology", "Pathology"),
+        ("radiology", "Radiology"),
+    ]
+
+    date = models.DateField()
+    department = models.CharField(max_length=20, choices=DEPARTMENT_CHOICES)
+    payment_mode = models.CharField(max_length=50)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    bill_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "dashboard stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "department", "payment_mode"], name="dashboardstats_unique_key"
+            ),
+        ]
+        indexes = [
+            # `?department=` and `?payment_mode=` filters of the stats endpoints
+            models.Index(fields=["department", "date"], name="dashboardstats_dept_idx"),
+            models.Index(fields=["payment_mode", "date"], name="dashboardstats_paymode_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.department} {self.payment_mode}: {self.revenue} ({self.bill_count})"
+
+
+class KPIRefresh(models.Model):
+    view_name = models.CharField(max_length=63, unique=True)
+    refreshed_at = models.DateTimeField()
+    duration = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"{self.view_name} ({self.refreshed_at})"
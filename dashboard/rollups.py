@@ -0,0 +1,260 @@
+"""
+This module maintains `dashboard.models.DashboardStats`, the per-day, per-department, per-payment-mode revenue and
+bill counts of the tenant, so the dashboard reads a few rows instead of scanning every bill.
+
+Sources (`SOURCES`): `Billing.amount`, and the `net_amount` of `PharmacyBill`, `IPDBill`, `PathologyBill` and
+`RadiologyBill`. A bill counts on the day of its `created_at`; bills without one are not counted.
+
+Incremental updates (connected by `dashboard.signals`):
+- Before a bill is saved, its stored day, payment mode and amount are read back (one primary key lookup), and
+  after the save the difference between the old and the new contribution is added to the matching rows, in the
+  same transaction as the bill. Deletes subtract the bill's contribution, and rows left without bills are removed.
+- The bulk endpoints (`clients.bulk`) send `pre_bulk_write`/`post_bulk_write`; the contributions of the whole
+  batch are summed first, so each affected row is updated once per request.
+- Amounts are read through `clients.money.money_field`: the legacy columns, parsed, until `MONEY_DECIMAL_READS` is
+  on, and the numeric money columns after, so the figures are right before and after the backfill.
+- Each row is changed with `UPDATE ... SET revenue = revenue + <delta>`, so concurrent bills never overwrite each
+  other; bills of the same day, department and payment mode wait for each other's commit.
+- A delta that removes bills from a row that does not exist comes from a bill saved before the figures were built
+  (`rebuild_dashboard_stats` has not run for its day yet); no row is created from it, as it would hold negative
+  figures. The figures are only complete once `python manage.py rebuild_dashboard_stats` has run after deploying
+  the rollups, which is part of the deployment, like `migrate_schemas`.
+
+Rebuild (`rebuild(start, end, departments=None)`, used by `python manage.py rebuild_dashboard_stats`):
+- Recomputes the rows of a date range with one `GROUP BY` query per source and one bulk insert. With
+  `MONEY_DECIMAL_READS` the amounts are summed in SQL from the numeric money columns (`<field>_decimal`); before,
+  each source's bills of the range are read and their legacy amounts parsed and summed in Python.
+- Runs in one transaction holding a `SHARE ROW EXCLUSIVE` lock on the stats table, so incremental updates of bills
+  saved meanwhile wait and are applied on top of the rebuilt rows instead of being lost.
+
+Functions:
+- `source_of(model)`: Returns `(department, amount_field)` for a bill model, `None` for other models.
+- `remember_previous(instances)`: Reads back and keeps the stored contribution of the instances about to be saved.
+- `remember_loaded(instances)`: Keeps the contribution of instances that still hold their stored values.
+- `record_changes(instances)`: Applies the difference between the stored and the new contributions.
+- `record_deletes(instances)`: Subtracts the contributions of deleted instances.
+- `rebuild(start, end, departments=None)`: Recomputes the rows from `start` to `end` (inclusive).
+
+Dependencies:
+- `DashboardStats` from `dashboard.models` for the figures.
+- `money_field` and `parse_money` from `clients.money` for the amounts.
+- `transaction` and `connection` from `django.db` for the upserts and the rebuild lock.
+- `bump_version` from `clients.conditional`, as the figures are written without model signals.
+"""
+
+import datetime
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from functools import partial
+
+from django.apps import apps
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from clients.conditional import bump_version
+from clients.money import money_field, parse_money
+from .models import DashboardStats
+
+logger = logging.getLogger(__name__)
+
+
+SOURCES = {
+    "billing": ("billing_counter.Billing", "amount"),
+    "pharmacy": ("pharmacy_module.PharmacyBill", "net_amount"),
+    "ipd": ("ipd_module.IPDBill", "net_amount"),
+    "pathology": ("pathology_module.PathologyBill", "net_amount"),
+    "radiology": ("radiology_module.RadiologyBill", "net_amount"),
+}
+
+_PREVIOUS_ATTR = "_dashboard_previous"
+
+
+def source_models():
+    return [(department, apps.get_model(label), amount_field) for department, (label, amount_field) in SOURCES.items()]
+
+
+def source_of(model):
+    for department, (label, amount_field) in SOURCES.items():
+        if model._meta.label == label:
+            return department, amount_field
+    return None
+
+
+def bill_day(value):
+    if isinstance(value, datetime.datetime):
+        return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+    return value
+
+
+def _contribution(department, created_at, payment_mode, amount):
+    # `(key, amount)` of one bill, `None` when it is not counted.
+    day = bill_day(created_at)
+    if day is None:
+        return None
+    return (day, department, payment_mode or ""), parse_money(amount) or Decimal("0.00")
+
+
+def _stored(model, pks):
+    department, amount_field = source_of(model)
+    column = money_field(model, amount_field)
+    rows = model._base_manager.filter(pk__in=pks).values_list("pk", "created_at", "payment_mode", column)
+    return {pk: _contribution(department, *values) for pk, *values in rows}
+
+
+def _current(instance):
+    model = type(instance)
+    department, amount_field = source_of(model)
+    amount = getattr(instance, money_field(model, amount_field))
+    return _contribution(department, instance.created_at, instance.payment_mode, amount)
+
+
+def _changed():
+    bump_version(DashboardStats)
+    transaction.on_commit(partial(bump_version, DashboardStats))
+
+
+def _apply(deltas):
+    changed = False
+    for (day, department, payment_mode), (revenue, bill_count) in sorted(deltas.items()):
+        if not revenue and not bill_count:
+            continue
+        changed = True
+        key = {"date": day, "department": department, "payment_mode": payment_mode}
+        changes = {
+            "revenue": F("revenue") + revenue,
+            "bill_count": F("bill_count") + bill_count,
+            "updated_at": timezone.now(),
+        }
+        if DashboardStats.objects.filter(**key).update(**changes):
+            if bill_count < 0:
+                # No bills left: drop the row, as a rebuild would not create it.
+                DashboardStats.objects.filter(**key, bill_count=0, revenue=0).delete()
+            continue
+        if bill_count <= 0:
+            # The bills predate the figures of this day, which only a rebuild can count.
+            logger.warning(
+                f"{connection.schema_name}: no dashboard figures for {department} on {day} ({payment_mode!r}); "
+                "run rebuild_dashboard_stats"
+            )
+            continue
+        try:
+            with transaction.atomic():
+                DashboardStats.objects.create(**key, revenue=revenue, bill_count=bill_count)
+        except IntegrityError:
+            # Created concurrently since the update above.
+            DashboardStats.objects.filter(**key).update(**changes)
+    if changed:
+        _changed()
+
+
+def _add(deltas, contribution, sign):
+    if contribution is None:
+        return
+    key, amount = contribution
+    delta = deltas.setdefault(key, [Decimal("0.00"), 0])
+    delta[0] += sign * amount
+    delta[1] += sign
+
+
+def remember_previous(instances):
+    by_model = defaultdict(list)
+    for instance in instances:
+        if instance.pk is not None and not instance._state.adding:
+            by_model[type(instance)].append(instance)
+    for model, group in by_model.items():
+        stored = _stored(model, [instance.pk for instance in group])
+        for instance in group:
+            setattr(instance, _PREVIOUS_ATTR, stored.get(instance.pk))
+
+
+def remember_loaded(instances):
+    for instance in instances:
+        setattr(instance, _PREVIOUS_ATTR, _current(instance))
+
+
+def record_changes(instances):
+    deltas = {}
+    for instance in instances:
+        _add(deltas, instance.__dict__.pop(_PREVIOUS_ATTR, None), -1)
+        _add(deltas, _current(instance), 1)
+    _apply(deltas)
+
+
+def record_deletes(instances):
+    deltas = {}
+    for instance in instances:
+        _add(deltas, _current(instance), -1)
+    _apply(deltas)
+
+
+def _day_filter(model, start, end):
+    field = model._meta.get_field("created_at")
+    if isinstance(field, models.DateTimeField):
+        tz = timezone.get_current_timezone()
+        return {
+            "created_at__gte": datetime.datetime.combine(start, datetime.time.min, tzinfo=tz),
+            "created_at__lt": datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time.min, tzinfo=tz),
+        }
+    return {"created_at__range": (start, end)}
+
+
+def _day_expression(model):
+    field = model._meta.get_field("created_at")
+    if isinstance(field, models.DateTimeField):
+        return TruncDate("created_at", tzinfo=timezone.get_current_timezone())
+    return F("created_at")
+
+
+def _totals(model, amount_field, start, end):
+    # `(day, payment mode, revenue, bill count)` of the bills of the range, per day and payment mode.
+    bills = (
+        model._base_manager.filter(**_day_filter(model, start, end))
+        .annotate(day=_day_expression(model))
+        .order_by()
+    )
+    column = money_field(model, amount_field)
+    if column != amount_field:
+        totals = bills.values("day", "payment_mode").annotate(revenue=Sum(column), bill_count=Count("pk"))
+        for total in totals:
+            yield total["day"], total["payment_mode"], total["revenue"] or Decimal("0.00"), total["bill_count"]
+        return
+
+    for day, payment_mode, amount in bills.values_list("day", "payment_mode", amount_field).iterator():
+        yield day, payment_mode, parse_money(amount) or Decimal("0.00"), 1
+
+
+def rebuild(start, end, departments=None):
+    sources = [source for source in source_models() if departments is None or source[0] in departments]
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            table = connection.ops.quote_name(DashboardStats._meta.db_table)
+            cursor.execute(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE")
+
+        DashboardStats.objects.filter(
+            date__range=(start, end), department__in=[department for department, _, _ in sources]
+        ).delete()
+
+        rows = []
+        for department, model, amount_field in sources:
+            totals = {}
+            for day, payment_mode, revenue, bill_count in _totals(model, amount_field, start, end):
+                # NULL and empty payment modes share a row.
+                total = totals.setdefault((day, payment_mode or ""), [Decimal("0.00"), 0])
+                total[0] += revenue
+                total[1] += bill_count
+            for (day, payment_mode), (revenue, bill_count) in totals.items():
+                rows.append(
+                    DashboardStats(
+                        date=day,
+                        department=department,
+                        payment_mode=payment_mode,
+                        revenue=revenue,
+                        bill_count=bill_count,
+                    )
+                )
+        DashboardStats.objects.bulk_create(rows, batch_size=1000)
+        _changed()
+    return len(rows)
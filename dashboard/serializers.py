@@ -1,7 +1,9 @@
 from rest_framework import serializers
+from clients.sparse_fields import SparseFieldsetMixin
 from .models import DashboardStats
 
-class DashboardStatsSerializer(serializers.ModelSerializer):
+class DashboardStatsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = DashboardStats
         fields = "__all__"
+
@@ -0,0 +1,57 @@
+"""
+This module contains the signal handlers that keep `DashboardStats` up to date as bills change.
+
+Signal Handlers (for the bill models of `dashboard.rollups.SOURCES`):
+1. `remember_stored_bill`:
+    - Connected to `pre_save`.
+    - Reads back the stored day, payment mode and amount of a bill being updated.
+
+2. `record_saved_bill` and `record_deleted_bill`:
+    - Connected to `post_save` and `post_delete`.
+    - Moves the bill's contribution from its stored to its new figures, or removes it.
+
+3. `remember_bulk_bills` and `record_bulk_bills`:
+    - Connected to `clients.bulk.pre_bulk_write` and `post_bulk_write`.
+    - The same for the rows of a bulk request, with one update per affected figure.
+
+Dependencies:
+- `pre_save`, `post_save` and `post_delete` signals from `django.db.models.signals`.
+- `pre_bulk_write` and `post_bulk_write` from `clients.bulk`, sent by the bulk write endpoints.
+- `rollups` from `dashboard` for the figures.
+"""
+
+from django.db.models.signals import pre_save, post_save, post_delete
+
+from clients.bulk import pre_bulk_write, post_bulk_write
+from . import rollups
+
+
+def remember_stored_bill(sender, instance, raw=False, **kwargs):
+    if not raw:
+        rollups.remember_previous([instance])
+
+
+def record_saved_bill(sender, instance, raw=False, **kwargs):
+    if not raw:
+        rollups.record_changes([instance])
+
+
+def record_deleted_bill(sender, instance, **kwargs):
+    rollups.record_deletes([instance])
+
+
+def remember_bulk_bills(sender, instances, created, **kwargs):
+    if not created:
+        rollups.remember_loaded(instances)
+
+
+def record_bulk_bills(sender, instances, **kwargs):
+    rollups.record_changes(instances)
+
+
+for _department, _model, _ in rollups.source_models():
+    pre_save.connect(remember_stored_bill, sender=_model, dispatch_uid=f"dashboard_pre_save_{_department}")
+    post_save.connect(record_saved_bill, sender=_model, dispatch_uid=f"dashboard_post_save_{_department}")
+    post_delete.connect(record_deleted_bill, sender=_model, dispatch_uid=f"dashboard_post_delete_{_department}")
+    pre_bulk_write.connect(remember_bulk_bills, sender=_model, dispatch_uid=f"dashboard_pre_bulk_{_department}")
+    post_bulk_write.connect(record_bulk_bills, sender=_model, dispatch_uid=f"dashboard_post_bulk_{_department}")
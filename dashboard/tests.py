@@ -1,3 +1,132 @@
-from django.test import TestCase
+import datetime
+from decimal import Decimal
 
-# Create your tests here.
+from django.test import override_settings
+from django.utils import timezone
+
+from clients.testing import TenantAPITestCase
+from pharmacy_module.models import PharmacyBill
+
+from . import rollups
+from .models import DashboardStats
+
+ROWS = 12
+
+
+class DashboardStatsListQueryCountTests(TenantAPITestCase):
+    def test_stats_list(self):
+        first_day = datetime.date(2024, 1, 1)
+        DashboardStats.objects.bulk_create(
+            DashboardStats(
+                date=first_day + datetime.timedelta(days=index), department="billing", payment_mode="cash"
+            )
+            for index in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/dashboard/stats")
+
+
+class DashboardRollupTests(TenantAPITestCase):
+    bulk_url = "/api/pharmacy/pharmacy-bill/bulk"
+
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.localdate()
+
+    def create_bill(self, net_amount, payment_mode="Cash"):
+        return PharmacyBill.objects.create(
+            tenant=self.tenant, user=self.admin, net_amount=net_amount, payment_mode=payment_mode
+        )
+
+    def stats(self):
+        return sorted(
+            DashboardStats.objects.values_list("date", "department", "payment_mode", "revenue", "bill_count")
+        )
+
+    def assert_matches_rebuild(self):
+        # The incrementally maintained rows must be the ones a rebuild of the same range computes.
+        incremental = self.stats()
+        rollups.rebuild(self.today - datetime.timedelta(days=10), self.today + datetime.timedelta(days=1))
+        self.assertEqual(self.stats(), incremental)
+        return incremental
+
+    def test_create(self):
+        self.create_bill("₹1,200.50")
+        self.create_bill("300", payment_mode="UPI")
+        self.create_bill("99.50")
+        self.assertEqual(
+            self.assert_matches_rebuild(),
+            [
+                (self.today, "pharmacy", "Cash", Decimal("1300.00"), 2),
+                (self.today, "pharmacy", "UPI", Decimal("300.00"), 1),
+            ],
+        )
+
+    def test_update_amount(self):
+        bill = self.create_bill("100")
+        bill.net_amount = "250.75"
+        bill.save()
+        self.assertEqual(self.assert_matches_rebuild(), [(self.today, "pharmacy", "Cash", Decimal("250.75"), 1)])
+
+    def test_update_amount_with_decimal_reads(self):
+        with override_settings(MONEY_DECIMAL_READS=True):
+            bill = self.create_bill("100")
+            bill.net_amount = "40"
+            bill.save()
+            self.assertEqual(self.assert_matches_rebuild(), [(self.today, "pharmacy", "Cash", Decimal("40.00"), 1)])
+
+    def test_update_payment_mode(self):
+        bill = self.create_bill("100")
+        self.create_bill("50", payment_mode="UPI")
+        bill.payment_mode = "UPI"
+        bill.save()
+        self.assertEqual(self.assert_matches_rebuild(), [(self.today, "pharmacy", "UPI", Decimal("150.00"), 2)])
+
+    def test_update_day(self):
+        bill = self.create_bill("100")
+        bill.created_at -= datetime.timedelta(days=2)
+        bill.save()
+        day = timezone.localdate(bill.created_at)
+        self.assertEqual(self.assert_matches_rebuild(), [(day, "pharmacy", "Cash", Decimal("100.00"), 1)])
+
+    def test_delete(self):
+        bill = self.create_bill("100")
+        self.create_bill("20")
+        bill.delete()
+        self.assertEqual(self.assert_matches_rebuild(), [(self.today, "pharmacy", "Cash", Decimal("20.00"), 1)])
+
+        PharmacyBill.objects.get().delete()
+        self.assertEqual(self.assert_matches_rebuild(), [])
+
+    def test_bulk_create_and_update(self):
+        headers = self.auth_headers(self.admin)
+        response = self.client.post(
+            self.bulk_url,
+            [{"net_amount": "100"}, {"net_amount": "Rs. 60", "payment_mode": "UPI"}, {"net_amount": "40"}],
+            content_type="application/json",
+            **headers,
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assert_matches_rebuild()
+
+        ids = [item["id"] for item in response.json()["data"]]
+        response = self.client.patch(
+            self.bulk_url,
+            [{"id": ids[0], "net_amount": "10"}, {"id": ids[1], "payment_mode": "Cash"}],
+            content_type="application/json",
+            **headers,
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.assert_matches_rebuild(), [(self.today, "pharmacy", "Cash", Decimal("110.00"), 3)])
+
+    def test_bills_saved_before_the_rollups_leave_no_negative_rows(self):
+        edited = self.create_bill("100")
+        deleted = self.create_bill("50", payment_mode="UPI")
+        DashboardStats.objects.all().delete()  # As before the first rebuild_dashboard_stats.
+
+        edited.net_amount = "80"
+        edited.save()
+        deleted.delete()
+        self.assertFalse(DashboardStats.objects.exists())
+
+        rollups.rebuild(self.today, self.today)
+        self.assertEqual(self.stats(), [(self.today, "pharmacy", "Cash", Decimal("80.00"), 1)])
@@ -2,5 +2,7 @@ from django.urls import path
 from . import views
 
 urlpatterns = [
-
+    path('stats', views.DashboardStatsListView.as_view(), name='dashboard-stats-list'),
+    path('summary', views.DashboardSummaryView.as_view(), name='dashboard-summary'),
+    path('kpis', views.DashboardKPIView.as_view(), name='dashboard-kpis'),
 ]
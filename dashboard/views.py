@@ -1 +1,81 @@
+import datetime
 
+from django.db.models import Sum
+from django.utils import timezone
+from rest_framework import fields, serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter, apply_filters
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
+from . import kpis
+from .models import DashboardStats
+from .serializers import DashboardStatsSerializer
+
+
+def _totals(row):
+    # Revenue as a string with two decimals, like `DashboardStatsSerializer`.
+    revenue = serializers.DecimalField(max_digits=16, decimal_places=2).to_representation(row["revenue"] or 0)
+    return {**row, "revenue": revenue, "bill_count": row["bill_count"] or 0}
+
+
+class DashboardStatsListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = DashboardStats
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+    list_filters = (DateRangeFilter("date"), ExactFilter("department"), ExactFilter("payment_mode"))
+    list_sort_fields = ("date",)
+    list_ordering = ("date", "id")
+
+    # GET: The daily revenue figures of the tenant, one row per day, department and payment mode
+    def get(self, request):
+        stats = DashboardStats.objects.all()
+        return self.list_response(request, stats, DashboardStatsSerializer)
+
+
+class DashboardSummaryView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+    list_filters = (DateRangeFilter("date"), ExactFilter("department"), ExactFilter("payment_mode"))
+
+    # GET: Revenue and bill count totals of a date range (today by default), by department and payment mode
+    def get(self, request):
+        stats = DashboardStats.objects.all()
+        if "date_after" not in request.query_params and "date_before" not in request.query_params:
+            stats = stats.filter(date=timezone.localdate())
+        stats = apply_filters(stats, self.list_filters, request)
+
+        not_modified = self.not_modified(request, stats, many=True)
+        if not_modified is not None:
+            return not_modified
+
+        totals = {"revenue": Sum("revenue"), "bill_count": Sum("bill_count")}
+        data = _totals(stats.aggregate(**totals))
+        data["by_department"] = [
+            _totals(row) for row in stats.order_by("department").values("department").annotate(**totals)
+        ]
+        data["by_payment_mode"] = [
+            _totals(row) for row in stats.order_by("payment_mode").values("payment_mode").annotate(**totals)
+        ]
+        return Response({"data": data}, status=status.HTTP_200_OK)
+
+
+class DashboardKPIView(ReadOnlyFastPathMixin, APIView):
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+
+    # GET: Occupancy, OPD visits, no-shows and pharmacy sales (last 30 days by default), read from the KPI views
+    def get(self, request):
+        end = self.parse_date(request, "date_before") or timezone.localdate()
+        start = self.parse_date(request, "date_after") or end - datetime.timedelta(days=29)
+        data = kpis.read_kpis(start, end)
+        return Response({"data": {"date_after": start, "date_before": end, **data}}, status=status.HTTP_200_OK)
+
+    def parse_date(self, request, param):
+        value = request.query_params.get(param)
+        if value is None:
+            return None
+        try:
+            return fields.DateField().run_validation(value)
+        except ValidationError as exc:
+            raise ValidationError({param: exc.detail})
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:55
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('ipd_module', '0003_keyset_pagination_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='ipd',
+            index=models.Index(models.F('doctor'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='ipd_doctor_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='ipd',
+            index=models.Index(models.F('patient'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='ipd_patient_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='ipdbill',
+            index=models.Index(models.F('doctor'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='ipdbill_doctor_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='ipdbill',
+            index=models.Index(models.F('payment_mode'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='ipdbill_paymode_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='ipdbill',
+            index=models.Index(models.F('patient'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='ipdbill_patient_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 from users.models import CustomUser, Tenant
 from patients.models import Patient
 from staff_management.models import Employee
+from clients.money import MoneyColumnsMixin
 
 
 class IPD(models.Model):
@@ -32,13 +33,43 @@ class IPD(models.Model):
     floor = models.CharField(max_length=10, blank=True, null=True)
     casualty = models.CharField(max_length=5, choices=CASUALTY_CHOICES, default="No")
     notes = models.TextField(blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipd_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipd_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipd_doctor_idx",
+            ),
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipd_patient_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
     
-class IPDBill(models.Model):
+class IPDBill(MoneyColumnsMixin, models.Model):
     
     PAYMENT_CHOICES = [
         ("Cash", "Cash"),
@@ -86,8 +117,54 @@ class IPDBill(models.Model):
     net_amount = models.CharField(max_length=50, blank=True, null=True)
     paid_amount = models.CharField(max_length=50, blank=True, null=True)
     due_amount = models.CharField(max_length=50, blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    # Numeric shadows of the amounts above (clients.money)
+    cost_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    tax_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    discount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    total_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    subtotal_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    net_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    paid_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    due_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipdbill_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipdbill_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipdbill_doctor_idx",
+            ),
+            models.Index(
+                models.F("payment_mode"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipdbill_paymode_idx",
+            ),
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="ipdbill_patient_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
\ No newline at end of file
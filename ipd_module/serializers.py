@@ -1,8 +1,9 @@
 from .models import IPD,IPDBill 
 from rest_framework import serializers
+from clients.sparse_fields import SparseFieldsetMixin
 
 
-class IPDSerializer(serializers.ModelSerializer):
+class IPDSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = IPD
         fields = "__all__"
@@ -12,7 +13,7 @@ class IPDCreateUpdateSerializer(serializers.ModelSerializer):
         model = IPD
         fields = "__all__"
 
-class IPDBillSerializer(serializers.ModelSerializer):
+class IPDBillSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = IPDBill
         fields = "__all__"
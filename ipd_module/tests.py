@@ -1,3 +1,67 @@
-from django.test import TestCase
+from clients.testing import TenantAPITestCase
+from patients.models import Patient
+from staff_management.models import Employee
 
-# Create your tests here.
+from .models import IPD, IPDBill
+
+ROWS = 12
+
+
+class IPDListQueryCountTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.doctor = Employee.objects.create(name="Doctor", user=self.admin)
+        self.patient = Patient.objects.create(tenant=self.tenant, user=self.admin, doctor=self.doctor)
+
+    def test_ipd_list(self):
+        IPD.objects.bulk_create(
+            IPD(tenant=self.tenant, user=self.admin, patient=self.patient, doctor=self.doctor) for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/ipd/ipd")
+
+    def test_ipd_bill_list(self):
+        IPDBill.objects.bulk_create(
+            IPDBill(tenant=self.tenant, user=self.admin, patient=self.patient, doctor=self.doctor)
+            for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/ipd/ipd-bill")
+
+
+class IPDBillBulkOwnershipTests(TenantAPITestCase):
+    url = "/api/ipd/ipd-bill/bulk"
+
+    def setUp(self):
+        super().setUp()
+        self.own_bill = IPDBill.objects.create(tenant=self.tenant, user=self.member)
+        self.admin_bill = IPDBill.objects.create(tenant=self.tenant, user=self.admin)
+
+    def patch(self, user, items):
+        return self.client.patch(self.url, items, content_type="application/json", **self.auth_headers(user))
+
+    def delete(self, user, ids):
+        return self.client.delete(
+            self.url, {"ids": ids}, content_type="application/json", **self.auth_headers(user)
+        )
+
+    def test_member_cannot_update_rows_of_others(self):
+        response = self.patch(self.member, [{"id": self.own_bill.id}, {"id": self.admin_bill.id}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], [{"index": 1, "errors": {"id": ["Not found."]}}])
+
+    def test_member_updates_own_rows(self):
+        response = self.patch(self.member, [{"id": self.own_bill.id}])
+        self.assertEqual(response.status_code, 200)
+
+    def test_member_delete_skips_rows_of_others(self):
+        response = self.delete(self.member, [self.own_bill.id, self.admin_bill.id])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["data"],
+            [{"id": self.own_bill.id, "deleted": True}, {"id": self.admin_bill.id, "deleted": False}],
+        )
+        self.assertTrue(IPDBill.objects.filter(pk=self.admin_bill.pk).exists())
+
+    def test_admin_changes_every_row(self):
+        response = self.delete(self.admin, [self.own_bill.id, self.admin_bill.id])
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(IPDBill.objects.exists())
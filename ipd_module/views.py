@@ -7,25 +7,25 @@ from .serializers import *
 from .models import IPD,IPDBill
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.bulk import BulkWriteMixin
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class IPDListView(APIView):
+class IPDListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = IPD
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("doctor"), ExactFilter("patient"))
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all ipd for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter ipd with the specific patient ID
-            ipd = IPD.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all ipd if no 'patient' parameter is provided
-            ipd = IPD.objects.filter(tenant=request.tenant)
+        ipd = IPD.objects.filter(tenant=request.tenant)
         
-        serializer = IPDSerializer(ipd, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, ipd, IPDSerializer)
 
     # POST: Add a new IPD
     def post(self, request):
@@ -40,13 +40,13 @@ class IPDListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class IPDManagementView(APIView):
+class IPDManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, ipd_id):
         try:
             ipd = IPD.objects.get(id=ipd_id, tenant=request.tenant)
-            serializer = IPDSerializer(ipd)
+            serializer = IPDSerializer(ipd, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except IPD.DoesNotExist:
             return Response({"msg": "IPD not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -81,12 +81,17 @@ class IPDManagementView(APIView):
 
    
     def get(self, request, ipd_id):
+        # Tenant admin can access all ipd, while users can only access their own ipd
+        ipds = IPD.objects.filter(id=ipd_id)
+        if not request.user.is_tenant_admin:
+            ipds = ipds.filter(user=request.user)
+
+        not_modified = self.not_modified(request, ipds)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all ipd, while users can only access their own ipd
-            if request.user.is_tenant_admin:
-                ipd = IPD.objects.get(id=ipd_id)
-            else:
-                ipd = IPD.objects.get(id=ipd_id, user=request.user)
+            ipd = ipds.get()
         except IPD.DoesNotExist as e:
             logger.critical(f"Error fetching ipd: {e}")
             return Response(
@@ -94,7 +99,7 @@ class IPDManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = IPDSerializer(ipd)
+        serializer = IPDSerializer(ipd, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific ipd details
@@ -139,21 +144,22 @@ class IPDManagementView(APIView):
         return Response({"msg": "IPD deleted successfully!"}, status=status.HTTP_200_OK)
    
     
-class IPDBillListView(APIView):
+class IPDBillListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = IPDBill
+    list_filters = (
+        DateRangeFilter("created_at"),
+        ExactFilter("doctor"),
+        ExactFilter("payment_mode"),
+        ExactFilter("patient"),
+    )
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all ipd for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter ipd bill with the specific patient ID
-            ipd = IPDBill.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all ipd bill if no 'patient' parameter is provided
-            ipd = IPDBill.objects.filter(tenant=request.tenant)
+        ipd = IPDBill.objects.filter(tenant=request.tenant)
         
-        serializer = IPDBillSerializer(ipd, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, ipd, IPDBillSerializer)
 
     # POST: Add a new IPD Bill
     def post(self, request):
@@ -168,13 +174,18 @@ class IPDBillListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class IPDBillManagementView(APIView):
+class IPDBillBulkView(ReadOnlyFastPathMixin, BulkWriteMixin, APIView):
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+    bulk_serializer_class = IPDBillCreateUpdateSerializer
+
+
+class IPDBillManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, ipd_bill_id):
         try:
             ipd = IPDBill.objects.get(id=ipd_bill_id, tenant=request.tenant)
-            serializer = IPDBillSerializer(ipd)
+            serializer = IPDBillSerializer(ipd, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except IPDBill.DoesNotExist:
             return Response({"msg": "IPD Bill not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -209,12 +220,17 @@ class IPDBillManagementView(APIView):
 
    
     def get(self, request, ipd_bill_id):
+        # Tenant admin can access all ipd, while users can only access their own ipd
+        ipd_bills = IPDBill.objects.filter(id=ipd_bill_id)
+        if not request.user.is_tenant_admin:
+            ipd_bills = ipd_bills.filter(user=request.user)
+
+        not_modified = self.not_modified(request, ipd_bills)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all ipd, while users can only access their own ipd
-            if request.user.is_tenant_admin:
-                ipd = IPDBill.objects.get(id=ipd_bill_id)
-            else:
-                ipd = IPDBill.objects.get(id=ipd_bill_id, user=request.user)
+            ipd = ipd_bills.get()
         except IPDBill.DoesNotExist as e:
             logger.critical(f"Error fetching ipd bill: {e}")
             return Response(
@@ -222,7 +238,7 @@ class IPDBillManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = IPDBillSerializer(ipd)
+        serializer = IPDBillSerializer(ipd, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific ipd details
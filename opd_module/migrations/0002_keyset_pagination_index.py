@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('opd_module', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='opd',
+            index=models.Index(models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='opd_keyset_idx'),
+        ),
+    ]
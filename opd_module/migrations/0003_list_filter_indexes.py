@@ -0,0 +1,32 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:55
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('opd_module', '0002_keyset_pagination_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='opd',
+            index=models.Index(models.F('doctor'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='opd_doctor_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='opd',
+            index=models.Index(models.F('payment_mode'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='opd_paymode_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='opd',
+            index=models.Index(models.F('patient'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='opd_patient_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='opd',
+            index=models.Index(models.OrderBy(models.F('appointment_date'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='opd_appt_date_idx'),
+        ),
+    ]
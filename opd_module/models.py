@@ -2,9 +2,10 @@ from django.db import models
 from users.models import CustomUser, Tenant
 from patients.models import Patient
 from staff_management.models import Employee
+from clients.money import MoneyColumnsMixin
 
 
-class OPD(models.Model):
+class OPD(MoneyColumnsMixin, models.Model):
     
     CHARGE_CHOICES = [
         ("OPD Consultation Fees", "OPD Consultation Fees"),
@@ -39,8 +40,60 @@ class OPD(models.Model):
     due_amount = models.CharField(max_length=50, blank=True, null=True)
     live_consult = models.CharField(max_length=5, choices=CONSULT_CHOICES, default="No")
     notes = models.TextField(blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    # Numeric shadows of the amounts above (clients.money)
+    charge_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    paid_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    due_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="opd_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="opd_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="opd_doctor_idx",
+            ),
+            models.Index(
+                models.F("payment_mode"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="opd_paymode_idx",
+            ),
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="opd_patient_idx",
+            ),
+            models.Index(
+                models.F("appointment_date").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="opd_appt_date_idx",
+            ),
+            # A doctor's schedule (`?doctor=` with `?appointment_date_*` or `?ordering=appointment_date`)
+            models.Index(
+                models.F("doctor"),
+                models.F("appointment_date").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="opd_doctor_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
\ No newline at end of file
@@ -1,8 +1,9 @@
 from .models import OPD 
 from rest_framework import serializers
+from clients.sparse_fields import SparseFieldsetMixin
 
 
-class OPDSerializer(serializers.ModelSerializer):
+class OPDSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = OPD
         fields = "__all__"
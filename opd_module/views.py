@@ -7,25 +7,30 @@ from .serializers import *
 from .models import OPD
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class OPDListView(APIView):
+class OPDListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = OPD
+    list_filters = (
+        DateRangeFilter("created_at"),
+        DateRangeFilter("appointment_date"),
+        ExactFilter("doctor"),
+        ExactFilter("payment_mode"),
+        ExactFilter("patient"),
+    )
+    list_sort_fields = ("created_at", "appointment_date")
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all opd for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter opd with the specific patient ID
-            opd = OPD.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all opd if no 'patient' parameter is provided
-            opd = OPD.objects.filter(tenant=request.tenant)
+        opd = OPD.objects.filter(tenant=request.tenant)
         
-        serializer = OPDSerializer(opd, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, opd, OPDSerializer)
 
     # POST: Add a new OPD
     def post(self, request):
@@ -40,13 +45,13 @@ class OPDListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class OPDManagementView(APIView):
+class OPDManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, opd_id):
         try:
             opd = OPD.objects.get(id=opd_id, tenant=request.tenant)
-            serializer = OPDSerializer(opd)
+            serializer = OPDSerializer(opd, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except OPD.DoesNotExist:
             return Response({"msg": "OPD not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -81,12 +86,17 @@ class OPDManagementView(APIView):
 
    
     def get(self, request, opd_id):
+        # Tenant admin can access all opd, while users can only access their own opd
+        opds = OPD.objects.filter(id=opd_id)
+        if not request.user.is_tenant_admin:
+            opds = opds.filter(user=request.user)
+
+        not_modified = self.not_modified(request, opds)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all opd, while users can only access their own opd
-            if request.user.is_tenant_admin:
-                opd = OPD.objects.get(id=opd_id)
-            else:
-                opd = OPD.objects.get(id=opd_id, user=request.user)
+            opd = opds.get()
         except OPD.DoesNotExist as e:
             logger.critical(f"Error fetching opd: {e}")
             return Response(
@@ -94,7 +104,7 @@ class OPDManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = OPDSerializer(opd)
+        serializer = OPDSerializer(opd, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific opd details
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pathology_module', '0004_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pathologybill',
+            name='amount_decimal',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='pathologybill',
+            name='discount_decimal',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='pathologybill',
+            name='net_amount_decimal',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='pathologybill',
+            name='payment_amount_decimal',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=12, null=True),
+        ),
+    ]
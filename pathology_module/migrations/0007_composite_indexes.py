@@ -0,0 +1,24 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('pathology_module', '0006_typed_dates'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='pathology',
+            index=models.Index(models.F('tenant'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='pathology_tenant_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='pathologybill',
+            index=models.Index(models.F('tenant'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='pathologybill_tenant_idx'),
+        ),
+    ]
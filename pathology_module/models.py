@@ -2,6 +2,7 @@ from django.db import models
 from users.models import CustomUser, Tenant
 from patients.models import Patient
 from staff_management.models import Employee
+from clients.money import MoneyColumnsMixin
 
 
 class Pathology(models.Model):
@@ -19,13 +20,37 @@ class Pathology(models.Model):
     charge_amount = models.CharField(max_length=10, blank=True, null=True)
     tax = models.TextField(blank=True, null=True)
     total_amount = models.TextField(blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathology_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathology_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathology_patient_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
     
-class PathologyBill(models.Model):
+class PathologyBill(MoneyColumnsMixin, models.Model):
     
     PAYMENT_CHOICES = [
         ("Cash", "Cash"),
@@ -48,8 +73,49 @@ class PathologyBill(models.Model):
     net_amount = models.CharField(max_length=10,blank=True, null=True)
     payment_mode = models.CharField(max_length=50, choices=PAYMENT_CHOICES, default="Cash")
     payment_amount = models.CharField(max_length=10,blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    # Numeric shadows of the amounts above (clients.money)
+    amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    discount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    net_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    payment_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathologybill_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathologybill_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathologybill_doctor_idx",
+            ),
+            models.Index(
+                models.F("payment_mode"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathologybill_paymode_idx",
+            ),
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pathologybill_patient_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
\ No newline at end of file
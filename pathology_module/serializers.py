@@ -1,8 +1,9 @@
 from .models import Pathology,PathologyBill 
 from rest_framework import serializers
+from clients.sparse_fields import SparseFieldsetMixin
 
 
-class PathologySerializer(serializers.ModelSerializer):
+class PathologySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Pathology
         fields = "__all__"
@@ -12,7 +13,7 @@ class PathologyCreateUpdateSerializer(serializers.ModelSerializer):
         model = Pathology
         fields = "__all__"
 
-class PathologyBillSerializer(serializers.ModelSerializer):
+class PathologyBillSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = PathologyBill
         fields = "__all__"
@@ -1,3 +1,27 @@
-from django.test import TestCase
+from clients.testing import TenantAPITestCase
+from patients.models import Patient
+from staff_management.models import Employee
 
-# Create your tests here.
+from .models import Pathology, PathologyBill
+
+ROWS = 12
+
+
+class PathologyListQueryCountTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.doctor = Employee.objects.create(name="Doctor", user=self.admin)
+        self.patient = Patient.objects.create(tenant=self.tenant, user=self.admin, doctor=self.doctor)
+
+    def test_pathology_list(self):
+        Pathology.objects.bulk_create(
+            Pathology(tenant=self.tenant, user=self.admin, patient=self.patient) for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/pathology/pathology")
+
+    def test_pathology_bill_list(self):
+        PathologyBill.objects.bulk_create(
+            PathologyBill(tenant=self.tenant, user=self.admin, patient=self.patient, doctor=self.doctor)
+            for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/pathology/pathology-bill")
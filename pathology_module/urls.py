@@ -3,6 +3,7 @@ from .views import *
 
 urlpatterns = [
     path("pathology", PathologyListView.as_view(), name="pathology-list"),
+    path("pathology/bulk", PathologyBulkView.as_view(), name="pathology-bulk"),
     path("pathology/<int:pathology_id>", PathologyManagementView.as_view(), name="pathology-manage"),
     path("pathology-bill", PathologyBillListView.as_view(), name="pathology-bill-list"),
     path("pathology-bill/<int:pathology_bill_id>", PathologyBillManagementView.as_view(), name="pathology-bill-manage"),
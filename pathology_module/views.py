@@ -7,25 +7,25 @@ from .serializers import *
 from .models import Pathology,PathologyBill
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.bulk import BulkWriteMixin
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class PathologyListView(APIView):
+class PathologyListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Pathology
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("patient"))
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all pathology for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter pathology with the specific patient ID
-            pathology = Pathology.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all pathology if no 'patient' parameter is provided
-            pathology = Pathology.objects.filter(tenant=request.tenant)
+        pathology = Pathology.objects.filter(tenant=request.tenant)
         
-        serializer = PathologySerializer(pathology, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, pathology, PathologySerializer)
 
     # POST: Add a new Pathology
     def post(self, request):
@@ -40,13 +40,18 @@ class PathologyListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class PathologyManagementView(APIView):
+class PathologyBulkView(ReadOnlyFastPathMixin, BulkWriteMixin, APIView):
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+    bulk_serializer_class = PathologyCreateUpdateSerializer
+
+
+class PathologyManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, pathology_id):
         try:
             pathology = Pathology.objects.get(id=pathology_id, tenant=request.tenant)
-            serializer = PathologySerializer(pathology)
+            serializer = PathologySerializer(pathology, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except Pathology.DoesNotExist:
             return Response({"msg": "Pathology not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -81,12 +86,17 @@ class PathologyManagementView(APIView):
 
    
     def get(self, request, pathology_id):
+        # Tenant admin can access all pathology, while users can only access their own pathology
+        pathologies = Pathology.objects.filter(id=pathology_id)
+        if not request.user.is_tenant_admin:
+            pathologies = pathologies.filter(user=request.user)
+
+        not_modified = self.not_modified(request, pathologies)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all pathology, while users can only access their own pathology
-            if request.user.is_tenant_admin:
-                pathology = Pathology.objects.get(id=pathology_id)
-            else:
-                pathology = Pathology.objects.get(id=pathology_id, user=request.user)
+            pathology = pathologies.get()
         except Pathology.DoesNotExist as e:
             logger.critical(f"Error fetching pathology: {e}")
             return Response(
@@ -94,7 +104,7 @@ class PathologyManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = PathologySerializer(pathology)
+        serializer = PathologySerializer(pathology, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific pathology details
@@ -139,21 +149,22 @@ class PathologyManagementView(APIView):
         return Response({"msg": "Pathology deleted successfully!"}, status=status.HTTP_200_OK)
    
     
-class PathologyBillListView(APIView):
+class PathologyBillListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = PathologyBill
+    list_filters = (
+        DateRangeFilter("created_at"),
+        ExactFilter("doctor"),
+        ExactFilter("payment_mode"),
+        ExactFilter("patient"),
+    )
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all pathology for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter pathology bill with the specific patient ID
-            pathology = PathologyBill.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all pathology bill if no 'patient' parameter is provided
-            pathology = PathologyBill.objects.filter(tenant=request.tenant)
+        pathology = PathologyBill.objects.filter(tenant=request.tenant)
         
-        serializer = PathologyBillSerializer(pathology, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, pathology, PathologyBillSerializer)
 
     # POST: Add a new Pathology Bill
     def post(self, request):
@@ -168,13 +179,13 @@ class PathologyBillListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class PathologyBillManagementView(APIView):
+class PathologyBillManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, pathology_bill_id):
         try:
             pathology = PathologyBill.objects.get(id=pathology_bill_id, tenant=request.tenant)
-            serializer = PathologyBillSerializer(pathology)
+            serializer = PathologyBillSerializer(pathology, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except PathologyBill.DoesNotExist:
             return Response({"msg": "Pathology Bill not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -209,12 +220,17 @@ class PathologyBillManagementView(APIView):
 
    
     def get(self, request, pathology_bill_id):
+        # Tenant admin can access all pathology, while users can only access their own pathology
+        pathology_bills = PathologyBill.objects.filter(id=pathology_bill_id)
+        if not request.user.is_tenant_admin:
+            pathology_bills = pathology_bills.filter(user=request.user)
+
+        not_modified = self.not_modified(request, pathology_bills)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all pathology, while users can only access their own pathology
-            if request.user.is_tenant_admin:
-                pathology = PathologyBill.objects.get(id=pathology_bill_id)
-            else:
-                pathology = PathologyBill.objects.get(id=pathology_bill_id, user=request.user)
+            pathology = pathology_bills.get()
         except PathologyBill.DoesNotExist as e:
             logger.critical(f"Error fetching pathology bill: {e}")
             return Response(
@@ -222,7 +238,7 @@ class PathologyBillManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = PathologyBillSerializer(pathology)
+        serializer = PathologyBillSerializer(pathology, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific pathology details
@@ -1,5 +1,6 @@
 from django.contrib import admin
 
-from .models import Patient
+from .models import Patient, PatientLedgerEntry
 
 admin.site.register(Patient)
+admin.site.register(PatientLedgerEntry)
@@ -0,0 +1,174 @@
+"""
+This module maintains `PatientLedgerEntry`, one denormalized row per bill of a patient with the patient's running
+balance, so an account statement is one indexed query instead of six queries merged in Python.
+
+Sources (`SOURCES`), as `(model, charged field, paid field, due field)`:
+- `opd`: `OPD.charge`, paid `paid_amount`.
+- `ipd`: `IPDBill.net_amount`, paid `paid_amount`.
+- `pharmacy`, `pathology`, `radiology`: the bill's `net_amount`, paid `payment_amount`.
+- `billing`: `Billing.amount`, paid `amount - amount_due`.
+Amounts are read with `clients.money.read_money`: from the legacy text columns, parsed, until `MONEY_DECIMAL_READS`
+is on, and from the numeric money columns after, so entries are right before and after the backfill; amounts that
+cannot be parsed count as zero. Bills without a patient have
+no entry. An entry is dated on its bill's `created_at` (now when the bill has none).
+
+Writes (connected by `patients.signals` to `post_save`/`post_delete` of the bill models and to the bulk write
+signals of `clients.bulk`):
+- `record(instances)` upserts the entries of the bills, and `remove(instances)` deletes them, in one transaction
+  with the patients' rows locked (`SELECT ... FOR UPDATE`), so concurrent bills of a patient are applied one
+  after the other.
+- Both then recompute the `balance` of the affected patients' entries with one `UPDATE` using a running
+  `SUM(debit - credit)` window, which also handles bills whose date, amounts or patient changed. Only rows whose
+  balance changed are written.
+
+Functions:
+- `source_of(model)`: Returns the source name of a bill model, `None` for other models.
+- `record(instances)`: Creates or updates the entries of saved bills.
+- `remove(instances)`: Deletes the entries of deleted bills.
+- `recompute_balances(patient_ids=None)`: Recomputes the running balances of the patients (all by default).
+
+Dependencies:
+- `PatientLedgerEntry` and `Patient` from `patients.models`.
+- `read_money` from `clients.money` for the amounts.
+- `connection` and `transaction` from `django.db` for the balance update and the locks.
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.utils import timezone
+
+from clients.money import read_money
+from .models import Patient, PatientLedgerEntry
+
+
+SOURCES = {
+    "opd": ("opd_module.OPD", "charge", "paid_amount", None),
+    "ipd": ("ipd_module.IPDBill", "net_amount", "paid_amount", None),
+    "pharmacy": ("pharmacy_module.PharmacyBill", "net_amount", "payment_amount", None),
+    "pathology": ("pathology_module.PathologyBill", "net_amount", "payment_amount", None),
+    "radiology": ("radiology_module.RadiologyBill", "net_amount", "payment_amount", None),
+    "billing": ("billing_counter.Billing", "amount", None, "amount_due"),
+}
+
+ENTRY_FIELDS = ["tenant_id", "patient_id", "payment_mode", "debit", "credit", "created_at"]
+
+
+def source_models():
+    return [(source, apps.get_model(spec[0])) for source, spec in SOURCES.items()]
+
+
+def source_of(model):
+    for source, spec in SOURCES.items():
+        if model._meta.label == spec[0]:
+            return source
+    return None
+
+
+def _amount(instance, field):
+    return read_money(instance, field) or Decimal("0.00")
+
+
+def entry_values(instance):
+    _, charged_field, paid_field, due_field = SOURCES[source_of(type(instance))]
+    debit = _amount(instance, charged_field)
+    credit = _amount(instance, paid_field) if paid_field else debit - _amount(instance, due_field)
+    return {
+        "tenant_id": instance.tenant_id,
+        "patient_id": instance.patient_id,
+        "payment_mode": instance.payment_mode or "",
+        "debit": debit,
+        "credit": credit,
+        "created_at": instance.created_at or timezone.now(),
+    }
+
+
+def _lock_patients(patient_ids):
+    # In primary key order, so two transactions locking the same patients cannot deadlock.
+    list(Patient.objects.select_for_update().filter(pk__in=patient_ids).order_by("pk").values_list("pk", flat=True))
+
+
+def _existing(instances):
+    # {(source, source_id): (entry id, patient id)} of the entries of the instances.
+    by_source = defaultdict(list)
+    for instance in instances:
+        by_source[source_of(type(instance))].append(instance.pk)
+    existing = {}
+    for source, ids in by_source.items():
+        rows = PatientLedgerEntry.objects.filter(source=source, source_id__in=ids)
+        for pk, source_id, patient_id in rows.values_list("pk", "source_id", "patient_id"):
+            existing[source, source_id] = (pk, patient_id)
+    return existing
+
+
+def record(instances):
+    instances = [instance for instance in instances if instance.pk is not None]
+    if not instances:
+        return
+    now = timezone.now()
+    with transaction.atomic():
+        existing = _existing(instances)
+        entries = [(instance, entry_values(instance)) for instance in instances]
+        patient_ids = {values["patient_id"] for _, values in entries} | {
+            patient_id for _, patient_id in existing.values()
+        }
+        patient_ids.discard(None)
+        _lock_patients(patient_ids)
+
+        to_create, to_update, to_delete = [], [], []
+        for instance, values in entries:
+            source = source_of(type(instance))
+            entry_id, _ = existing.get((source, instance.pk), (None, None))
+            if values["patient_id"] is None:
+                if entry_id is not None:
+                    to_delete.append(entry_id)
+                continue
+            entry = PatientLedgerEntry(pk=entry_id, source=source, source_id=instance.pk, updated_at=now, **values)
+            (to_update if entry_id is not None else to_create).append(entry)
+
+        if to_create:
+            PatientLedgerEntry.objects.bulk_create(to_create)
+        if to_update:
+            PatientLedgerEntry.objects.bulk_update(to_update, [*ENTRY_FIELDS, "updated_at"])
+        if to_delete:
+            PatientLedgerEntry.objects.filter(pk__in=to_delete).delete()
+        recompute_balances(patient_ids)
+
+
+def remove(instances):
+    with transaction.atomic():
+        existing = _existing(instances)
+        if not existing:
+            return
+        patient_ids = {patient_id for _, patient_id in existing.values()}
+        _lock_patients(patient_ids)
+        PatientLedgerEntry.objects.filter(pk__in=[entry_id for entry_id, _ in existing.values()]).delete()
+        recompute_balances(patient_ids)
+
+
+def recompute_balances(patient_ids=None):
+    if patient_ids is not None and not patient_ids:
+        return 0
+    table = connection.ops.quote_name(PatientLedgerEntry._meta.db_table)
+    where, params = "", []
+    if patient_ids is not None:
+        where, params = "WHERE patient_id = ANY(%s)", [sorted(patient_ids)]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} AS entry
+            SET balance = running.balance
+            FROM (
+                SELECT id, SUM(debit - credit) OVER (
+                    PARTITION BY patient_id ORDER BY created_at, id
+                ) AS balance
+                FROM {table}
+                {where}
+            ) AS running
+            WHERE entry.id = running.id AND entry.balance IS DISTINCT FROM running.balance
+            """,
+            params,
+        )
+        return cursor.rowcount
@@ -0,0 +1,51 @@
+"""
+Management command to fill the patient ledger (`patients.ledger`) from the existing bills.
+
+Usage:
+    python manage.py rebuild_patient_ledger [--schema <schema_name>] [--source pharmacy ...] [--batch-size 1000]
+                                            [--sleep 0.1]
+
+For every tenant schema (or `--schema`), the bills of every source (or `--source`) are read in primary key batches
+(see `clients.management.base.TenantBatchCommand`) and their ledger entries written with `patients.ledger.record`,
+in a short transaction per batch, the same way a bill save does; entries left by bills that no longer exist are
+deleted and every running balance is recomputed at the end. Run it once after deploying the ledger; it can be stopped and re-run at any time, and bills saved
+meanwhile keep their entries up to date themselves.
+"""
+
+from clients.management.base import TenantBatchCommand
+from patients import ledger
+from patients.models import PatientLedgerEntry
+
+
+class Command(TenantBatchCommand):
+    help = "Write the patient ledger entries of the existing bills and recompute the running balances."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--source", action="append", dest="sources", choices=sorted(ledger.SOURCES))
+
+    def handle_schema(self, schema_name, options):
+        for source, model in ledger.source_models():
+            if options["sources"] and source not in options["sources"]:
+                continue
+            bills = self.rebuild_source(model, options)
+            orphans = (
+                PatientLedgerEntry.objects.filter(source=source)
+                .exclude(source_id__in=model._base_manager.values("pk"))
+                .delete()[0]
+            )
+            self.stdout.write(f"{schema_name}: {source}: {bills} bills recorded, {orphans} orphan entries deleted")
+        updated = ledger.recompute_balances()
+        self.stdout.write(f"{schema_name}: {updated} balances updated")
+
+    def rebuild_source(self, model, options):
+        count = 0
+
+        def process(bills):
+            nonlocal count
+            ledger.record(bills)
+            count += len(bills)
+            return False  # The bills themselves are unchanged.
+
+        self.run_batches(model._base_manager.all(), None, process, options)
+        return count
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_schemamigration'),
+        ('patients', '0010_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatientLedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('opd', 'OPD'), ('ipd', 'IPD'), ('pharmacy', 'Pharmacy'), ('pathology', 'Pathology'), ('radiology', 'Radiology'), ('billing', 'Billing')], max_length=20)),
+                ('source_id', models.BigIntegerField()),
+                ('payment_mode', models.CharField(blank=True, default='', max_length=50)),
+                ('debit', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('credit', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('balance', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('created_at', models.DateField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('patient', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='ledger_entries', to='patients.patient')),
+                ('tenant', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='users.tenant')),
+            ],
+            options={
+                'verbose_name_plural': 'patient ledger entries',
+                'indexes': [models.Index(models.F('patient'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='patientledger_patient_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='patientledgerentry',
+            constraint=models.UniqueConstraint(fields=('source', 'source_id'), name='patientledgerentry_source_key'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0011_patient_ledger'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='patient',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='patientledgerentry',
+            name='created_at',
+            field=models.DateTimeField(),
+        ),
+    ]
@@ -44,6 +44,7 @@ class Patient(models.Model):
     blood_group = models.CharField(max_length=3, choices=BLOOD_GROUP_CHOICES, default="A+")
     marital_status = models.CharField(max_length=15, choices=MARITAL_STATUS_CHOICES, default="Not Specified")
     image = models.TextField(blank=True, null=True)
+    image_blob = models.ForeignKey("blobs.Blob", on_delete=models.PROTECT, null=True, blank=True, editable=False, db_index=False, related_name="+")
     department = models.CharField(max_length=50, null=True)
     email = models.EmailField(max_length=100, unique=True, null=True)
     address = models.TextField(blank=True, null=True)
@@ -55,8 +56,82 @@ class Patient(models.Model):
     tpa_id = models.CharField(max_length=50, null=True, blank=True)
     tpa_validity = models.CharField(max_length=50, null=True, blank=True)
     identity_no = models.CharField(max_length=50, null=True, blank=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="patient_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="patient_tenant_idx",
+            ),
+            # Per-user lists (`PatientView`), in keyset order
+            models.Index(
+                models.F("user"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="patient_user_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="patient_doctor_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.user.email})"
+
+
+class PatientLedgerEntry(models.Model):
+    # One row per bill, written by `patients.ledger` when the bill is saved; `balance` is the patient's
+    # outstanding due after this entry, in (created_at, id) order.
+
+    SOURCE_CHOICES = [
+        ("opd", "OPD"),
+        ("ipd", "IPD"),
+        ("pharmacy", "Pharmacy"),
+        ("pathology", "Pathology"),
+        ("radiology", "Radiology"),
+        ("billing", "Billing"),
+    ]
+
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, null=True)
+    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, db_index=False, related_name="ledger_entries")
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES)
+    source_id = models.BigIntegerField()
+    payment_mode = models.CharField(max_length=50, blank=True, default="")
+    debit = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    credit = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    balance = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "patient ledger entries"
+        constraints = [
+            models.UniqueConstraint(fields=["source", "source_id"], name="patientledgerentry_source_key"),
+        ]
+        indexes = [
+            # Statements and the outstanding due, newest first (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(),
+                models.F("id").desc(),
+                name="patientledger_patient_idx",
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.name} ({self.user.email})"
\ No newline at end of file
+        return f"{self.patient_id} {self.source} {self.source_id}: {self.debit} - {self.credit} = {self.balance}"
@@ -1,7 +1,17 @@
 from rest_framework import serializers
-from .models import Patient
+from blobs.fields import BlobField, BlobUploadMixin
+from clients.sparse_fields import SparseFieldsetMixin
+from .models import Patient, PatientLedgerEntry
+
+class PatientSerializer(BlobUploadMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    heavy_fields = ("image",)
+    image = BlobField(legacy_field="image", blob_field="image_blob", required=False, allow_null=True)
 
-class PatientSerializer(serializers.ModelSerializer):
     class Meta:
         model = Patient
-        fields = ["id", "patient_id", "name", "phone", "guardian_name", "guardian_phone", "doctor_id", "age", "gender", "blood_group", "marital_status","department", "email", "address", "city", "state", "zip", "allergies", "remarks", "tpa_id", "tpa_validity", "identity_no", "created_at", "updated_at"]
+        fields = ["id", "patient_id", "name", "phone", "guardian_name", "guardian_phone", "doctor_id", "age", "gender", "blood_group", "marital_status", "image", "department", "email", "address", "city", "state", "zip", "allergies", "remarks", "tpa_id", "tpa_validity", "identity_no", "created_at", "updated_at"]
+
+class PatientLedgerEntrySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    class Meta:
+        model = PatientLedgerEntry
+        fields = ["id", "patient", "source", "source_id", "payment_mode", "debit", "credit", "balance", "created_at", "updated_at"]
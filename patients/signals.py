@@ -0,0 +1,41 @@
+"""
+This module contains the signal handlers that keep the patient ledger (`patients.ledger`) up to date as bills change.
+
+Signal Handlers (for the bill models of `patients.ledger.SOURCES`):
+1. `record_saved_bill` and `remove_deleted_bill`:
+    - Connected to `post_save` and `post_delete`.
+    - Writes or deletes the bill's ledger entry and recomputes the patient's running balance.
+
+2. `record_bulk_bills`:
+    - Connected to `clients.bulk.post_bulk_write`.
+    - The same for all the rows of a bulk request at once.
+
+Dependencies:
+- `post_save` and `post_delete` signals from `django.db.models.signals`.
+- `post_bulk_write` from `clients.bulk`, sent by the bulk write endpoints.
+- `ledger` from `patients` for the entries and balances.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from clients.bulk import post_bulk_write
+from . import ledger
+
+
+def record_saved_bill(sender, instance, raw=False, **kwargs):
+    if not raw:
+        ledger.record([instance])
+
+
+def remove_deleted_bill(sender, instance, **kwargs):
+    ledger.remove([instance])
+
+
+def record_bulk_bills(sender, instances, **kwargs):
+    ledger.record(instances)
+
+
+for _source, _model in ledger.source_models():
+    post_save.connect(record_saved_bill, sender=_model, dispatch_uid=f"patient_ledger_post_save_{_source}")
+    post_delete.connect(remove_deleted_bill, sender=_model, dispatch_uid=f"patient_ledger_post_delete_{_source}")
+    post_bulk_write.connect(record_bulk_bills, sender=_model, dispatch_uid=f"patient_ledger_post_bulk_{_source}")
@@ -1,3 +1,119 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from clients.testing import TenantAPITestCase
+from pharmacy_module.models import PharmacyBill
+from staff_management.models import Employee
+
+from .models import Patient, PatientLedgerEntry
+
+ROWS = 12
+
+
+class PatientListQueryCountTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        doctor = Employee.objects.create(name="Doctor", user=self.admin)
+        Patient.objects.bulk_create(
+            Patient(tenant=self.tenant, user=self.member, doctor=doctor) for _ in range(ROWS)
+        )
+
+    def test_patient_list(self):
+        self.assert_list_query_count_constant("/api/patients/patient", user=self.member)
+
+    def test_all_patients_list(self):
+        self.assert_list_query_count_constant("/api/patients/all-patient")
+
+
+class PatientLedgerTests(TenantAPITestCase):
+    bulk_url = "/api/pharmacy/pharmacy-bill/bulk"
+
+    def setUp(self):
+        super().setUp()
+        self.first = Patient.objects.create(tenant=self.tenant, user=self.member)
+        self.second = Patient.objects.create(tenant=self.tenant, user=self.member)
+
+    def create_bill(self, patient, net_amount, payment_amount=None):
+        return PharmacyBill.objects.create(
+            tenant=self.tenant, user=self.admin, patient=patient, net_amount=net_amount, payment_amount=payment_amount
+        )
+
+    def ledger(self, patient):
+        # `(source id, debit, credit, balance)` of the patient's entries, oldest first.
+        entries = PatientLedgerEntry.objects.filter(patient=patient).order_by("created_at", "id")
+        return list(entries.values_list("source_id", "debit", "credit", "balance"))
+
+    def get_ledger(self, user, patient, params=None):
+        return self.client.get(f"/api/patients/patient/{patient.id}/ledger", params or {}, **self.auth_headers(user))
+
+    def test_running_balance(self):
+        first = self.create_bill(self.first, "100", "40")
+        second = self.create_bill(self.first, "₹50")
+        self.assertEqual(
+            self.ledger(self.first),
+            [(first.id, Decimal("100.00"), Decimal("40.00"), Decimal("60.00")),
+             (second.id, Decimal("50.00"), Decimal("0.00"), Decimal("110.00"))],
+        )
+
+    def test_patient_change_moves_the_entry(self):
+        moved = self.create_bill(self.first, "100", "40")
+        kept = self.create_bill(self.first, "50")
+        self.create_bill(self.second, "20")
+
+        moved.patient = self.second
+        moved.save()
+        self.assertEqual(self.ledger(self.first), [(kept.id, Decimal("50.00"), Decimal("0.00"), Decimal("50.00"))])
+        self.assertEqual([entry[3] for entry in self.ledger(self.second)], [Decimal("20.00"), Decimal("80.00")])
+
+    def test_delete(self):
+        deleted = self.create_bill(self.first, "100")
+        kept = self.create_bill(self.first, "30", "10")
+        deleted.delete()
+        self.assertEqual(self.ledger(self.first), [(kept.id, Decimal("30.00"), Decimal("10.00"), Decimal("20.00"))])
+
+    def test_bulk_writes(self):
+        headers = self.auth_headers(self.admin)
+        response = self.client.post(
+            self.bulk_url,
+            [
+                {"patient": self.first.id, "net_amount": "100", "payment_amount": "25"},
+                {"patient": self.first.id, "net_amount": "40"},
+                {"patient": self.second.id, "net_amount": "10"},
+            ],
+            content_type="application/json",
+            **headers,
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        ids = [item["id"] for item in response.json()["data"]]
+        self.assertEqual([entry[3] for entry in self.ledger(self.first)], [Decimal("75.00"), Decimal("115.00")])
+
+        response = self.client.patch(
+            self.bulk_url,
+            [{"id": ids[0], "patient": self.second.id}, {"id": ids[1], "net_amount": "60"}],
+            content_type="application/json",
+            **headers,
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.ledger(self.first), [(ids[1], Decimal("60.00"), Decimal("0.00"), Decimal("60.00"))])
+        self.assertEqual([entry[0] for entry in self.ledger(self.second)], [ids[0], ids[2]])
+        self.assertEqual(self.ledger(self.second)[-1][3], Decimal("85.00"))
+
+        response = self.client.delete(self.bulk_url, {"ids": ids[:2]}, content_type="application/json", **headers)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.ledger(self.first), [])
+        self.assertEqual(self.ledger(self.second), [(ids[2], Decimal("10.00"), Decimal("0.00"), Decimal("10.00"))])
+
+    def test_outstanding_of_an_empty_filtered_page(self):
+        self.create_bill(self.first, "100", "40")
+        response = self.get_ledger(self.member, self.first, {"source": "opd"})
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["data"], [])
+        self.assertEqual(response.json()["outstanding"], "60.00")
+
+    def test_member_cannot_read_the_ledger_of_another_members_patient(self):
+        other = self.create_user("other@example.com")
+        patient = Patient.objects.create(tenant=self.tenant, user=other)
+        self.create_bill(patient, "100")
+
+        self.assertEqual(self.get_ledger(self.member, patient).status_code, 404)
+        self.assertEqual(self.get_ledger(other, patient).status_code, 200)
+        self.assertEqual(self.get_ledger(self.admin, patient).status_code, 200)
@@ -5,5 +5,6 @@ from .views import *
 urlpatterns = [
     path("patient", PatientView.as_view(), name="patients-list"),
     path("patient/<int:patient_id>", PatientManagementView.as_view(), name="patient-manage"),
+    path("patient/<int:patient_id>/ledger", PatientLedgerView.as_view(), name="patient-ledger"),
     path("all-patient", FetchAllPatients.as_view(), name="get-all-patients"),
 ]
\ No newline at end of file
@@ -1,15 +1,25 @@
+from decimal import Decimal
+
+from django.db.models import Subquery
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from .serializers import *
-from .models import Patient
+from .models import Patient, PatientLedgerEntry
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter, apply_filters
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
+from clients.pagination import KeysetPagination
 import logging
 
 logger = logging.getLogger(__name__)
 
-class PatientView(APIView):
+class PatientView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Patient
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("doctor"))
+    list_sort_fields = ("created_at",)
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # POST: Create a new patient
@@ -31,19 +41,20 @@ class PatientView(APIView):
     def get(self, request):
         logger.info("Fetching patients for the authenticated user and tenant.")
         patients = Patient.objects.filter(user=request.user)
-        serializer = PatientSerializer(patients, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, patients, PatientSerializer)
 
 
 
-class FetchAllPatients(APIView):
+class FetchAllPatients(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Patient
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("doctor"))
+    list_sort_fields = ("created_at",)
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request):
         logger.info("Fetching all patients within the same tenant.")
         patients = Patient.objects.all()
-        serializer = PatientSerializer(patients, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, patients, PatientSerializer)
 
 
 
@@ -52,7 +63,7 @@ class FetchAllPatients(APIView):
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-class PatientManagementView(APIView):
+class PatientManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: Fetch specific patient details
@@ -61,12 +72,17 @@ class PatientManagementView(APIView):
             "patient_id", openapi.IN_PATH, description="Patient ID", type=openapi.TYPE_INTEGER)]
     )
     def get(self, request, patient_id):
+        # Tenant admin can access all patients, while users can only access their own patients
+        patients = Patient.objects.filter(id=patient_id)
+        if not request.user.is_tenant_admin:
+            patients = patients.filter(user=request.user)
+
+        not_modified = self.not_modified(request, patients)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all patients, while users can only access their own patients
-            if request.user.is_tenant_admin:
-                patient = Patient.objects.get(id=patient_id)
-            else:
-                patient = Patient.objects.get(id=patient_id, user=request.user)
+            patient = patients.get()
         except Patient.DoesNotExist as e:
             logger.critical(f"Error fetching patient: {e}")
             return Response(
@@ -74,7 +90,7 @@ class PatientManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = PatientSerializer(patient)
+        serializer = PatientSerializer(patient, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific patient details
@@ -116,4 +132,40 @@ class PatientManagementView(APIView):
 
         patient.delete()
         logger.info("Patient deleted successfully!")
-        return Response({"msg": "Patient deleted successfully!"}, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response({"msg": "Patient deleted successfully!"}, status=status.HTTP_200_OK)
+
+
+class PatientLedgerView(ReadOnlyFastPathMixin, APIView):
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("source"))
+
+    # GET: Account statement of a patient, newest first, with the current outstanding due
+    def get(self, request, patient_id):
+        # Tenant admin can access all patients, while users can only access their own patients
+        entries = PatientLedgerEntry.objects.filter(patient_id=patient_id)
+        if not request.user.is_tenant_admin:
+            entries = entries.filter(patient__user=request.user)
+
+        # The newest entry's balance, read in the same query as the page through the (patient, created_at) index
+        latest = entries.order_by("-created_at", "-id").values("balance")[:1]
+        statement = apply_filters(entries, self.list_filters, request).annotate(outstanding=Subquery(latest))
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(statement, request, view=self)
+
+        if page:
+            outstanding = page[0].outstanding
+        else:
+            patients = Patient.objects.filter(id=patient_id)
+            if not request.user.is_tenant_admin:
+                patients = patients.filter(user=request.user)
+            if not patients.exists():
+                return Response(
+                    {"msg": f"Patient with ID {patient_id} not found."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            outstanding = latest.values_list("balance", flat=True).first()
+
+        serializer = PatientLedgerEntrySerializer(page, many=True, context={"request": request})
+        response = paginator.get_paginated_response(serializer.data)
+        response.data["outstanding"] = str(outstanding if outstanding is not None else Decimal("0.00"))
+        return response
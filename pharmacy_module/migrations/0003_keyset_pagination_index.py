@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('pharmacy_module', '0002_rename_address_medicinelist_box_size_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='medicinelist',
+            index=models.Index(models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='medicinelist_keyset_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='pharmacybill',
+            index=models.Index(models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='pharmacybill_keyset_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='purchasemedicine',
+            index=models.Index(models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='purchasemedicine_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blobs', '0001_initial'),
+        ('pharmacy_module', '0003_keyset_pagination_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='medicinelist',
+            name='image_blob',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='blobs.blob'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:16
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('pharmacy_module', '0007_typed_dates'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='medicinelist',
+            index=models.Index(models.F('tenant'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='medicinelist_tenant_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='pharmacybill',
+            index=models.Index(models.F('tenant'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='pharmacybill_tenant_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='purchasemedicine',
+            index=models.Index(models.F('tenant'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='purchasemedicine_tenant_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='purchasemedicine',
+            index=models.Index(fields=['expires_on'], name='purchasemedicine_expiry_idx'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from users.models import CustomUser, Tenant
 from staff_management.models import Employee
 from patients.models import Patient
+from clients.dates import DateColumnsMixin
+from clients.money import MoneyColumnsMixin
 
 
 class MedicineList(models.Model):
@@ -19,17 +21,35 @@ class MedicineList(models.Model):
     description = models.TextField(blank=True, null=True)
     medicine_type = models.CharField(max_length=255, blank=True, null=True)
     image = models.TextField(blank=True, null=True)
+    image_blob = models.ForeignKey("blobs.Blob", on_delete=models.PROTECT, null=True, blank=True, editable=False, db_index=False, related_name="+")
     bar_code = models.TextField(blank=True, null=True)
     price = models.CharField(max_length=255, blank=True, null=True)
     vendor = models.CharField(max_length=255, blank=True, null=True)
     manufacturer_name = models.CharField(max_length=255, blank=True, null=True)
     manufacturer_price = models.CharField(max_length=255, blank=True, null=True)
     tax = models.CharField(max_length=255, blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="medicinelist_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="medicinelist_tenant_idx",
+            ),
+        ]
 
-class PharmacyBill(models.Model):
+
+class PharmacyBill(MoneyColumnsMixin, models.Model):
    
     PAYMENT_CHOICES = [
         ("Cash", "Cash"),
@@ -78,11 +98,57 @@ class PharmacyBill(models.Model):
     payment_mode = models.CharField(max_length=50, choices=PAYMENT_CHOICES, default="Cash")
     payment_amount = models.CharField(max_length=50,blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    # Numeric shadows of the amounts above (clients.money)
+    cost_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    tax_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    discount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    total_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    subtotal_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    net_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    payment_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pharmacybill_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pharmacybill_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("doctor"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pharmacybill_doctor_idx",
+            ),
+            models.Index(
+                models.F("payment_mode"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pharmacybill_paymode_idx",
+            ),
+            models.Index(
+                models.F("patient"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="pharmacybill_patient_idx",
+            ),
+        ]
 
 
-class PurchaseMedicine(models.Model):
+class PurchaseMedicine(MoneyColumnsMixin, DateColumnsMixin, models.Model):
+    date_columns = {"expiry_date": "expires_on"}
     
     PAYMENT_CHOICES = [
         ("Cash", "Cash"),
@@ -135,5 +201,41 @@ class PurchaseMedicine(models.Model):
     payment_mode = models.CharField(max_length=50, choices=PAYMENT_CHOICES, default="Cash")
     payment_amount = models.CharField(max_length=50,blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
\ No newline at end of file
+    # Numeric shadows of the amounts above (clients.money)
+    purchase_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    tax_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    total_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    subtotal_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    discount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    net_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    payment_amount_decimal = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False)
+    # Typed shadow of the expiry date above (clients.dates)
+    expires_on = models.DateField(null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="purchasemedicine_keyset_idx",
+            ),
+            # Tenant-scoped lists (`filter(tenant=...)`), in keyset order
+            models.Index(
+                models.F("tenant"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="purchasemedicine_tenant_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("payment_mode"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="purchasemedicine_paymode_idx",
+            ),
+            # Stock about to expire
+            models.Index(fields=["expires_on"], name="purchasemedicine_expiry_idx"),
+        ]
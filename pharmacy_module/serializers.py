@@ -1,18 +1,25 @@
 from .models import MedicineList,PharmacyBill,PurchaseMedicine
 from rest_framework import serializers
+from blobs.fields import BlobField, BlobUploadMixin
+from clients.sparse_fields import SparseFieldsetMixin
 
 
-class MedicineListSerializer(serializers.ModelSerializer):
+class MedicineListSerializer(BlobUploadMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    heavy_fields = ("image",)
+    image = BlobField(legacy_field="image", blob_field="image_blob", required=False, allow_null=True)
+
     class Meta:
         model = MedicineList
         fields = "__all__"
 
-class MedicineListCreateUpdateSerializer(serializers.ModelSerializer):
+class MedicineListCreateUpdateSerializer(BlobUploadMixin, serializers.ModelSerializer):
+    image = BlobField(legacy_field="image", blob_field="image_blob", required=False, allow_null=True)
+
     class Meta:
         model = MedicineList
         fields = "__all__"
 
-class PharmacyBillSerializer(serializers.ModelSerializer):
+class PharmacyBillSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = PharmacyBill
         fields = "__all__"
@@ -22,7 +29,7 @@ class PharmacyBillCreateUpdateSerializer(serializers.ModelSerializer):
         model = PharmacyBill
         fields = "__all__"
         
-class PurchaseMedicineSerializer(serializers.ModelSerializer):
+class PurchaseMedicineSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = PurchaseMedicine
         fields = "__all__"
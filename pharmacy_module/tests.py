@@ -1,3 +1,34 @@
-from django.test import TestCase
+from clients.testing import TenantAPITestCase
+from patients.models import Patient
+from staff_management.models import Employee
 
-# Create your tests here.
+from .models import MedicineList, PharmacyBill, PurchaseMedicine
+
+ROWS = 12
+
+
+class PharmacyListQueryCountTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.medicine = MedicineList.objects.create(tenant=self.tenant, user=self.admin)
+
+    def test_medicine_list(self):
+        MedicineList.objects.bulk_create(MedicineList(tenant=self.tenant, user=self.admin) for _ in range(ROWS))
+        self.assert_list_query_count_constant("/api/pharmacy/medicine")
+
+    def test_pharmacy_bill_list(self):
+        doctor = Employee.objects.create(name="Doctor", user=self.admin)
+        patient = Patient.objects.create(tenant=self.tenant, user=self.admin, doctor=doctor)
+        PharmacyBill.objects.bulk_create(
+            PharmacyBill(
+                tenant=self.tenant, user=self.admin, patient=patient, doctor=doctor, medicine_name=self.medicine
+            )
+            for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/pharmacy/pharmacy-bill")
+
+    def test_purchase_medicine_list(self):
+        PurchaseMedicine.objects.bulk_create(
+            PurchaseMedicine(tenant=self.tenant, user=self.admin, medicine_name=self.medicine) for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/pharmacy/purchase-medicine")
@@ -7,20 +7,26 @@ from .serializers import *
 from .models import MedicineList,PharmacyBill,PurchaseMedicine
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.bulk import BulkWriteMixin
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class MedicineListView(APIView):
+class MedicineListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = MedicineList
+    list_filters = (DateRangeFilter("created_at"),)
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all medicine list for the tenant
     def get(self, request):
         
-        MedicineList = MedicineList.objects.filter(tenant=request.tenant)
+        medicines = MedicineList.objects.filter(tenant=request.tenant)
         
-        serializer = MedicineListSerializer(MedicineList, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, medicines, MedicineListSerializer)
 
     # POST: Add a new MedicineList
     def post(self, request):
@@ -34,13 +40,13 @@ class MedicineListView(APIView):
                 raise ValidationError({"error": str(e)})
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
-class MedicineManagementView(APIView):
+class MedicineManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, medicine_id):
         try:
             MedicineList = MedicineList.objects.get(id=medicine_id, tenant=request.tenant)
-            serializer = MedicineListSerializer(MedicineList)
+            serializer = MedicineListSerializer(MedicineList, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except MedicineList.DoesNotExist:
             return Response({"msg": "Medicine List not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -75,12 +81,17 @@ class MedicineManagementView(APIView):
 
    
     def get(self, request, medicine_id):
+        # Tenant admin can access all medicine list, while users can only access their own medicine list
+        medicines = MedicineList.objects.filter(id=medicine_id)
+        if not request.user.is_tenant_admin:
+            medicines = medicines.filter(user=request.user)
+
+        not_modified = self.not_modified(request, medicines)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all medicine list, while users can only access their own medicine list
-            if request.user.is_tenant_admin:
-                MedicineList = MedicineList.objects.get(id=medicine_id)
-            else:
-                MedicineList = MedicineList.objects.get(id=medicine_id, user=request.user)
+            medicine = medicines.get()
         except MedicineList.DoesNotExist as e:
             logger.critical(f"Error fetching medicine list: {e}")
             return Response(
@@ -88,7 +99,7 @@ class MedicineManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = MedicineListSerializer(MedicineList)
+        serializer = MedicineListSerializer(medicine, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific medicine details
@@ -135,7 +146,15 @@ class MedicineManagementView(APIView):
    
     
     
-class PharmacyBillListView(APIView):
+class PharmacyBillListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = PharmacyBill
+    list_filters = (
+        DateRangeFilter("created_at"),
+        ExactFilter("doctor"),
+        ExactFilter("payment_mode"),
+        ExactFilter("patient"),
+    )
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all pharmacy_bill for the tenant
@@ -143,8 +162,7 @@ class PharmacyBillListView(APIView):
        
         pharmacy_bill = PharmacyBill.objects.filter(tenant=request.tenant)
         
-        serializer = PharmacyBillSerializer(pharmacy_bill, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, pharmacy_bill, PharmacyBillSerializer)
 
     # POST: Add a new MedicineList Bill
     def post(self, request):
@@ -158,13 +176,18 @@ class PharmacyBillListView(APIView):
                 raise ValidationError({"error": str(e)})
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
-class PharmacyBillManagementView(APIView):
+class PharmacyBillBulkView(ReadOnlyFastPathMixin, BulkWriteMixin, APIView):
+    permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
+    bulk_serializer_class = PharmacyBillCreateUpdateSerializer
+
+
+class PharmacyBillManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, pharmacy_bill_id):
         try:
             pharmacy_bill = PharmacyBill.objects.get(id=pharmacy_bill_id, tenant=request.tenant)
-            serializer = PharmacyBillSerializer(pharmacy_bill)
+            serializer = PharmacyBillSerializer(pharmacy_bill, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except PharmacyBill.DoesNotExist:
             return Response({"msg": "Pharmacy Bill not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -199,12 +222,17 @@ class PharmacyBillManagementView(APIView):
 
    
     def get(self, request, pharmacy_bill_id):
+        # Tenant admin can access all pharmacy_bill, while users can only access their own pharmacy_bill
+        pharmacy_bills = PharmacyBill.objects.filter(id=pharmacy_bill_id)
+        if not request.user.is_tenant_admin:
+            pharmacy_bills = pharmacy_bills.filter(user=request.user)
+
+        not_modified = self.not_modified(request, pharmacy_bills)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all pharmacy_bill, while users can only access their own pharmacy_bill
-            if request.user.is_tenant_admin:
-                pharmacy_bill = PharmacyBill.objects.get(id=pharmacy_bill_id)
-            else:
-                pharmacy_bill = PharmacyBill.objects.get(id=pharmacy_bill_id, user=request.user)
+            pharmacy_bill = pharmacy_bills.get()
         except PharmacyBill.DoesNotExist as e:
             logger.critical(f"Error fetching pharmacy bill: {e}")
             return Response(
@@ -212,7 +240,7 @@ class PharmacyBillManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = PharmacyBillSerializer(pharmacy_bill)
+        serializer = PharmacyBillSerializer(pharmacy_bill, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific pharmacy details
@@ -259,16 +287,18 @@ class PharmacyBillManagementView(APIView):
 
 
 
-class PurchaseMedicineView(APIView):
+class PurchaseMedicineView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = PurchaseMedicine
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("payment_mode"))
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all medicine list for the tenant
     def get(self, request):
         
-        PurchaseMedicine = PurchaseMedicine.objects.filter(tenant=request.tenant)
+        purchases = PurchaseMedicine.objects.filter(tenant=request.tenant)
         
-        serializer = MedicineListSerializer(PurchaseMedicine, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, purchases, PurchaseMedicineSerializer)
 
     # POST: Add a new MedicineList
     def post(self, request):
@@ -282,13 +312,13 @@ class PurchaseMedicineView(APIView):
                 raise ValidationError({"error": str(e)})
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
-class PurchaseMedicineManagementView(APIView):
+class PurchaseMedicineManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, medicine_id):
         try:
             PurchaseMedicine = PurchaseMedicine.objects.get(id=medicine_id, tenant=request.tenant)
-            serializer = PurchaseMedicineSerializer(PurchaseMedicine)
+            serializer = PurchaseMedicineSerializer(PurchaseMedicine, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except PurchaseMedicine.DoesNotExist:
             return Response({"msg": "Purchase Medicine not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -323,12 +353,17 @@ class PurchaseMedicineManagementView(APIView):
 
    
     def get(self, request, purchase_medicine_id):
+        # Tenant admin can access all medicine list, while users can only access their own medicine list
+        purchases = PurchaseMedicine.objects.filter(id=purchase_medicine_id)
+        if not request.user.is_tenant_admin:
+            purchases = purchases.filter(user=request.user)
+
+        not_modified = self.not_modified(request, purchases)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all medicine list, while users can only access their own medicine list
-            if request.user.is_tenant_admin:
-                PurchaseMedicine = PurchaseMedicine.objects.get(id=purchase_medicine_id)
-            else:
-                PurchaseMedicine = PurchaseMedicine.objects.get(id=purchase_medicine_id, user=request.user)
+            purchase_medicine = purchases.get()
         except PurchaseMedicine.DoesNotExist as e:
             logger.critical(f"Error fetching Purchase Medicine list: {e}")
             return Response(
@@ -336,7 +371,7 @@ class PurchaseMedicineManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = PurchaseMedicineSerializer(PurchaseMedicine)
+        serializer = PurchaseMedicineSerializer(purchase_medicine, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific purchase medicine details
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('radiology_module', '0002_alter_radiology_tax_alter_radiology_total_amount'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='radiology',
+            index=models.Index(models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='radiology_keyset_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='radiologybill',
+            index=models.Index(models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='radiologybill_keyset_idx'),
+        ),
+    ]
@@ -1,8 +1,9 @@
 from .models import Radiology,RadiologyBill 
 from rest_framework import serializers
+from clients.sparse_fields import SparseFieldsetMixin
 
 
-class RadiologySerializer(serializers.ModelSerializer):
+class RadiologySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Radiology
         fields = "__all__"
@@ -12,7 +13,7 @@ class RadiologyCreateUpdateSerializer(serializers.ModelSerializer):
         model = Radiology
         fields = "__all__"
 
-class RadiologyBillSerializer(serializers.ModelSerializer):
+class RadiologyBillSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = RadiologyBill
         fields = "__all__"
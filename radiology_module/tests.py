@@ -1,3 +1,27 @@
-from django.test import TestCase
+from clients.testing import TenantAPITestCase
+from patients.models import Patient
+from staff_management.models import Employee
 
-# Create your tests here.
+from .models import Radiology, RadiologyBill
+
+ROWS = 12
+
+
+class RadiologyListQueryCountTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.doctor = Employee.objects.create(name="Doctor", user=self.admin)
+        self.patient = Patient.objects.create(tenant=self.tenant, user=self.admin, doctor=self.doctor)
+
+    def test_radiology_list(self):
+        Radiology.objects.bulk_create(
+            Radiology(tenant=self.tenant, user=self.admin, patient=self.patient) for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/radiology/radiology")
+
+    def test_radiology_bill_list(self):
+        RadiologyBill.objects.bulk_create(
+            RadiologyBill(tenant=self.tenant, user=self.admin, patient=self.patient, doctor=self.doctor)
+            for _ in range(ROWS)
+        )
+        self.assert_list_query_count_constant("/api/radiology/radiology-bill")
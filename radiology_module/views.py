@@ -7,25 +7,24 @@ from .serializers import *
 from .models import Radiology,RadiologyBill
 from rest_framework.permissions import IsAuthenticated
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.conditional import ConditionalGetMixin
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
-class RadiologyListView(APIView):
+class RadiologyListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Radiology
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("patient"))
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all radiology for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter radiology with the specific patient ID
-            radiology = Radiology.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all radiology if no 'patient' parameter is provided
-            radiology = Radiology.objects.filter(tenant=request.tenant)
+        radiology = Radiology.objects.filter(tenant=request.tenant)
         
-        serializer = RadiologySerializer(radiology, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, radiology, RadiologySerializer)
 
     # POST: Add a new Radiology
     def post(self, request):
@@ -40,13 +39,13 @@ class RadiologyListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class RadiologyManagementView(APIView):
+class RadiologyManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, radiology_id):
         try:
             radiology = Radiology.objects.get(id=radiology_id, tenant=request.tenant)
-            serializer = RadiologySerializer(radiology)
+            serializer = RadiologySerializer(radiology, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except Radiology.DoesNotExist:
             return Response({"msg": "Radiology not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -81,12 +80,17 @@ class RadiologyManagementView(APIView):
 
    
     def get(self, request, radiology_id):
+        # Tenant admin can access all radiology, while users can only access their own radiology
+        radiologies = Radiology.objects.filter(id=radiology_id)
+        if not request.user.is_tenant_admin:
+            radiologies = radiologies.filter(user=request.user)
+
+        not_modified = self.not_modified(request, radiologies)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all radiology, while users can only access their own radiology
-            if request.user.is_tenant_admin:
-                radiology = Radiology.objects.get(id=radiology_id)
-            else:
-                radiology = Radiology.objects.get(id=radiology_id, user=request.user)
+            radiology = radiologies.get()
         except Radiology.DoesNotExist as e:
             logger.critical(f"Error fetching radiology: {e}")
             return Response(
@@ -94,7 +98,7 @@ class RadiologyManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = RadiologySerializer(radiology)
+        serializer = RadiologySerializer(radiology, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific radiology details
@@ -139,21 +143,22 @@ class RadiologyManagementView(APIView):
         return Response({"msg": "Radiology deleted successfully!"}, status=status.HTTP_200_OK)
    
     
-class RadiologyBillListView(APIView):
+class RadiologyBillListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = RadiologyBill
+    list_filters = (
+        DateRangeFilter("created_at"),
+        ExactFilter("doctor"),
+        ExactFilter("payment_mode"),
+        ExactFilter("patient"),
+    )
+    list_sort_fields = ("created_at",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all radiology for the tenant
     def get(self, request):
-        patient_id = request.query_params.get("patient")  # Get 'patient' query parameter from URL
-        if patient_id:
-            # Filter radiology bill with the specific patient ID
-            radiology = RadiologyBill.objects.filter(tenant=request.tenant, patient__id=patient_id)
-        else:
-            # Fetch all radiology bill if no 'patient' parameter is provided
-            radiology = RadiologyBill.objects.filter(tenant=request.tenant)
+        radiology = RadiologyBill.objects.filter(tenant=request.tenant)
         
-        serializer = RadiologyBillSerializer(radiology, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, radiology, RadiologyBillSerializer)
 
     # POST: Add a new Radiology Bill
     def post(self, request):
@@ -168,13 +173,13 @@ class RadiologyBillListView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class RadiologyBillManagementView(APIView):
+class RadiologyBillManagementView(ReadOnlyFastPathMixin, ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, radiology_bill_id):
         try:
             radiology = RadiologyBill.objects.get(id=radiology_bill_id, tenant=request.tenant)
-            serializer = RadiologyBillSerializer(radiology)
+            serializer = RadiologyBillSerializer(radiology, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except RadiologyBill.DoesNotExist:
             return Response({"msg": "Radiology Bill not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -209,12 +214,17 @@ class RadiologyBillManagementView(APIView):
 
    
     def get(self, request, radiology_bill_id):
+        # Tenant admin can access all radiology, while users can only access their own radiology
+        radiology_bills = RadiologyBill.objects.filter(id=radiology_bill_id)
+        if not request.user.is_tenant_admin:
+            radiology_bills = radiology_bills.filter(user=request.user)
+
+        not_modified = self.not_modified(request, radiology_bills)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            # Tenant admin can access all radiology, while users can only access their own radiology
-            if request.user.is_tenant_admin:
-                radiology = RadiologyBill.objects.get(id=radiology_bill_id)
-            else:
-                radiology = RadiologyBill.objects.get(id=radiology_bill_id, user=request.user)
+            radiology = radiology_bills.get()
         except RadiologyBill.DoesNotExist as e:
             logger.critical(f"Error fetching radiology bill: {e}")
             return Response(
@@ -222,7 +232,7 @@ class RadiologyBillManagementView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = RadiologyBillSerializer(radiology)
+        serializer = RadiologyBillSerializer(radiology, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # PATCH: Update specific radiology details
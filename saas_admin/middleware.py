@@ -1,10 +1,30 @@
 # middleware.py
-import jwt
+import asyncio
+import copy
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from channels.auth import AuthMiddlewareStack
 from channels.db import database_sync_to_async
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
 from urllib.parse import parse_qs
 
+from clients.authentication import ais_token_revoked, get_token_user
+from users.tenant_cache import LRUCache
+
+
+socket_user_cache = LRUCache(
+    maxsize=getattr(settings, "SOCKET_USER_CACHE_MAXSIZE", 10000),
+    ttl=getattr(settings, "SOCKET_USER_CACHE_TTL", 60),
+)
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_socket_user(sender, instance, **kwargs):
+    socket_user_cache.invalidate(instance.pk)
+
 
 @database_sync_to_async
 def get_user(user_id):
@@ -12,34 +32,68 @@ def get_user(user_id):
 
     User = get_user_model()
     try:
-        return User.objects.get(id=user_id)
+        user = User.objects.get(id=user_id)
     except User.DoesNotExist:
         return AnonymousUser()
+    return user if user.is_active else AnonymousUser()
 
 
 class JWTAuthMiddleware:
+    """
+    Authenticates websocket connections from the `query_string` JWT.
+
+    The token is validated once. Tokens issued for a tenant carry the user in
+    their claims, so no query is needed; other tokens resolve the user from a
+    TTL cache keyed by `user_id`, and concurrent connects for the same user
+    share a single database lookup. Each connection gets its own copy of the
+    cached user. The revocation list is read with the async cache API, so it
+    does not block the event loop. Connections without a token fall through
+    to the session based `AuthMiddlewareStack`.
+    """
+
     def __init__(self, inner):
         self.inner = inner
+        self.session_stack = AuthMiddlewareStack(inner)
+        self.pending = {}
 
     async def __call__(self, scope, receive, send):
         # Extract the token from the query string
         query_string = parse_qs(scope["query_string"].decode())
         token = query_string.get("query_string")
-        # print(token)
-
-        if token:
-            try:
-                # Decode the token and fetch the user
-                payload = jwt.decode(
-                    token[0], settings.SECRET_KEY, algorithms=["HS256"]
-                )
-                user_id = payload.get("user_id")
-                scope["user"] = await get_user(user_id)
-            except jwt.ExpiredSignatureError:
-                scope["user"] = AnonymousUser()
-            except jwt.InvalidTokenError:
-                scope["user"] = AnonymousUser()
-        else:
-            scope["user"] = AnonymousUser()
-
-        return await self.inner(scope, receive, send)
\ No newline at end of file
+
+        if not token:
+            return await self.session_stack(scope, receive, send)
+
+        scope = dict(scope, user=await self.authenticate(token[0]))
+        return await self.inner(scope, receive, send)
+
+    async def authenticate(self, raw_token):
+        try:
+            validated_token = AccessToken(raw_token)
+        except TokenError:
+            return AnonymousUser()
+
+        user_id = validated_token.get("user_id")
+        if user_id is None or await ais_token_revoked(validated_token):
+            return AnonymousUser()
+
+        if "tenant" in validated_token:
+            return get_token_user(validated_token)
+
+        # Every connection gets its own copy, so one socket's changes to its user never reach another's.
+        user = socket_user_cache.get(user_id)
+        if user is not None:
+            return copy.copy(user)
+
+        # Reconnect storms: only the first connect for a user hits the database.
+        lookup = self.pending.get(user_id)
+        if lookup is None:
+            lookup = asyncio.ensure_future(get_user(user_id))
+            self.pending[user_id] = lookup
+            lookup.add_done_callback(lambda _: self.pending.pop(user_id, None))
+
+        user = await asyncio.shield(lookup)
+        if not user.is_authenticated:
+            return user
+        socket_user_cache.set(user_id, user)
+        return copy.copy(user)
@@ -0,0 +1,96 @@
+"""
+Database backend built on `django_tenants.postgresql_backend` for persistent, schema-aware connections.
+
+`django_tenants` forgets the search_path it applied whenever `set_tenant()` is called, which
+`TenantMainMiddleware` does on every request, so each request issues a fresh `SET search_path`.
+With persistent connections (`CONN_MAX_AGE`) the session usually still has the right search_path.
+
+Classes:
+1. `DatabaseWrapper`:
+    - Inherits from the `django_tenants` `DatabaseWrapper`.
+    - Remembers the search_path that is actually applied on the open connection and skips the
+      `SET search_path` when the next tenant resolves to the same path (requires `TENANT_LIMIT_SET_CALLS = True`).
+    - Forgets the applied search_path when the connection is opened, closed or a transaction/savepoint is
+      rolled back, since a rollback also reverts a `SET` issued inside it.
+    - Records connection statistics in `pool_stats`.
+
+Functions:
+- `get_pool_stats()`:
+    - Returns a snapshot of the per-process counters: connections opened and closed, `SET search_path`
+      calls issued and skipped, and the currently open connections per alias.
+
+Dependencies:
+- `django_tenants.postgresql_backend.base` for the tenant aware backend.
+"""
+
+import threading
+from collections import Counter
+
+from django_tenants.postgresql_backend.base import DatabaseWrapper as TenantDatabaseWrapper
+from django_tenants.utils import get_limit_set_calls
+
+
+pool_stats = Counter()
+_pool_stats_lock = threading.Lock()
+
+
+def _record(stat, alias=None):
+    with _pool_stats_lock:
+        pool_stats[stat] += 1
+        if alias is not None:
+            pool_stats[f"{stat}:{alias}"] += 1
+
+
+def get_pool_stats():
+    with _pool_stats_lock:
+        stats = dict(pool_stats)
+    for alias in {key.split(":", 1)[1] for key in stats if ":" in key}:
+        stats[f"open_connections:{alias}"] = stats.get(
+            f"connections_opened:{alias}", 0
+        ) - stats.get(f"connections_closed:{alias}", 0)
+    return stats
+
+
+class DatabaseWrapper(TenantDatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        self.applied_search_paths = None
+        super().__init__(*args, **kwargs)
+
+    def connect(self):
+        self.applied_search_paths = None
+        super().connect()
+        _record("connections_opened", self.alias)
+
+    def close(self):
+        had_connection = self.connection is not None
+        super().close()
+        self.applied_search_paths = None
+        if had_connection and self.connection is None:
+            _record("connections_closed", self.alias)
+
+    def set_tenant(self, tenant, include_public=True):
+        super().set_tenant(tenant, include_public)
+        if (
+            self.applied_search_paths is not None
+            and self.connection is not None
+            and self._get_cursor_search_paths() == self.applied_search_paths
+        ):
+            # The open session already uses this search_path.
+            self.search_path_set_schemas = self.applied_search_paths
+
+    def _cursor(self, name=None):
+        skipped = get_limit_set_calls() and bool(self.search_path_set_schemas)
+        cursor = super()._cursor(name=name)
+        self.applied_search_paths = self.search_path_set_schemas
+        _record("search_path_skipped" if skipped else "search_path_set")
+        return cursor
+
+    def _rollback(self):
+        self.applied_search_paths = None
+        self.search_path_set_schemas = None
+        super()._rollback()
+
+    def _savepoint_rollback(self, sid):
+        self.applied_search_paths = None
+        self.search_path_set_schemas = None
+        super()._savepoint_rollback(sid)
@@ -0,0 +1,193 @@
+"""
+Database router sending tenant reads to read replicas.
+
+Replicas are configured through `DATABASE_REPLICA_HOSTS` (see `saas_admin.settings`), which adds one
+`replica_<n>` alias per host, listed in `DATABASE_REPLICAS`. Without replicas every query goes to the primary.
+
+Classes:
+1. `TenantReplicaRouter`:
+    - `db_for_read`:
+        - Sends reads of the tenant apps (`TENANT_APPS` that are not in `SHARED_APPS`) to a replica whose lag is
+          below `REPLICA_MAX_LAG` seconds, and points that replica connection at the tenant schema of the primary,
+          so it uses the same `search_path`.
+        - Reads stay on the primary outside of HTTP requests (management commands, websocket consumers), inside
+          a transaction on the primary and once the request is pinned (see below).
+    - `db_for_write`:
+        - Always returns the primary and pins the current request to it, so later reads see the write.
+    - `allow_migrate`:
+        - Never migrates the replica aliases; `TenantSyncRouter` decides for the primary.
+
+Functions:
+- `request_routing(request)`:
+    - Context manager used by `users.middleware.ReplicaRoutingMiddleware` around every HTTP request.
+    - A request that wrote also pins its client (identified by its `Authorization` header) to the primary for
+      `REPLICA_PIN_SECONDS`, so reads issued right after a write see it even if the replica is behind.
+
+- `get_replica_lag(alias)`:
+    - Returns the replication lag of a replica in seconds, measured on the replica itself.
+
+- `get_replica_lags()`:
+    - Returns the last measured lag of every replica; `None` for a replica that could not be reached.
+
+Dependencies:
+- `connections` from `django.db` for the primary and replica connections.
+- `cache` from `django.core.cache` for pinning clients across requests.
+"""
+
+import hashlib
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+logger = logging.getLogger(__name__)
+
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+_request_state = ContextVar("db_request_state", default=None)
+
+# alias -> (measured at, lag in seconds or None when unreachable)
+_replica_lags = {}
+
+
+class _RequestState:
+    __slots__ = ("client_key", "pinned", "pin_checked")
+
+    def __init__(self, client_key):
+        self.client_key = client_key
+        self.pinned = False
+        self.pin_checked = client_key is None
+
+
+def _replica_aliases():
+    return getattr(settings, "DATABASE_REPLICAS", [])
+
+
+@lru_cache(maxsize=None)
+def _replicated_app_labels():
+    tenant_only = set(settings.TENANT_APPS) - set(settings.SHARED_APPS)
+    return frozenset(
+        config.label for config in apps.get_app_configs() if config.name in tenant_only
+    )
+
+
+def _client_key(request):
+    authorization = request.META.get("HTTP_AUTHORIZATION")
+    if not authorization:
+        return None
+    digest = hashlib.sha256(authorization.encode()).hexdigest()
+    return f"db-pin:{digest}"
+
+
+@contextmanager
+def request_routing(request):
+    state = _RequestState(_client_key(request))
+    token = _request_state.set(state)
+    try:
+        yield state
+    finally:
+        _request_state.reset(token)
+        if state.pinned and state.client_key is not None:
+            cache.set(state.client_key, 1, getattr(settings, "REPLICA_PIN_SECONDS", 5))
+
+
+def get_replica_lag(alias):
+    with connections[alias].cursor() as cursor:
+        cursor.execute(REPLICA_LAG_SQL)
+        return float(cursor.fetchone()[0])
+
+
+def _measured_lag(alias):
+    measured_at, lag = _replica_lags.get(alias, (None, None))
+    interval = getattr(settings, "REPLICA_LAG_CHECK_INTERVAL", 5)
+    if measured_at is not None and time.monotonic() - measured_at < interval:
+        return lag
+
+    try:
+        lag = get_replica_lag(alias)
+    except DatabaseError:
+        logger.warning("Replica %s is unreachable, reading from the primary", alias, exc_info=True)
+        lag = None
+    _replica_lags[alias] = (time.monotonic(), lag)
+    return lag
+
+
+def get_replica_lags():
+    return {alias: _measured_lag(alias) for alias in _replica_aliases()}
+
+
+def _is_pinned(state):
+    if state.pinned:
+        return True
+    if not state.pin_checked:
+        state.pin_checked = True
+        state.pinned = cache.get(state.client_key) is not None
+    return state.pinned
+
+
+def _pick_replica():
+    max_lag = getattr(settings, "REPLICA_MAX_LAG", 10)
+    healthy = []
+    for alias in _replica_aliases():
+        lag = _measured_lag(alias)
+        if lag is not None and lag <= max_lag:
+            healthy.append(alias)
+    return random.choice(healthy) if healthy else None
+
+
+def _use_primary_schema(alias, primary):
+    replica = connections[alias]
+    if (
+        getattr(replica, "schema_name", None) != primary.schema_name
+        or replica.include_public_schema != primary.include_public_schema
+    ):
+        replica.set_tenant(primary.tenant, primary.include_public_schema)
+
+
+class TenantReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _request_state.get()
+        if state is None or model._meta.app_label not in _replicated_app_labels():
+            return None
+
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.in_atomic_block or _is_pinned(state):
+            return None
+
+        alias = _pick_replica()
+        if alias is None:
+            return None
+        _use_primary_schema(alias, primary)
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.pinned = True
+        # Instances loaded from a replica must still be written to the primary.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *_replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in _replica_aliases():
+            return False
+        return None
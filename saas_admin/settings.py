@@ -68,13 +68,16 @@ TENANT_APPS = [
     'staff_management',
     'tpa_insurance',
     'visitor_book',
+    'blobs',
 ]
 
 INSTALLED_APPS = SHARED_APPS + [app for app in TENANT_APPS if app not in SHARED_APPS]
 
 
 MIDDLEWARE = [
-    "django_tenants.middleware.main.TenantMainMiddleware",  # Ensure this is the first middleware
+    "users.middleware.CachedTenantMainMiddleware",  # Ensure this is the first middleware
+    "users.middleware.ReplicaRoutingMiddleware",
+    "clients.compression.CompressionMiddleware",  # Before any middleware that reads or writes the body
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -108,7 +111,8 @@ ASGI_APPLICATION = "saas_admin.asgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django_tenants.postgresql_backend",
+        # django_tenants.postgresql_backend that skips redundant SET search_path calls
+        "ENGINE": "saas_admin.postgresql_backend",
         "NAME": os.getenv("DATABASE_NAME"),
         "USER": os.getenv("DATABASE_USER"),
         "PASSWORD": os.getenv("DATABASE_PASSWORD"), 
@@ -119,13 +123,44 @@ DATABASES = {
         # 'PASSWORD': 'jatin1234',
         # 'HOST': 'localhost',  # Or the IP of your PostgreSQL server
         # 'PORT': '5432',
-        'ATOMIC_REQUESTS': True
-        
+        'ATOMIC_REQUESTS': True,
+        # Keep connections open between requests instead of reconnecting every time
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", 300)),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Read replicas, e.g. DATABASE_REPLICA_HOSTS="replica-1:5432,replica-2". Each host becomes a
+# "replica_<n>" alias; tests mirror them to the default database, so pointing a replica at the
+# local server (DATABASE_REPLICA_HOSTS=localhost) runs the suite with two databases.
+for index, replica_host in enumerate(
+    host.strip() for host in os.getenv("DATABASE_REPLICA_HOSTS", "").split(",") if host.strip()
+):
+    host, _, port = replica_host.partition(":")
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "ATOMIC_REQUESTS": False,
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+
+# saas_admin.routers.TenantReplicaRouter: replicas lagging more than REPLICA_MAX_LAG seconds are
+# skipped, and a client that wrote reads from the primary for REPLICA_PIN_SECONDS
+REPLICA_MAX_LAG = float(os.getenv("REPLICA_MAX_LAG", 10))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", 5))
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", 5))
+
+# Only issue SET search_path when the schema of the connection actually changes
+TENANT_LIMIT_SET_CALLS = True
+
 
-DATABASE_ROUTERS = ("django_tenants.routers.TenantSyncRouter",)
+DATABASE_ROUTERS = (
+    "saas_admin.routers.TenantReplicaRouter",
+    "django_tenants.routers.TenantSyncRouter",
+)
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -136,6 +171,19 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# Cost of users.hashers.TenantPBKDF2PasswordHasher; stored hashes are upgraded on login when it changes
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", 600000))
+PASSWORD_HASHERS = [
+    "users.hashers.TenantPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+# Threads of the bounded password hashing pool in clients.login
+LOGIN_HASH_WORKERS = int(os.getenv("LOGIN_HASH_WORKERS", os.cpu_count() or 1))
+
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
@@ -154,16 +202,46 @@ SILENCED_SYSTEM_CHECKS = ["auth.W004"]
 
 STATIC_URL = "static/"
 
+# blobs: content-addressed store of the uploaded images; swap the "blobs" backend for any Django storage
+BLOB_ROOT = os.getenv("BLOB_ROOT", os.path.join(BASE_DIR, "blobs_data"))
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "blobs": {
+        "BACKEND": os.getenv("BLOB_STORAGE_BACKEND", "django.core.files.storage.FileSystemStorage"),
+        "OPTIONS": {"location": BLOB_ROOT},
+    },
+}
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # JWT Authentication
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "clients.authentication.TenantJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
-    )
+    ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "clients.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
 }
 
+# clients.pagination.KeysetPagination: default and largest page size of the tenant list endpoints
+KEYSET_PAGE_SIZE = int(os.getenv("KEYSET_PAGE_SIZE", 50))
+KEYSET_MAX_PAGE_SIZE = int(os.getenv("KEYSET_MAX_PAGE_SIZE", 500))
+# Rows fetched per server-side cursor round trip by streamed exports (clients.streaming)
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", 500))
+# clients.compression.CompressionMiddleware: smallest response body worth compressing, in bytes
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+# clients.bulk.BulkWriteMixin: largest number of items of one bulk request
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 1000))
+# clients.money: read amounts (sum_money, dashboard rollups and rebuild, patient ledger) from the numeric money
+# columns instead of parsing the legacy text columns; turn on once `backfill_money --verify` is clean
+MONEY_DECIMAL_READS = os.getenv("MONEY_DECIMAL_READS", "False") == "True"
+# dashboard.kpis: age in seconds past which the KPI endpoint reports the materialized views as stale
+DASHBOARD_KPI_MAX_AGE = int(os.getenv("DASHBOARD_KPI_MAX_AGE", 900))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=2),
@@ -183,6 +261,25 @@ TENANT_DOMAIN_MODEL = "users.Domain"
 
 PUBLIC_SCHEMA_URLCONF = "users.urls"
 
+# New tenant schemas are cloned from this pre-migrated template and their migrations are faked
+# (users.provisioning keeps the template migrated before every clone)
+TENANT_BASE_SCHEMA = os.getenv("TENANT_BASE_SCHEMA", "tenant_template")
+TENANT_CREATION_FAKES_MIGRATIONS = True
+# Background threads cloning tenant schemas, and the largest batch accepted by tenant/batch
+TENANT_PROVISIONING_WORKERS = int(os.getenv("TENANT_PROVISIONING_WORKERS", 2))
+TENANT_BATCH_MAX_SIZE = int(os.getenv("TENANT_BATCH_MAX_SIZE", 100))
+# Seconds after which `provision_tenants --retry` takes a running job for one whose worker died
+TENANT_PROVISIONING_TIMEOUT = int(os.getenv("TENANT_PROVISIONING_TIMEOUT", 900))
+# Worker processes used by the migrate_tenants management command
+TENANT_MIGRATION_PROCESSES = int(os.getenv("TENANT_MIGRATION_PROCESSES", 4))
+
+# In-process hostname -> tenant cache used by users.middleware.CachedTenantMainMiddleware
+TENANT_CACHE_MAXSIZE = int(os.getenv("TENANT_CACHE_MAXSIZE", 1024))
+TENANT_CACHE_TTL = int(os.getenv("TENANT_CACHE_TTL", 300))  # seconds
+
+# (user, tenant) -> {member, admin} cache used by clients.custom_permissions
+TENANT_MEMBERSHIP_CACHE_TTL = int(os.getenv("TENANT_MEMBERSHIP_CACHE_TTL", 60))  # seconds
+
 
 LOGGING = {
     "version": 1,
@@ -221,6 +318,20 @@ LOGGING = {
 }
 
 
+if os.getenv("REDIS_HOST"):
+    # Shared between workers, so tenant membership invalidation and JWT revocation apply everywhere
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": f"redis://{os.getenv('REDIS_HOST')}:6379/1",
+        },
+    }
+
+
+# Websocket user cache used by saas_admin.middleware.JWTAuthMiddleware
+SOCKET_USER_CACHE_MAXSIZE = int(os.getenv("SOCKET_USER_CACHE_MAXSIZE", 10000))
+SOCKET_USER_CACHE_TTL = int(os.getenv("SOCKET_USER_CACHE_TTL", 60))  # seconds
+
 CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
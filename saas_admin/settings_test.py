@@ -0,0 +1,23 @@
+"""
+Settings for the test suite: `python manage.py test --settings=saas_admin.settings_test`.
+
+The suite runs with two databases. Without `DATABASE_REPLICA_HOSTS`, a `replica_0` alias is added as a test mirror
+of the primary (a second connection to the same test database), so `saas_admin.routers.TenantReplicaRouter` routes
+reads to a replica in the tests as it does in production. A mirror does not see the data of an uncommitted
+`TestCase` transaction, so the router tests only check where queries are sent.
+
+The process-local cache is fine for one test process, so the shared cache check (`clients.E003`) is silenced.
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import DATABASES, DATABASE_REPLICAS, SILENCED_SYSTEM_CHECKS
+
+if not DATABASE_REPLICAS:
+    DATABASES["replica_0"] = {
+        **DATABASES["default"],
+        "ATOMIC_REQUESTS": False,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS = ["replica_0"]
+
+SILENCED_SYSTEM_CHECKS = [*SILENCED_SYSTEM_CHECKS, "clients.E003"]
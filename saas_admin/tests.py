@@ -0,0 +1,75 @@
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import RequestFactory, override_settings
+
+from clients.models import UserProfile
+from clients.testing import TenantAPITestCase
+from ipd_module.models import IPD
+from saas_admin import routers
+from saas_admin.routers import TenantReplicaRouter, get_replica_lag, request_routing
+
+
+@skipUnless(settings.DATABASE_REPLICAS, "Run with --settings=saas_admin.settings_test or DATABASE_REPLICA_HOSTS.")
+class TenantReplicaRouterTests(TenantAPITestCase):
+    databases = "__all__"
+
+    def setUp(self):
+        super().setUp()
+        self.router = TenantReplicaRouter()
+        self.replica = settings.DATABASE_REPLICAS[0]
+        routers._replica_lags.clear()
+        cache.clear()
+        # TestCase keeps the primary in a transaction, which the router reads from on purpose.
+        patcher = mock.patch.object(connections[DEFAULT_DB_ALIAS], "in_atomic_block", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request(self, authorization="Bearer client-a"):
+        return RequestFactory().get("/api/ipd/ipd", HTTP_AUTHORIZATION=authorization)
+
+    def test_replica_lag_is_measured(self):
+        self.assertEqual(get_replica_lag(self.replica), 0.0)
+
+    def test_reads_outside_a_request_use_the_primary(self):
+        self.assertIsNone(self.router.db_for_read(IPD))
+
+    def test_shared_app_reads_use_the_primary(self):
+        with request_routing(self.request()):
+            self.assertIsNone(self.router.db_for_read(UserProfile))
+
+    def test_tenant_reads_use_the_replica_with_the_tenant_schema(self):
+        with request_routing(self.request()):
+            self.assertEqual(self.router.db_for_read(IPD), self.replica)
+            self.assertEqual(IPD.objects.count(), 0)
+        self.assertEqual(connections[self.replica].schema_name, self.tenant.schema_name)
+
+    def test_reads_in_a_transaction_use_the_primary(self):
+        with request_routing(self.request()):
+            with mock.patch.object(connections[DEFAULT_DB_ALIAS], "in_atomic_block", True):
+                self.assertIsNone(self.router.db_for_read(IPD))
+
+    def test_write_pins_the_request_and_the_client(self):
+        with request_routing(self.request()):
+            self.assertEqual(self.router.db_for_write(IPD), DEFAULT_DB_ALIAS)
+            self.assertIsNone(self.router.db_for_read(IPD))
+
+        with request_routing(self.request()):
+            self.assertIsNone(self.router.db_for_read(IPD))
+        with request_routing(self.request("Bearer client-b")):
+            self.assertEqual(self.router.db_for_read(IPD), self.replica)
+
+    def test_lagging_replica_is_skipped(self):
+        with override_settings(REPLICA_MAX_LAG=-1), request_routing(self.request()):
+            self.assertIsNone(self.router.db_for_read(IPD))
+
+    def test_unreachable_replica_is_skipped(self):
+        with mock.patch.object(routers, "get_replica_lag", side_effect=routers.DatabaseError), \
+                request_routing(self.request()):
+            self.assertIsNone(self.router.db_for_read(IPD))
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate(self.replica, "ipd_module"))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "ipd_module"))
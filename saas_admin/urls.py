@@ -47,6 +47,7 @@ urlpatterns = [
     path('api/radiology/', include('radiology_module.urls')),
     path('api/tpa-insurance/', include('tpa_insurance.urls')),
     path('api/visitor-book/', include('visitor_book.urls')),
+    path('api/blobs/', include('blobs.urls')),
 ]
 
 
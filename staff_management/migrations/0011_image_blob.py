@@ -0,0 +1,35 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blobs', '0001_initial'),
+        ('staff_management', '0010_keyset_pagination_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='aadhar_back_image_blob',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='blobs.blob'),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='aadhar_front_image_blob',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='blobs.blob'),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='image_blob',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='blobs.blob'),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='pan_image_blob',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='blobs.blob'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:55
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('staff_management', '0011_image_blob'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='employee',
+            index=models.Index(models.F('role'), models.OrderBy(models.F('created_at'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='employee_role_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from users.models import CustomUser, Tenant, CustomUserManager
+from clients.dates import DateColumnsMixin
 
 class Role(models.Model):
     # tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, null=True)
@@ -9,7 +10,12 @@ class Role(models.Model):
         return self.name
 
 
-class Employee(models.Model):
+class Employee(DateColumnsMixin, models.Model):
+    date_columns = {
+        "last_login": "last_login_at",
+        "plan_expire_date": "plan_expires_on",
+        "otp_expire": "otp_expires_at",
+    }
 
     GENDER_CHOICES = [
         ("Male", "Male"),
@@ -33,6 +39,7 @@ class Employee(models.Model):
     dob = models.DateField(default="2024-01-01")
     gender = models.CharField(max_length=50, choices=GENDER_CHOICES, default="Not Specified")
     image = models.TextField(blank=True, null=True)
+    image_blob = models.ForeignKey("blobs.Blob", on_delete=models.PROTECT, null=True, blank=True, editable=False, db_index=False, related_name="+")
     phone = models.CharField(max_length=15, unique=True, null=True)
     address = models.TextField(null=True)
     city = models.CharField(max_length=100, null=True)
@@ -40,9 +47,12 @@ class Employee(models.Model):
     zip = models.CharField(max_length=10, null=True)
     aadhar_no = models.CharField(max_length=12, null=True)
     aadhar_front_image = models.TextField(blank=True, null=True)
+    aadhar_front_image_blob = models.ForeignKey("blobs.Blob", on_delete=models.PROTECT, null=True, blank=True, editable=False, db_index=False, related_name="+")
     aadhar_back_image = models.TextField(blank=True, null=True)
+    aadhar_back_image_blob = models.ForeignKey("blobs.Blob", on_delete=models.PROTECT, null=True, blank=True, editable=False, db_index=False, related_name="+")
     pan_no = models.CharField(max_length=10, null=True)
     pan_image = models.TextField(blank=True, null=True)
+    pan_image_blob = models.ForeignKey("blobs.Blob", on_delete=models.PROTECT, null=True, blank=True, editable=False, db_index=False, related_name="+")
     bank_name = models.CharField(max_length=100, null=True)
     account_no = models.CharField(max_length=50, null=True)
     account_holder_name = models.CharField(max_length=50, null=True)
@@ -62,8 +72,29 @@ class Employee(models.Model):
     plan_expire_date = models.CharField(max_length=10, null=True)
     otp = models.CharField(max_length=5, null=True)
     otp_expire = models.CharField(max_length=10, null=True)
-    created_at = models.DateField(auto_now_add=True, null=True, blank=True)
-    updated_at = models.DateField(auto_now=True, null=True, blank=True)
+    # Typed shadows of the dates above (clients.dates)
+    last_login_at = models.DateTimeField(null=True, blank=True, editable=False)
+    plan_expires_on = models.DateField(null=True, blank=True, editable=False)
+    otp_expires_at = models.DateTimeField(null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Newest-first keyset pagination (clients.pagination.KeysetPagination)
+            models.Index(
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="employee_keyset_idx",
+            ),
+            # Filtered and sorted lists (clients.filters), in keyset order
+            models.Index(
+                models.F("role"),
+                models.F("created_at").desc(nulls_last=True),
+                models.F("id").desc(),
+                name="employee_role_idx",
+            ),
+        ]
 
 
 
@@ -99,4 +130,4 @@ class Employee(models.Model):
     #             password=self.password,
     #         )
     #         self.user = user
-    #     super().save(*args, **kwargs)
\ No newline at end of file
+    #     super().save(*args, **kwargs)
@@ -1,7 +1,9 @@
 from rest_framework import serializers
+from blobs.fields import BlobField, BlobUploadMixin
+from clients.sparse_fields import SparseFieldsetMixin
 from .models import Role, Employee
 
-class RoleSerializer(serializers.ModelSerializer):
+class RoleSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Role
         fields = ["id", "name"]
@@ -11,14 +13,24 @@ class RoleCreateUpdateSerializer(serializers.ModelSerializer):
         model = Employee
         fields = ["id", "name"]
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class EmployeeSerializer(BlobUploadMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    heavy_fields = ("image", "aadhar_front_image", "aadhar_back_image", "pan_image")
     role = RoleSerializer(read_only=True)
+    image = BlobField(legacy_field="image", blob_field="image_blob", required=False, allow_null=True)
+    aadhar_front_image = BlobField(legacy_field="aadhar_front_image", blob_field="aadhar_front_image_blob", required=False, allow_null=True)
+    aadhar_back_image = BlobField(legacy_field="aadhar_back_image", blob_field="aadhar_back_image_blob", required=False, allow_null=True)
+    pan_image = BlobField(legacy_field="pan_image", blob_field="pan_image_blob", required=False, allow_null=True)
 
     class Meta:
         model = Employee
-        fields = ["id", "name", "role", "employee_id", "email", "password", "dob", "gender", "image", "phone", "address", "city", "state", "zip", "aadhar_no", "aadhar_front_image", "aadhar_back_image", "pan_no", "pan_image", "bank_name", "account_no", "account_holder_name", "ifsc_code", "upi_id", "other1", "other2", "latitude", "longitude", "location", "fees", "last_login", "last_login_ip", "notification_token", "is_active", "plan_id", "plan_expire_date", "otp", "otp_expire", "created_at", "updated_at"]
+        fields = ["id", "name", "role", "employee_id", "password", "dob", "gender", "image", "phone", "address", "city", "state", "zip", "aadhar_no", "aadhar_front_image", "aadhar_back_image", "pan_no", "pan_image", "bank_name", "account_no", "account_holder_name", "ifsc_code", "upi_id", "other1", "other2", "latitude", "longitude", "location", "fees", "last_login", "last_login_ip", "notification_token", "is_active", "plan_id", "plan_expire_date", "otp", "otp_expire", "last_login_at", "plan_expires_on", "otp_expires_at", "created_at", "updated_at"]
+
+class EmployeeCreateUpdateSerializer(BlobUploadMixin, serializers.ModelSerializer):
+    image = BlobField(legacy_field="image", blob_field="image_blob", required=False, allow_null=True)
+    aadhar_front_image = BlobField(legacy_field="aadhar_front_image", blob_field="aadhar_front_image_blob", required=False, allow_null=True)
+    aadhar_back_image = BlobField(legacy_field="aadhar_back_image", blob_field="aadhar_back_image_blob", required=False, allow_null=True)
+    pan_image = BlobField(legacy_field="pan_image", blob_field="pan_image_blob", required=False, allow_null=True)
 
-class EmployeeCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Employee
         fields = ["id", "name", "role", "employee_id", "password", "dob", "gender", "image", "phone", "address", "city", "state", "zip", "aadhar_no", "aadhar_front_image", "aadhar_back_image", "pan_no", "pan_image", "bank_name", "bank_name", "account_no", "account_holder_name", "ifsc_code", "upi_id", "other1", "other2", "latitude", "longitude", "location", "fees", "last_login", "last_login_ip", "notification_token", "is_active", "plan_id", "plan_expire_date", "otp", "otp_expire", "created_at", "updated_at","user"]
@@ -1,3 +1,49 @@
-from django.test import TestCase
+from clients.testing import TenantAPITestCase
 
-# Create your tests here.
+from .models import Employee, Role
+
+ROWS = 12
+
+
+class StaffListQueryCountTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        roles = Role.objects.bulk_create(Role(name=f"Role {index}") for index in range(ROWS))
+        Employee.objects.bulk_create(
+            Employee(name=f"Employee {index}", user=self.admin, role=role) for index, role in enumerate(roles)
+        )
+
+    def test_employee_list_joins_the_role(self):
+        self.assert_list_query_count_constant("/api/staff/employees")
+
+    def test_role_list(self):
+        self.assert_list_query_count_constant("/api/staff/roles")
+
+
+class EmployeeListConditionalTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.role = Role.objects.create(name="Nurse")
+        Employee.objects.create(name="Employee", user=self.admin, role=self.role)
+
+    def test_unchanged_list_is_not_modified(self):
+        headers = self.auth_headers(self.admin)
+        response = self.client.get("/api/staff/employees", **headers)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/api/staff/employees", HTTP_IF_NONE_MATCH=response["ETag"], **headers)
+        self.assertEqual(response.status_code, 304)
+
+    def test_renaming_the_role_changes_the_employee_list(self):
+        headers = self.auth_headers(self.admin)
+        response = self.client.get("/api/staff/employees", **headers)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        self.role.name = "Head nurse"
+        self.role.save()
+
+        response = self.client.get("/api/staff/employees", HTTP_IF_NONE_MATCH=etag, **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["data"][0]["role"]["name"], "Head nurse")
@@ -5,19 +5,23 @@ from rest_framework.permissions import IsAuthenticated
 from .models import Role, Employee
 from .serializers import RoleSerializer, EmployeeSerializer, RoleCreateUpdateSerializer, EmployeeCreateUpdateSerializer
 from clients.custom_permissions import IsTenantAdminOrIsUserPartOfTenant
+from clients.filters import DateRangeFilter, ExactFilter
+from clients.mixins import ReadOnlyFastPathMixin, TenantListMixin
 import logging
 from rest_framework.exceptions import ValidationError
 from django.db import IntegrityError
 
 logger = logging.getLogger(__name__)
 
-class RoleView(APIView):
+class RoleView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Role
+    list_ordering = ("id",)
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request):
-        roles = Role.objects.filter(tenant=request.tenant)
-        serializer = RoleSerializer(roles, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        # Roles live in the tenant's schema and have no tenant column
+        roles = Role.objects.all()
+        return self.list_response(request, roles, RoleSerializer)
 
     def post(self, request):
         serializer = RoleSerializer(data=request.data)
@@ -27,13 +31,13 @@ class RoleView(APIView):
         return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class RoleManagementView(APIView):
+class RoleManagementView(ReadOnlyFastPathMixin, APIView):
     # permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, role_id):
         try:
             role = Role.objects.get(id=role_id, tenant=request.tenant)
-            serializer = RoleSerializer(role)
+            serializer = RoleSerializer(role, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except Role.DoesNotExist:
             return Response({"msg": "Role not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -65,21 +69,18 @@ class RoleManagementView(APIView):
             return Response({"msg": "Role not found."}, status=status.HTTP_404_NOT_FOUND)
 
 
-class EmployeeListView(APIView):
+class EmployeeListView(ReadOnlyFastPathMixin, TenantListMixin, APIView):
+    list_model = Employee
+    list_filters = (DateRangeFilter("created_at"), ExactFilter("role"))
+    list_sort_fields = ("created_at",)
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     # GET: List all employees for the tenant
     def get(self, request):
-        role_id = request.query_params.get("role")  # Get 'role' query parameter from URL
-        if role_id:
-            # Filter employees with the specific role ID
-            employees = Employee.objects.filter(tenant=request.tenant, role__id=role_id)
-        else:
-            # Fetch all employees if no 'role' parameter is provided
-            employees = Employee.objects.filter(tenant=request.tenant)
+        # Employees live in the tenant's schema and have no tenant column
+        employees = Employee.objects.all()
         
-        serializer = EmployeeSerializer(employees, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        return self.list_response(request, employees, EmployeeSerializer)
 
     # POST: Add a new employee
     def post(self, request):
@@ -97,13 +98,13 @@ class EmployeeListView(APIView):
             return Response({"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class EmployeeManagementView(APIView):
+class EmployeeManagementView(ReadOnlyFastPathMixin, APIView):
     permission_classes = [IsAuthenticated, IsTenantAdminOrIsUserPartOfTenant]
 
     def get(self, request, employee_id):
         try:
             employee = Employee.objects.get(id=employee_id, tenant=request.tenant)
-            serializer = EmployeeSerializer(employee)
+            serializer = EmployeeSerializer(employee, context={"request": request})
             return Response({"data": serializer.data}, status=status.HTTP_200_OK)
         except Employee.DoesNotExist:
             return Response({"msg": "Employee not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,24 @@
+"""
+This module defines the password hasher used for tenant users.
+
+Hashers:
+1. `TenantPBKDF2PasswordHasher`:
+    - Inherits from Django's `PBKDF2PasswordHasher` and keeps its `pbkdf2_sha256` algorithm name,
+      so every existing password hash stays valid.
+    - The iteration count is read from the `PASSWORD_HASH_ITERATIONS` setting instead of being fixed
+      by the Django release. Hashes stored with a different count are transparently rehashed on the next
+      successful login (see `clients.login.authenticate_login`).
+
+Dependencies:
+- `PBKDF2PasswordHasher` from `django.contrib.auth.hashers`.
+- `settings` from `django.conf` for the iteration count.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TenantPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = getattr(
+        settings, "PASSWORD_HASH_ITERATIONS", PBKDF2PasswordHasher.iterations
+    )
@@ -0,0 +1,174 @@
+"""
+Management command to migrate every tenant schema in parallel, with resumable progress.
+
+Usage:
+    python manage.py migrate_tenants [--processes 4] [--skip-public]
+    python manage.py migrate_tenants --resume [<run id>]
+
+Migrates the public schema first, then the schemas of all `Tenant`s (and the template schema used by
+`users.provisioning`) in a pool of `--processes` worker processes (default `TENANT_MIGRATION_PROCESSES`).
+Each schema is recorded as a `SchemaMigration` of the run, so a failure does not stop the rest of the fleet,
+and `--resume` re-runs only the schemas of a run (the latest one by default) that have not succeeded.
+Prints the time spent on every schema and exits with an error when any schema failed.
+"""
+
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.commands.migrate import Command as MigrateCommand
+from django.db import connections
+from django.utils import timezone
+from django_tenants.migration_executors.base import run_migrations
+from django_tenants.utils import (
+    get_public_schema_name,
+    get_tenant_base_schema,
+    get_tenant_database_alias,
+    schema_exists,
+)
+
+from users.models import SchemaMigration, Tenant
+
+
+EXECUTOR_CODENAME = "migrate_tenants"
+
+
+def _init_worker():
+    import django
+
+    django.setup()
+
+
+def _migrate_schema(schema_name, options):
+    # Runs in a worker process; `run_migrations` commits and closes the connection when done.
+    started = time.monotonic()
+    try:
+        run_migrations([], dict(options), EXECUTOR_CODENAME, schema_name, allow_atomic=False)
+    except Exception as exc:
+        connections.close_all()
+        return schema_name, time.monotonic() - started, f"{type(exc).__name__}: {exc}"
+    return schema_name, time.monotonic() - started, ""
+
+
+class Command(BaseCommand):
+    help = "Migrate all tenant schemas in parallel; failures are recorded and can be resumed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=getattr(settings, "TENANT_MIGRATION_PROCESSES", 4),
+        )
+        parser.add_argument("--resume", nargs="?", const="latest", metavar="RUN_ID")
+        parser.add_argument("--skip-public", action="store_true")
+
+    def migrate_options(self, verbosity):
+        options = vars(MigrateCommand().create_parser("manage.py", "migrate").parse_args([]))
+        options.update(
+            verbosity=verbosity,
+            interactive=False,
+            skip_checks=True,
+            database=get_tenant_database_alias(),
+        )
+        return options
+
+    def tenant_schemas(self):
+        schemas = list(
+            Tenant.objects.exclude(schema_name=get_public_schema_name())
+            .order_by("schema_name")
+            .values_list("schema_name", flat=True)
+        )
+        template = get_tenant_base_schema()
+        if template and schema_exists(template):
+            schemas.insert(0, template)
+        return schemas
+
+    def start_run(self, resume):
+        if resume is None:
+            run_id = uuid.uuid4()
+            SchemaMigration.objects.bulk_create(
+                SchemaMigration(run_id=run_id, schema_name=schema_name)
+                for schema_name in self.tenant_schemas()
+            )
+            return run_id
+
+        if resume == "latest":
+            latest = SchemaMigration.objects.order_by("-created_at").first()
+            if latest is None:
+                raise CommandError("There is no run to resume")
+            return latest.run_id
+
+        try:
+            run_id = uuid.UUID(resume)
+        except ValueError:
+            raise CommandError(f"{resume} is not a valid run id")
+        if not SchemaMigration.objects.filter(run_id=run_id).exists():
+            raise CommandError(f"Run {run_id} does not exist")
+        return run_id
+
+    def handle(self, *args, **options):
+        verbosity = options["verbosity"]
+        migrate_options = self.migrate_options(verbosity)
+
+        if not options["skip_public"] and options["resume"] is None:
+            started = time.monotonic()
+            run_migrations([], dict(migrate_options), EXECUTOR_CODENAME, get_public_schema_name())
+            self.stdout.write(f"public: migrated in {time.monotonic() - started:.2f}s")
+
+        run_id = self.start_run(options["resume"])
+        pending = list(
+            SchemaMigration.objects.filter(run_id=run_id)
+            .exclude(status=SchemaMigration.SUCCEEDED)
+            .values_list("schema_name", flat=True)
+        )
+        self.stdout.write(
+            f"Run {run_id}: migrating {len(pending)} schemas with {options['processes']} processes"
+        )
+
+        started = time.monotonic()
+        results = []
+        if pending:
+            # Forked workers must not share the parent's database connections.
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options["processes"], initializer=_init_worker
+            ) as pool:
+                futures = [
+                    pool.submit(_migrate_schema, schema_name, migrate_options)
+                    for schema_name in pending
+                ]
+                for future in as_completed(futures):
+                    schema_name, duration, error = future.result()
+                    SchemaMigration.objects.filter(
+                        run_id=run_id, schema_name=schema_name
+                    ).update(
+                        status=SchemaMigration.FAILED if error else SchemaMigration.SUCCEEDED,
+                        duration=duration,
+                        error=error,
+                        finished_at=timezone.now(),
+                    )
+                    results.append((schema_name, duration, error))
+                    if error:
+                        self.stderr.write(self.style.ERROR(f"{schema_name}: failed after {duration:.2f}s: {error}"))
+                    elif verbosity >= 1:
+                        self.stdout.write(f"{schema_name}: migrated in {duration:.2f}s")
+
+        self.report(run_id, results, time.monotonic() - started)
+
+    def report(self, run_id, results, elapsed):
+        failed = [result for result in results if result[2]]
+        self.stdout.write("")
+        self.stdout.write(f"{'schema':<40} {'seconds':>9}  status")
+        for schema_name, duration, error in sorted(results, key=lambda result: -result[1]):
+            self.stdout.write(f"{schema_name:<40} {duration:>9.2f}  {'failed' if error else 'ok'}")
+        self.stdout.write(
+            f"{len(results) - len(failed)} migrated, {len(failed)} failed in {elapsed:.2f}s"
+        )
+
+        if failed:
+            raise CommandError(
+                f"{len(failed)} schemas failed; fix them and run `migrate_tenants --resume {run_id}`"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Run {run_id} complete"))
@@ -0,0 +1,61 @@
+"""
+Management command to maintain the tenant template schema and re-run tenant provisioning jobs.
+
+Usage:
+    python manage.py provision_tenants --template
+    python manage.py provision_tenants --retry [--batch <batch_id>] [--timeout 900]
+
+`--template` creates or migrates `TENANT_BASE_SCHEMA`; run it after `migrate_schemas` on deploy so the
+first registration does not pay for it. `--retry` runs the pending and failed `TenantProvisioningJob`s in
+this process, e.g. after a worker was restarted while jobs were queued. Jobs left `running` by a worker that died
+mid-clone are retried too, once they started more than `--timeout` seconds ago (default
+`TENANT_PROVISIONING_TIMEOUT`, settings); a clone runs in one transaction, so such a job left no schema behind.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils import timezone
+
+from users.models import TenantProvisioningJob
+from users.provisioning import ensure_template_schema, run_provisioning_job
+
+
+class Command(BaseCommand):
+    help = "Prepare the tenant template schema and re-run pending, failed or stalled provisioning jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--template", action="store_true")
+        parser.add_argument("--retry", action="store_true")
+        parser.add_argument("--batch")
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=getattr(settings, "TENANT_PROVISIONING_TIMEOUT", 900),
+            help="Seconds after which a running job is taken for a dead one and retried.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["template"] and not options["retry"]:
+            raise CommandError("Pass --template, --retry or both")
+
+        if options["template"]:
+            ensure_template_schema(verbosity=options["verbosity"])
+            self.stdout.write(self.style.SUCCESS("Tenant template schema is up to date"))
+
+        if options["retry"]:
+            stale = timezone.now() - datetime.timedelta(seconds=options["timeout"])
+            jobs = TenantProvisioningJob.objects.filter(
+                Q(status__in=[TenantProvisioningJob.PENDING, TenantProvisioningJob.FAILED])
+                | Q(status=TenantProvisioningJob.RUNNING, started_at__lt=stale)
+                | Q(status=TenantProvisioningJob.RUNNING, started_at__isnull=True)
+            ).order_by("created_at")
+            if options["batch"]:
+                jobs = jobs.filter(batch_id=options["batch"])
+
+            for job_id in jobs.values_list("pk", flat=True):
+                job = run_provisioning_job(job_id)
+                style = self.style.SUCCESS if job.status == job.SUCCEEDED else self.style.ERROR
+                self.stdout.write(style(f"{job.tenant.schema_name}: {job.status} {job.error}".rstrip()))
@@ -0,0 +1,45 @@
+"""
+This module defines HTTP middleware for resolving the tenant of an incoming request.
+
+Middleware:
+1. `CachedTenantMainMiddleware`:
+    - Inherits from `TenantMainMiddleware` provided by `django_tenants`.
+    - Overrides `get_tenant(domain_model, hostname)`:
+        - Looks the hostname up in `users.tenant_cache.tenant_cache` first.
+        - On a miss, falls back to the `Domain` lookup of the parent class and caches the result.
+    - Repeat requests to a known subdomain therefore reach the view without a database round-trip.
+
+2. `ReplicaRoutingMiddleware`:
+    - Wraps the request in `saas_admin.routers.request_routing`, which lets `TenantReplicaRouter` send the
+      request's tenant reads to a read replica until the request writes.
+
+Dependencies:
+- `TenantMainMiddleware` from `django_tenants.middleware.main` for schema selection and URL routing.
+- `tenant_cache` from `users.tenant_cache` for the in-process hostname cache.
+- `request_routing` from `saas_admin.routers` for read replica routing.
+"""
+
+import copy
+
+from django_tenants.middleware.main import TenantMainMiddleware
+from saas_admin.routers import request_routing
+from .tenant_cache import tenant_cache
+
+
+class CachedTenantMainMiddleware(TenantMainMiddleware):
+    def get_tenant(self, domain_model, hostname):
+        tenant = tenant_cache.get(hostname)
+        if tenant is None:
+            tenant = super().get_tenant(domain_model, hostname)
+            tenant_cache.set(hostname, tenant)
+            tenant = copy.copy(tenant)
+        return tenant
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with request_routing(request):
+            return self.get_response(request)
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_tenantprovisioningjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchemaMigration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('run_id', models.UUIDField(db_index=True)),
+                ('schema_name', models.CharField(max_length=63)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('duration', models.FloatField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'unique_together': {('run_id', 'schema_name')},
+            },
+        ),
+    ]
@@ -10,6 +10,7 @@ Models:
         - `registration_number`: Optional CharField with a maximum length of 255 characters. Represents the registration number of the tenant.
         - `created_at`: DateField that auto-fills with the current date when the tenant is created. Represents the creation date of the tenant.
         - `auto_create_schema`: Boolean field that is set to True, indicating that the schema for new tenants should be automatically created.
+          `TenantRegisterSerializer` turns it off per instance and creates the schema in a `TenantProvisioningJob` instead.
 
 2. `Domain`:
     - Inherits from `DomainMixin` to support multi-tenancy.
@@ -42,6 +43,28 @@ Models:
     - Methods:
         - `__str__()`: Returns a string representation of the user, including the email and tenant.
 
+5. `TenantProvisioningJob`:
+    - Tracks the creation of a tenant schema in the background (see `users.provisioning`).
+    - Fields:
+        - `id`: UUID primary key, returned to the client to poll the job status.
+        - `tenant`: ForeignKey to the `Tenant` whose schema is being created.
+        - `batch_id`: Optional UUID shared by the jobs of one batch registration.
+        - `status`: One of `pending`, `running`, `succeeded` or `failed`.
+        - `error`: The error message of a failed job.
+        - `created_at`, `started_at`, `finished_at`: DateTimeFields recording the job's progress.
+
+6. `SchemaMigration`:
+    - Records the progress of one schema in a `migrate_tenants` run, so an interrupted run can be resumed.
+    - Fields:
+        - `run_id`: UUID shared by all schemas of a run.
+        - `schema_name`: The migrated schema.
+        - `status`: One of `pending`, `succeeded` or `failed`.
+        - `duration`: FloatField with the seconds spent migrating the schema.
+        - `error`: The error message of a failed migration.
+        - `created_at`, `finished_at`: DateTimeFields recording when the schema was queued and finished.
+    - Meta:
+        - `unique_together`: A schema appears once per run.
+
 Dependencies:
 - `AbstractBaseUser`, `PermissionsMixin`, and `BaseUserManager` from `django.contrib.auth.models` for user management and authentication.
 - `models` from `django.db` for defining database models and fields.
@@ -51,6 +74,8 @@ Dependencies:
 This file provides the core models and user management functionality for a multi-tenant application, including tenant management, user creation, and permissions handling.
 """
 
+import uuid
+
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
@@ -112,5 +137,64 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
             "tenant",
         )  # Enforce uniqueness on the combination of email and tenant
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The loaded values, so clients.signals can tell claim changes without reading the row again
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
     def __str__(self):
         return f"{self.email} ({self.tenant})"
+
+
+class TenantProvisioningJob(models.Model):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    tenant = models.ForeignKey(
+        Tenant, on_delete=models.CASCADE, related_name="provisioning_jobs"
+    )
+    batch_id = models.UUIDField(blank=True, null=True, db_index=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"{self.tenant} ({self.status})"
+
+
+class SchemaMigration(models.Model):
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    run_id = models.UUIDField(db_index=True)
+    schema_name = models.CharField(max_length=63)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    duration = models.FloatField(blank=True, null=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        unique_together = ("run_id", "schema_name")
+
+    def __str__(self):
+        return f"{self.schema_name} ({self.status})"
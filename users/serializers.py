@@ -19,20 +19,48 @@ Serializers:
         - Raises `ValidationError` if a tenant with the same schema name already exists.
 
     - `create(validated_data)`:
-        - Creates a new `Tenant` instance with the provided validated data.
+        - Creates a new `Tenant` instance with the provided validated data, without creating its schema.
         - Creates a primary `Domain` instance associated with the newly created tenant.
         - Creates a new `CustomUser` instance for the tenant admin with the provided email, username (as first name), and password.
-        - Returns a dictionary containing the newly created tenant, domain, username, and user details.
+        - Creates a `TenantProvisioningJob` that clones the tenant schema in the background once the transaction commits
+          (see `users.provisioning`). Jobs of a batch share the `batch_id` passed in the serializer context.
+        - Returns a dictionary containing the newly created tenant, domain, username, user details and provisioning job.
+
+    - With `many=True` (batch registration) the list is validated by `TenantRegisterListSerializer`, which
+      rejects batches larger than `TENANT_BATCH_MAX_SIZE` and tenant names repeated within the batch.
+
+2. `TenantProvisioningJobSerializer`:
+    - Serializes the status of a `TenantProvisioningJob` along with the schema name of its tenant.
 
 Dependencies:
 - `serializers` from Django REST Framework for serializing and validating data.
-- `Tenant`, `Domain`, and `CustomUser` models for creating and managing tenant-related data.
+- `Tenant`, `Domain`, `CustomUser` and `TenantProvisioningJob` models for creating and managing tenant-related data.
+- `enqueue_provisioning` from `users.provisioning` for creating the tenant schema in the background.
 
 This serializer handles the complete registration process for new tenants, including tenant, domain, and user creation, and ensures data integrity and uniqueness.
 """
 
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
 from rest_framework import serializers
-from .models import Tenant, Domain, CustomUser
+from .models import Tenant, Domain, CustomUser, TenantProvisioningJob
+from .provisioning import enqueue_provisioning
+
+
+class TenantRegisterListSerializer(serializers.ListSerializer):
+    def validate(self, attrs):
+        if len(attrs) > getattr(settings, "TENANT_BATCH_MAX_SIZE", 100):
+            raise serializers.ValidationError("Too many tenants in one batch.")
+
+        usernames = [item["username"] for item in attrs]
+        duplicates = sorted({name for name in usernames if usernames.count(name) > 1})
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Tenant names repeated in the batch: {', '.join(duplicates)}."
+            )
+        return attrs
 
 
 class TenantRegisterSerializer(serializers.Serializer):
@@ -46,19 +74,24 @@ class TenantRegisterSerializer(serializers.Serializer):
     first_name = serializers.CharField(max_length=255)
     password = serializers.CharField(write_only=True)
 
+    class Meta:
+        list_serializer_class = TenantRegisterListSerializer
+
     def validate_username(self, value):
         if Tenant.objects.filter(schema_name=value).exists():
             raise serializers.ValidationError("Tenant name already taken.")
         return value
 
     def create(self, validated_data):
-        # Tenant creation
-        tenant = Tenant.objects.create(
+        # Tenant creation; the schema is cloned by the provisioning job below
+        tenant = Tenant(
             schema_name=validated_data["username"],
             address=validated_data.get("address"),
             registration_number=validated_data.get("registration_number"),
             name=validated_data["company_name"],
         )
+        tenant.auto_create_schema = False
+        tenant.save()
 
         # Domain creation
         full_domain = self.context["request"].get_host()
@@ -77,14 +110,38 @@ class TenantRegisterSerializer(serializers.Serializer):
             is_staff=True,
         )
 
+        # Schema provisioning
+        job = TenantProvisioningJob.objects.create(
+            tenant=tenant, batch_id=self.context.get("batch_id")
+        )
+        transaction.on_commit(partial(enqueue_provisioning, job.pk))
+
         return {
             "tenant": tenant,
             "domain": full_domain,
             "username": validated_data["username"],
             "user": user,
+            "job": job,
         }
 
 
+class TenantProvisioningJobSerializer(serializers.ModelSerializer):
+    schema_name = serializers.CharField(source="tenant.schema_name", read_only=True)
+
+    class Meta:
+        model = TenantProvisioningJob
+        fields = [
+            "id",
+            "schema_name",
+            "batch_id",
+            "status",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+
+
 # for super admin (saas login)
 from rest_framework import serializers
 from .models import CustomUser, Domain, Tenant
@@ -13,12 +13,22 @@ Dependencies:
 - `receiver` decorator from `django.dispatch` to connect the signal with the handler function.
 - `Tenant` and `Domain` models to interact with the database and create the default tenant and domain.
 
+2. `invalidate_tenant_cache_for_domain`:
+    - Connected to the `post_save` and `post_delete` signals of the `Domain` model.
+    - Drops every cached hostname of the domain's tenant from `users.tenant_cache.tenant_cache`,
+      so a renamed or removed domain stops resolving immediately in this process.
+
+3. `invalidate_tenant_cache_for_tenant`:
+    - Connected to the `post_save` and `post_delete` signals of the `Tenant` model.
+    - Drops every cached hostname of the tenant, so changes to the tenant are picked up on the next request.
+
 This setup ensures that a default tenant and domain are available after migrations, which is useful for setting up initial configurations or default data required for the application.
 """
 
-from django.db.models.signals import post_migrate
+from django.db.models.signals import post_migrate, post_save, post_delete
 from django.dispatch import receiver
 from .models import Tenant, Domain
+from .tenant_cache import tenant_cache
 
 # from search.documents import BlogDocument
 
@@ -34,3 +44,14 @@ def create_default_tenant(sender, **kwargs):
             domain="localhost", tenant=tenant, is_primary=True
         )
         domain.save()
+
+
+@receiver([post_save, post_delete], sender=Domain)
+def invalidate_tenant_cache_for_domain(sender, instance, **kwargs):
+    tenant_cache.invalidate_hostname(instance.domain)
+    tenant_cache.invalidate_tenant(instance.tenant_id)
+
+
+@receiver([post_save, post_delete], sender=Tenant)
+def invalidate_tenant_cache_for_tenant(sender, instance, **kwargs):
+    tenant_cache.invalidate_tenant(instance.pk)
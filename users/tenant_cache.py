@@ -0,0 +1,131 @@
+"""
+This module provides in-process LRU caches, including the one resolving tenants from request hostnames.
+
+Classes:
+1. `LRUCache`:
+    - A thread-safe LRU cache with a time-to-live for every entry.
+    - Methods:
+        - `get(key)`:
+            - Returns the cached value, or `None` when it is missing or expired.
+        - `set(key, value)`:
+            - Stores the value and evicts the least recently used entry when full.
+        - `invalidate(key)` / `invalidate_where(predicate)`:
+            - Drops a single key, or every entry whose value matches the predicate.
+        - `clear()`:
+            - Empties the cache and resets the counters.
+        - `stats()`:
+            - Returns the hit, miss and eviction counters along with the current size.
+
+2. `TenantCache`:
+    - Inherits from `LRUCache`.
+    - Maps a hostname (e.g. `apollo.example.com`) to the `Tenant` that owns the matching `Domain`.
+    - `get(hostname)` returns a copy of the cached `Tenant`, so per-request attributes never leak between requests.
+    - `invalidate_hostname(hostname)` and `invalidate_tenant(tenant_id)` drop one hostname, or every hostname of a tenant.
+
+Instances:
+- `tenant_cache`:
+    - The process-wide cache used by `users.middleware.CachedTenantMainMiddleware`.
+    - Sized by `TENANT_CACHE_MAXSIZE` and `TENANT_CACHE_TTL` (seconds) in the settings.
+
+Notes:
+- The cache lives in each worker process. `users.signals` invalidates it on `Tenant`/`Domain`
+  save and delete, and the TTL bounds how long other worker processes can serve a stale entry.
+
+Dependencies:
+- `settings` from `django.conf` for the cache size and TTL.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class LRUCache:
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        with self._lock:
+            stale = [
+                key for key, (value, _) in self._entries.items() if predicate(value)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class TenantCache(LRUCache):
+    def get(self, hostname):
+        tenant = super().get(hostname)
+        if tenant is None:
+            return None
+        # The middleware sets per-request attributes (e.g. `domain_url`) on the
+        # tenant, so every request gets its own shallow copy.
+        return copy.copy(tenant)
+
+    def invalidate_hostname(self, hostname):
+        self.invalidate(hostname)
+
+    def invalidate_tenant(self, tenant_id):
+        self.invalidate_where(lambda tenant: tenant.pk == tenant_id)
+
+
+tenant_cache = TenantCache(
+    maxsize=getattr(settings, "TENANT_CACHE_MAXSIZE", 1024),
+    ttl=getattr(settings, "TENANT_CACHE_TTL", 300),
+)
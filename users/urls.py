@@ -16,15 +16,19 @@ URL Patterns:
     - Endpoint for checking the existence of a tenant.
     - Uses the `GET` method to verify if a tenant with a specified username exists.
 
-4. `swagger(?P<format>\.json|\.yaml)`:
+4. `tenant/jobs/<job_id>` and `tenant/batch`:
+    - Routed to the `TenantProvisioningStatusView` and `TenantBatchRegister` views.
+    - Report the status of background tenant provisioning and register many tenants at once.
+
+5. `swagger(?P<format>\.json|\.yaml)`:
     - Routed to the DRF schema view for API documentation in JSON or YAML format.
     - Provides the OpenAPI schema without UI for integration with external tools.
 
-5. `docs/`:
+6. `docs/`:
     - Routed to the DRF schema view with Swagger UI.
     - Provides interactive API documentation with Swagger UI.
 
-6. `redoc/`:
+7. `redoc/`:
     - Routed to the DRF schema view with ReDoc UI.
     - Provides interactive API documentation with ReDoc UI.
 
@@ -113,11 +117,15 @@ urlpatterns = [
     path('users', CustomUserListView.as_view(), name='custom-user-list'),
     path('domains', DomainListView.as_view(), name='domain-list'),
     path('tenants', TenantListView.as_view(), name='tenant-list'),
+    path('tenant-cache/stats', TenantCacheStatsView.as_view(), name='tenant-cache-stats'),
+    path('db/stats', ConnectionStatsView.as_view(), name='db-connection-stats'),
 
 
 
     path("tenant", TenantRegister.as_view(), name="tenant-register"),
     path("check-tenant", CheckTenant.as_view(), name="check-tenant"),
+    path("tenant/batch", TenantBatchRegister.as_view(), name="tenant-batch-register"),
+    path("tenant/jobs/<uuid:job_id>", TenantProvisioningStatusView.as_view(), name="tenant-provisioning-status"),
     re_path(r"^swagger(?P<format>\.json|\.yaml)$",schema_view.without_ui(cache_timeout=0),name="schema-json"),
     path("docs/",schema_view.with_ui("swagger", cache_timeout=0),name="schema-swagger-ui"),
     path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
@@ -25,6 +25,16 @@ Views:
     - Retrieves the `username` from query parameters to check the presence of a tenant with that schema name.
     - Logs the check attempt and returns a JSON response indicating whether the tenant exists or not.
 
+4. `TenantProvisioningStatusView`:
+    - Handles HTTP GET requests for the status of the background job creating a tenant's schema.
+    - `TenantRegister` returns the job id; the tenant is ready once the status is `succeeded`.
+
+5. `TenantBatchRegister`:
+    - Restricted to global superadmins.
+    - Method: `POST`: registers a list of tenants (same fields as `TenantRegister`) in one transaction and
+      starts one provisioning job per tenant, all sharing a `batch_id`.
+    - Method: `GET`: returns the jobs of a batch (`batch_id`) and how many are in each status.
+
 Logging:
 - Logs are configured to track the flow of tenant registration and existence checks, including errors.
 
@@ -32,11 +42,16 @@ Dependencies:
 - Django's `JsonResponse` for public view responses.
 - Django REST Framework's `APIView`, `Response`, and `status` for API views.
 - `TenantRegisterSerializer` for serializing and validating tenant data.
+- `TenantProvisioningJobSerializer` and `TenantProvisioningJob` for the provisioning job status.
 - `Tenant` model to query and check tenant existence.
 - Python's `logging` module for logging information and errors.
 """
 
+import uuid
+from collections import Counter
+
 from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from .models import Tenant
 import logging
@@ -47,12 +62,15 @@ from search.documents import BlogDocument
 # for the super admin (saas login)
 from rest_framework import generics, status
 from rest_framework.response import Response
-from .models import CustomUser, Domain, Tenant
-from .serializers import CustomUserSerializer, DomainSerializer, TenantSerializer, TenantRegisterSerializer
+from .models import CustomUser, Domain, Tenant, TenantProvisioningJob
+from .serializers import CustomUserSerializer, DomainSerializer, TenantSerializer, TenantRegisterSerializer, TenantProvisioningJobSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework.exceptions import AuthenticationFailed
 from .permissions import IsGlobalSuperAdmin
+from .tenant_cache import tenant_cache
+from saas_admin.postgresql_backend.base import get_pool_stats
+from saas_admin.routers import get_replica_lags
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -85,6 +103,22 @@ class CustomUserListView(generics.ListCreateAPIView):
     queryset = CustomUser.objects.all()
     serializer_class = CustomUserSerializer
     permission_classes = [IsGlobalSuperAdmin]
+
+
+class TenantCacheStatsView(APIView):
+    permission_classes = [IsGlobalSuperAdmin]
+
+    def get(self, request):
+        return Response({"data": tenant_cache.stats()}, status=status.HTTP_200_OK)
+
+
+class ConnectionStatsView(APIView):
+    permission_classes = [IsGlobalSuperAdmin]
+
+    def get(self, request):
+        data = get_pool_stats()
+        data["replica_lag_seconds"] = get_replica_lags()
+        return Response({"data": data}, status=status.HTTP_200_OK)
 # for the super admin (saas login) end
 
 
@@ -126,6 +160,10 @@ class TenantRegister(APIView):
                     "email": data["user"].email,
                     "username": data["user"].username,
                 },
+                "provisioning": {
+                    "job_id": str(data["job"].pk),
+                    "status": data["job"].status,
+                },
             }
             # create_index_for_tenant(data["username"])
             return Response(response_data, status=status.HTTP_201_CREATED)
@@ -141,3 +179,47 @@ class CheckTenant(APIView):
             return Response({"msg": True}, status=status.HTTP_200_OK)
 
         return Response({"msg": False}, status=status.HTTP_404_NOT_FOUND)
+
+
+class TenantProvisioningStatusView(APIView):
+    def get(self, request, job_id):
+        job = get_object_or_404(
+            TenantProvisioningJob.objects.select_related("tenant"), pk=job_id
+        )
+        serializer = TenantProvisioningJobSerializer(job)
+        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+
+
+class TenantBatchRegister(APIView):
+    permission_classes = [IsGlobalSuperAdmin]
+
+    def post(self, request):
+        batch_id = uuid.uuid4()
+        logger.info(f"Registering a batch of tenants {batch_id}")
+        serializer = TenantRegisterSerializer(
+            data=request.data,
+            many=True,
+            context={"request": request, "batch_id": batch_id},
+        )
+        if not serializer.is_valid():
+            logger.error("Batch tenant registration failed validation")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        created = serializer.save()
+        jobs = TenantProvisioningJobSerializer([data["job"] for data in created], many=True)
+        return Response(
+            {"msg": f"{len(created)} tenants registered", "batch_id": str(batch_id), "data": jobs.data},
+            status=status.HTTP_201_CREATED,
+        )
+
+    def get(self, request):
+        batch_id = request.query_params.get("batch_id")
+        try:
+            batch_id = uuid.UUID(str(batch_id))
+        except ValueError:
+            return Response({"msg": "A valid batch_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        jobs = TenantProvisioningJob.objects.select_related("tenant").filter(batch_id=batch_id)
+        serializer = TenantProvisioningJobSerializer(jobs, many=True)
+        summary = Counter(job["status"] for job in serializer.data)
+        return Response({"summary": summary, "data": serializer.data}, status=status.HTTP_200_OK)